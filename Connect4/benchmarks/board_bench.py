@@ -0,0 +1,75 @@
+"""
+File Name: board_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Compares the numpy Board with the BitBoard. Counts the nodes per
+second of a full tree walk (copy, drop, win check at every node),
+the speed of winning_move on its own and the time MiniMaxBot needs
+for a move on each board.
+
+Run with "python -m benchmarks.board_bench" from the Connect4 folder.
+"""
+import argparse
+import time
+from board import Board, BitBoard
+from bots import MiniMaxBot
+from benchmarks.common import random_positions, ratio, timed
+
+"""
+function name: perft
+precondition: board and depth
+postcondition: returns the amount of nodes visited
+
+Description:
+Walks every move sequence up to the depth, the same way the bots
+walk the tree: copy the board, drop a piece and check for a win.
+"""
+def perft(board, depth):
+    if depth == 0:
+        return 1
+    nodes = 1
+    for col in board.get_valid_locations():
+        child = board.copy_board()
+        child.drop_piece(col, child.CURR_PLAYER)
+        if child.winning_move(child.PREV_PLAYER):
+            nodes += 1
+        else:
+            nodes += perft(child, depth - 1)
+    return nodes
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', help='amount of test positions', type=int, default=8)
+    parser.add_argument('--depth', help='depth of the tree walk and of the minimax search', type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    for board_cls in (Board, BitBoard):
+        positions = random_positions(board_cls, args.positions, 10)
+
+        start = time.perf_counter()
+        nodes = sum(perft(p, args.depth) for p in positions)
+        walk = time.perf_counter() - start
+
+        calls, duration = timed(lambda: [p.winning_move(p.CURR_PLAYER) for p in positions])
+        win_checks = calls * len(positions) / duration
+
+        start = time.perf_counter()
+        for p in positions:
+            MiniMaxBot(p.CURR_PLAYER, depth=args.depth).get_move(p)
+        minimax = (time.perf_counter() - start) / len(positions)
+
+        results[board_cls.__name__] = nodes / walk if walk else 0
+        print(board_cls.__name__)
+        print("  tree walk:    %10.0f nodes/sec" % results[board_cls.__name__])
+        print("  winning_move: %10.0f calls/sec" % win_checks)
+        print("  minimax:      %10.4f sec/move (depth %d)" % (minimax, args.depth))
+
+    print("\nBitBoard speedup: %s nodes/sec" % ratio(results['BitBoard'], results['Board']))
+
+if __name__ == '__main__':
+    main()
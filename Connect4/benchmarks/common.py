@@ -0,0 +1,74 @@
+"""
+File Name: common.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Helpers shared by the benchmark scripts. The scripts are run from the
+Connect4 folder, for example "python -m benchmarks.board_bench".
+"""
+import random
+import time
+
+"""
+function name: random_position
+precondition: board class, amount of moves, random generator, optional (rows, columns, connect)
+postcondition: returns a board with the moves played
+
+Description:
+Plays random moves that do not end the game, so the returned board
+is always a position that can still be searched.
+"""
+def random_position(board_cls, moves, rng, size=()):
+    while True:
+        board = board_cls(board_cls.PLAYER1_PIECE, *size)
+        for _ in range(moves):
+            col = rng.choice(board.get_valid_locations())
+            board.drop_piece(col, board.CURR_PLAYER)
+            if board.winning_move(board.PREV_PLAYER):
+                break
+        else:
+            return board
+
+"""
+function name: random_positions
+precondition: board class, amount of positions, amount of moves, seed, optional size
+postcondition: returns a list of boards
+
+Description:
+Builds a fixed set of test positions, the same seed always gives the
+same positions for every board class.
+"""
+def random_positions(board_cls, count, moves, seed=0, size=()):
+    rng = random.Random(seed)
+    return [random_position(board_cls, moves, rng, size) for _ in range(count)]
+
+"""
+function name: ratio
+precondition: numerator, denominator, optional format
+postcondition: returns the formatted ratio, '-' when the denominator is 0
+"""
+def ratio(numerator, denominator, fmt='%.1fx'):
+    if not denominator:
+        return '-'
+    return fmt % (numerator / denominator)
+
+"""
+function name: timed
+precondition: function to time
+postcondition: returns the amount of calls and the seconds they took
+
+Description:
+Calls the function until at least min_time seconds have passed.
+"""
+def timed(function, min_time=1.0):
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        calls += 1
+        duration = time.perf_counter() - start
+        if duration >= min_time:
+            return calls, duration
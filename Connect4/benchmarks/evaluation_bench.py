@@ -0,0 +1,47 @@
+"""
+File Name: evaluation_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Times a full rescan of Evaluation.score_position against an incremental
+update and against numpy batches of 1, 7, 49 and 343 boards. That the
+three give the same scores is checked by tests/test_evaluation.py.
+
+Run with "python -m benchmarks.evaluation_bench" from the Connect4 folder.
+"""
+import numpy as np
+from board import Board
+from bots.evaluation import Evaluation, IncrementalEvaluation, VectorEvaluation
+from benchmarks.common import random_positions, ratio, timed
+
+def main():
+    positions = random_positions(Board, 20, 12)
+    full = Evaluation(Board.PLAYER1_PIECE)
+    calls, duration = timed(lambda: [full.score_position(p) for p in positions])
+    rescan = calls * len(positions) / duration
+    print("score_position:          %10.0f evals/sec" % rescan)
+
+    incremental = IncrementalEvaluation(Board.PLAYER1_PIECE)
+    incremental.reset(positions[0])
+    cells = [(r, 3) for r in range(Board.ROW_COUNT)]
+    def update():
+        for r, c in cells:
+            incremental.add_piece(r, c, Board.PLAYER2_PIECE)
+            incremental.total
+            incremental.remove_piece(r, c, Board.PLAYER2_PIECE)
+    calls, duration = timed(update)
+    updates = calls * len(cells) / duration
+    print("incremental add/remove:  %10.0f evals/sec (%s)" % (updates, ratio(updates, rescan, '%.0fx')))
+
+    vector = VectorEvaluation(Board.PLAYER1_PIECE)
+    grids = np.stack([p.get_board() for p in random_positions(Board, 343, 12, seed=1)])
+    for size in (1, 7, 49, 343):
+        batch = grids[:size]
+        calls, duration = timed(lambda: vector.score_batch(batch, positions[0]))
+        print("numpy batch of %3d:      %10.0f evals/sec (%.1f us/board)" % (size, calls * size / duration, 1e6 * duration / (calls * size)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+File Name: idle_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Measures the CPU the UI uses while it waits for a click, with the SDL
+dummy video driver. Every screen is left alone for a few seconds and
+the process time is divided by the wall time:
+1. the main menu as a busy loop, the way it was before
+2. the main menu on the event loop
+3. a human move as a busy loop, the way it was before
+4. Human.get_move on the event loop
+
+Run with "python -m benchmarks.idle_bench" from the Connect4 folder.
+"""
+import argparse
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
+import pygame
+import game
+from board import Board
+from bots import Human
+
+"""
+function name: cpu_share
+precondition: function that waits, seconds it waits
+postcondition: returns the process time over the wall time
+"""
+def cpu_share(function, seconds):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    function(seconds)
+    return (time.process_time() - cpu) / (time.perf_counter() - wall)
+
+"""
+function name: busy_menu
+precondition: graphic board, buttons, seconds
+postcondition: none
+
+Description:
+The menu loop before the event loop, stopped after the given time
+"""
+def busy_menu(graphics_board, button_list, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        graphics_board.write_on_board("CONNECT 4", graphics_board.BLUE, 350, 100, 60, True)
+        graphics_board.write_on_board("CHOOSE ONE OF THE OPTIONS TO PLAY", graphics_board.YELLOW, 350, 175, 30, True)
+        for event in pygame.event.get():
+            pass
+        for button in button_list:
+            graphics_board.draw_button(button, graphics_board.screen)
+        pygame.display.update()
+
+"""
+function name: busy_human
+precondition: graphic board, seconds
+postcondition: none
+
+Description:
+The human move loop before the event loop, stopped after the given time
+"""
+def busy_human(gb, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for event in pygame.event.get():
+            gb.update_gboard([(0, 0, gb.width, gb.SQUARESIZE)])
+
+"""
+function name: event_menu
+precondition: graphic board, buttons, seconds
+postcondition: none
+
+Description:
+A timer event stops the menu after the given time
+"""
+def event_menu(graphics_board, button_list, seconds):
+    loop = game.menu_loop(graphics_board, "CONNECT 4", graphics_board.BLUE, "CHOOSE ONE OF THE OPTIONS TO PLAY", button_list)
+    loop.on(pygame.USEREVENT, lambda event: loop.stop())
+    pygame.time.set_timer(pygame.USEREVENT, int(seconds * 1000), 1)
+    loop.run()
+
+"""
+function name: event_human
+precondition: seconds
+postcondition: none
+
+Description:
+A timer clicks the first column after the given time
+"""
+def event_human(seconds):
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos = (50, 50), button = 1)
+    pygame.time.set_timer(click, int(seconds * 1000), 1)
+    Human(Board.PLAYER1_PIECE).get_move(Board(Board.PLAYER1_PIECE))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', help='seconds every screen waits (default 3)', type=float, default=3.0)
+    args = parser.parse_args()
+
+    game.load_ui()
+    graphics_board = game.GBoard(Board(1))
+    button_list = [graphics_board.create_button(60, 220 + 60 * i, 300, 40, label, None)
+                   for i, label in enumerate(('1. PLAYER VS PLAYER', '2. PLAYER VS BOT', '3. BOT VS BOT'))]
+
+    results = (
+        ('menu, busy loop', cpu_share(lambda s: busy_menu(graphics_board, button_list, s), args.seconds)),
+        ('menu, event loop', cpu_share(lambda s: event_menu(graphics_board, button_list, s), args.seconds)),
+        ('human move, busy loop', cpu_share(lambda s: busy_human(graphics_board, s), args.seconds)),
+        ('human move, event loop', cpu_share(event_human, args.seconds)),
+    )
+    print("%-26s %10s" % ('screen', 'idle CPU'))
+    for name, share in results:
+        print("%-26s %9.1f%%" % (name, 100 * share))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+File Name: mcts_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Grows a Monte Carlo tree from the empty board for a fixed amount of
+iterations and prints the node count, the peak memory (traced with
+tracemalloc) and the bytes used per node.
+
+Run with "python -m benchmarks.mcts_bench" from the Connect4 folder.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from board import Board
+from bots import MonteCarloBot
+
+"""
+function name: grow_tree
+precondition: amount of iterations
+postcondition: returns nodes, peak bytes and seconds
+
+Description:
+Runs one search without a timeout and measures the memory it needed
+"""
+def grow_tree(iterations):
+    bot = MonteCarloBot(Board.PLAYER1_PIECE)
+    board = Board(Board.PLAYER1_PIECE)
+    tracemalloc.start()
+    start = time.perf_counter()
+    rootnode, col = bot.montecarlo_tree_search(board, iterations, None, timeout = sys.float_info.max)
+    duration = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return bot.tree_size(rootnode), peak, duration
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', help='iterations to grow the tree for', type=int, nargs='+', default=[2000, 20000])
+    args = parser.parse_args()
+
+    print("%10s %10s %12s %12s %10s" % ('iterations', 'nodes', 'peak MB', 'bytes/node', 'seconds'))
+    for iterations in args.iterations:
+        nodes, peak, duration = grow_tree(iterations)
+        print("%10d %10d %12.1f %12.0f %10.1f" % (iterations, nodes, peak / 2**20, peak / nodes, duration))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+File Name: ordering_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Searches the same positions to the same depth with different move
+ordering settings and prints the nodes visited and cutoffs of each,
+so the drop in nodes from every heuristic can be seen.
+
+Run with "python -m benchmarks.ordering_bench" from the Connect4 folder.
+"""
+import argparse
+import time
+from board import BitBoard
+from bots import MiniMaxBot
+from bots.ordering import MoveOrdering
+from benchmarks.common import random_positions, ratio
+
+SETTINGS = [
+    ('column order', dict(center=False, killers=False, history=False, tt_move=False)),
+    ('tt move', dict(center=False, killers=False, history=False, tt_move=True)),
+    ('center', dict(center=True, killers=False, history=False, tt_move=False)),
+    ('center + killers', dict(center=True, killers=True, history=False, tt_move=False)),
+    ('center + killers + history', dict(center=True, killers=True, history=True, tt_move=False)),
+    ('all', dict(center=True, killers=True, history=True, tt_move=True)),
+]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', help='amount of test positions', type=int, default=6)
+    parser.add_argument('--depth', help='search depth', type=int, default=5)
+    args = parser.parse_args()
+
+    positions = random_positions(BitBoard, args.positions, 8)
+    baseline = None
+    print("%-28s %10s %10s %8s %9s" % ('ordering', 'nodes', 'cutoffs', 'seconds', 'vs plain'))
+    for name, options in SETTINGS:
+        nodes = cutoffs = 0
+        start = time.perf_counter()
+        for p in positions:
+            # a fresh bot per position, so the table only helps inside one search
+            bot = MiniMaxBot(p.CURR_PLAYER, depth=args.depth, ordering=MoveOrdering(**options))
+            bot.get_move(p)
+            nodes += bot.nodes
+            cutoffs += bot.cutoffs
+        duration = time.perf_counter() - start
+        if baseline is None:
+            baseline = nodes
+        print("%-28s %10d %10d %8.2f %9s" % (name, nodes, cutoffs, duration, ratio(100 * nodes, baseline, '%.0f%%')))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+File Name: ponder_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Measures what pondering gives a bot. On every test position the bot
+moves, then the opponent takes a while to answer. One copy of the bot
+ponders while the opponent thinks and one does not, and both are timed
+on their next move:
+1. MiniMaxBot with a fixed depth, time of the next move and nodes reused
+2. MonteCarloBot with a fixed amount of iterations, playouts reused.
+   Its move does not get faster, the reused playouts are added to the
+   ones it runs itself, so the move is chosen from a bigger tree.
+
+Run with "python -m benchmarks.ponder_bench" from the Connect4 folder.
+"""
+import argparse
+import random
+import sys
+import time
+from board import Board
+from bots import MiniMaxBot, MonteCarloBot
+from benchmarks.common import random_positions, ratio
+
+"""
+function name: next_move
+precondition: bot, position, seconds the opponent thinks, if the bot ponders
+postcondition: returns (seconds of the bot's next move, work reused from pondering)
+
+Description:
+The opponent answers with a random column, so its move is not always
+the one the bot expected
+"""
+def next_move(bot, position, wait, ponder):
+    board = position.copy_board()
+    col = bot.get_move(board)
+    board.drop_piece(col, board.CURR_PLAYER)
+    if board.winning_move(board.PREV_PLAYER) or board.check_draw():
+        return None
+    if ponder:
+        bot.start_pondering(board)
+    time.sleep(wait)
+    board.drop_piece(random.choice(board.get_valid_locations()), board.CURR_PLAYER)
+    if board.winning_move(board.PREV_PLAYER) or board.check_draw():
+        bot.stop_pondering()
+        return None
+    start = time.perf_counter()
+    bot.get_move(board)
+    return time.perf_counter() - start, bot.pondered
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', help='amount of test positions (default 6)', type=int, default=6)
+    parser.add_argument('--wait', help='seconds the opponent thinks (default 2)', type=float, default=2.0)
+    parser.add_argument('--depth', help='minimax depth (default 6)', type=int, default=6)
+    parser.add_argument('--iterations', help='monte carlo iterations per move (default 3000)', type=int, default=3000)
+    args = parser.parse_args()
+
+    bots = (
+        ('minimax depth %d' % args.depth, 'nodes', lambda piece: MiniMaxBot(piece, depth=args.depth)),
+        ('montecarlo %d iterations' % args.iterations, 'playouts',
+         lambda piece: MonteCarloBot(piece, max_iterations=args.iterations, timeout=sys.float_info.max)),
+    )
+    print("%-28s %12s %12s %16s" % ('bot', 'idle s/move', 'ponder s/move', 'reused'))
+    for name, unit, make in bots:
+        idle = pondering = reused = 0
+        count = 0
+        for i, position in enumerate(random_positions(Board, args.positions, 8)):
+            random.seed(i)
+            without = next_move(make(position.CURR_PLAYER), position, args.wait, False)
+            random.seed(i)
+            bot = make(position.CURR_PLAYER)
+            ponder = next_move(bot, position, args.wait, True)
+            if without is None or ponder is None:
+                continue
+            idle += without[0]
+            pondering += ponder[0]
+            reused += ponder[1]
+            count += 1
+        print("%-28s %12s %12s %16s" % (name, ratio(idle, count, '%.3f'), ratio(pondering, count, '%.3f'),
+              ratio(reused, count, '%%d %s' % unit)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+File Name: render_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Measures the frame time of the UI without a window, with the SDL dummy
+video driver:
+1. drawing the board the way it was drawn before (every slot as a rect
+   and a circle, then every piece, then a full display update)
+2. draw_gboard after one move, which only draws the slot that changed
+3. writing a menu line with write_on_board, with and without the text cache
+
+Run with "python -m benchmarks.render_bench" from the Connect4 folder.
+"""
+import argparse
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
+import pygame
+from board import Board
+from board.graphics import GBoard
+from benchmarks.common import random_positions
+
+"""
+function name: redraw_everything
+precondition: graphics board, board
+postcondition: the whole board is drawn
+
+Description:
+The drawing draw_gboard did before the background and dirty slots
+"""
+def redraw_everything(gb, board):
+    for c in range(board.COLUMN_COUNT):
+        for r in range(board.ROW_COUNT):
+            pygame.draw.rect(gb.screen, gb.BLUE, (c*gb.SQUARESIZE, r*gb.SQUARESIZE+gb.SQUARESIZE, gb.SQUARESIZE, gb.SQUARESIZE))
+            pygame.draw.circle(gb.screen, gb.BLACK, (int(c*gb.SQUARESIZE+gb.SQUARESIZE/2), int(r*gb.SQUARESIZE+gb.SQUARESIZE+gb.SQUARESIZE/2)), gb.RADIUS)
+    for c in range(board.COLUMN_COUNT):
+        for r in range(board.ROW_COUNT):
+            if board.get_row_col(r, c) == 1:
+                pygame.draw.circle(gb.screen, gb.RED, (int(c*gb.SQUARESIZE+gb.SQUARESIZE/2), gb.height-int(r*gb.SQUARESIZE+gb.SQUARESIZE/2)), gb.RADIUS)
+            elif board.get_row_col(r, c) == 2:
+                pygame.draw.circle(gb.screen, gb.YELLOW, (int(c*gb.SQUARESIZE+gb.SQUARESIZE/2), gb.height-int(r*gb.SQUARESIZE+gb.SQUARESIZE/2)), gb.RADIUS)
+    pygame.display.update()
+
+"""
+function name: per_frame
+precondition: function that draws one frame, amount of frames
+postcondition: returns the milliseconds per frame
+"""
+def per_frame(function, frames):
+    start = time.perf_counter()
+    for i in range(frames):
+        function(i)
+    return 1000 * (time.perf_counter() - start) / frames
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', help='frames per measurement (default 500)', type=int, default=500)
+    args = parser.parse_args()
+
+    boards = random_positions(Board, 16, 20)
+    gb = GBoard(boards[0])
+
+    before = per_frame(lambda i: redraw_everything(gb, boards[i % len(boards)]), args.frames)
+
+    # every frame is one move ahead of the last one, like a game
+    def one_move(i):
+        board = boards[i % len(boards)]
+        if i % len(boards) == 0:
+            gb.invalidate()
+        board.drop_piece(board.get_valid_locations()[0], board.CURR_PLAYER)
+        gb.draw_gboard(board)
+        board.undo_move()
+        gb.draw_gboard(board)
+    after = per_frame(one_move, args.frames) / 2
+
+    def uncached(i):
+        GBoard.texts.clear()
+        GBoard.fonts.clear()
+        gb.write_on_board("CHOOSE ONE OF THE OPTIONS TO PLAY", gb.YELLOW, 350, 175, 30, True)
+    text_before = per_frame(uncached, max(args.frames // 10, 1))
+    text_after = per_frame(lambda i: gb.write_on_board("CHOOSE ONE OF THE OPTIONS TO PLAY", gb.YELLOW, 350, 175, 30, True), args.frames)
+
+    print("%-36s %10s" % ('frame', 'ms/frame'))
+    print("%-36s %10.3f" % ('board, every slot redrawn', before))
+    print("%-36s %10.3f" % ('board, changed slot only', after))
+    print("%-36s %10.3f" % ('menu text, font made every call', text_before))
+    print("%-36s %10.3f" % ('menu text, cached', text_after))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+File Name: scaling_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Shows how the cost of the board functions and the bots grows with the
+size of the board and the length of a winning line. For every variant:
+1. winning_move on the numpy Board and on the BitBoard
+2. score_position with the python loops and with numpy
+3. random playouts, one at a time and as a numpy batch (games on boards
+   with more than 64 bits are played one at a time)
+4. a MiniMaxBot move to a fixed depth
+
+Run with "python -m benchmarks.scaling_bench" from the Connect4 folder,
+variants are given as rows x columns x connect, for example 7x9x4.
+"""
+import argparse
+import time
+from board import Board, BitBoard
+from bots import MiniMaxBot
+from bots.evaluation import Evaluation, VectorEvaluation
+from bots.rollout import RolloutEngine
+from benchmarks.common import random_positions, timed
+
+"""
+function name: variant
+precondition: string rows x columns x connect
+postcondition: returns (rows, columns, connect)
+"""
+def variant(text):
+    rows, columns, connect = (int(part) for part in text.lower().split('x'))
+    return rows, columns, connect
+
+"""
+function name: per_call
+precondition: function called on every position, positions, seconds per measurement
+postcondition: returns the microseconds per call
+"""
+def per_call(function, positions, min_time):
+    calls, duration = timed(lambda: [function(p) for p in positions], min_time)
+    return 1e6 * duration / (calls * len(positions))
+
+"""
+function name: measure
+precondition: size, amount of positions, seconds per measurement, minimax depth
+postcondition: returns the measurements of the variant
+
+Description:
+The positions are a quarter full, so both players have pieces on every part of the board
+"""
+def measure(size, count, min_time, depth):
+    rows, columns, connect = size
+    moves = rows * columns // 4
+    boards = random_positions(Board, count, moves, size=size)
+    bitboards = random_positions(BitBoard, count, moves, size=size)
+    evaluation = Evaluation(Board.PLAYER1_PIECE)
+    vector = VectorEvaluation(Board.PLAYER1_PIECE)
+    engine = RolloutEngine(0)
+
+    rollouts, duration = timed(lambda: [engine.rollout(p) for p in bitboards], min_time)
+    batches, batch_duration = timed(lambda: [engine.rollout_batch(p, 64) for p in bitboards], min_time)
+
+    start = time.perf_counter()
+    for p in boards:
+        MiniMaxBot(p.CURR_PLAYER, depth=depth).get_move(p)
+    minimax = (time.perf_counter() - start) / len(boards)
+
+    return {
+        'bits': columns * (rows + 1),
+        'lines': len(boards[0].LINES),
+        'board_win_us': per_call(lambda p: p.winning_move(Board.PLAYER1_PIECE), boards, min_time),
+        'bitboard_win_us': per_call(lambda p: p.winning_move(Board.PLAYER1_PIECE), bitboards, min_time),
+        'score_us': per_call(evaluation.score_position, boards, min_time),
+        'vector_score_us': per_call(vector.score_position, boards, min_time),
+        'playouts': rollouts * len(bitboards) / duration,
+        'batch_playouts': batches * len(bitboards) * 64 / batch_duration,
+        'minimax_sec': minimax,
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--variants', help='rows x columns x connect (default 6x7x4 7x8x4 7x9x4 6x7x5 10x10x5 12x16x6)',
+                        type=variant, nargs='+', default=[(6, 7, 4), (7, 8, 4), (7, 9, 4), (6, 7, 5), (10, 10, 5), (12, 16, 6)])
+    parser.add_argument('--positions', help='amount of test positions (default 8)', type=int, default=8)
+    parser.add_argument('--min-time', help='seconds per measurement (default 0.5)', type=float, default=0.5)
+    parser.add_argument('--depth', help='minimax depth (default 3)', type=int, default=3)
+    args = parser.parse_args()
+
+    print("%-9s %5s %6s %11s %11s %10s %10s %11s %11s %10s" % ('variant', 'bits', 'lines', 'win us', 'bit win us',
+          'score us', 'numpy us', 'playouts/s', 'batch p/s', 'minimax s'))
+    for size in args.variants:
+        m = measure(size, args.positions, args.min_time, args.depth)
+        print("%-9s %5d %6d %11.2f %11.2f %10.1f %10.1f %11.0f %11.0f %10.3f" % ('%dx%dx%d' % size, m['bits'], m['lines'],
+              m['board_win_us'], m['bitboard_win_us'], m['score_us'], m['vector_score_us'], m['playouts'], m['batch_playouts'], m['minimax_sec']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+File Name: selection_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Times one selection step on nodes with 7 visited children: the old
+sort with numpy sqrt and log on scalars against the single pass
+policies, and checks the old sort and UCTPolicy pick the same child.
+
+Run with "python -m benchmarks.selection_bench" from the Connect4 folder.
+"""
+import random
+import numpy as np
+from board import BitBoard
+from bots.montecarlo import Node
+from bots.selection import UCTPolicy, ProgressiveBiasPolicy
+from benchmarks.common import ratio, timed
+
+"""
+function name: sort_selection
+precondition: node
+postcondition: returns the child with the largest UCT value
+
+Description:
+The selection Node used before the selection policies
+"""
+def sort_selection(node):
+    uct_val = lambda x: x.wins / x.visits + np.sqrt(2 * np.log(node.visits) / x.visits)
+    return sorted(node.children, key = uct_val)[-1]
+
+"""
+function name: random_node
+precondition: random generator
+postcondition: returns a node with 7 children with random statistics
+
+Description:
+The wins and visits look like the ones of a tree in the middle of a search
+"""
+def random_node(rng):
+    board = BitBoard(BitBoard.PLAYER1_PIECE)
+    node = Node(piece = board.PREV_PLAYER, board = board)
+    for col in range(board.COLUMN_COUNT):
+        child = Node(piece = board.CURR_PLAYER, board = board, parent = node, move = col)
+        child.visits = rng.randint(1, 5000)
+        child.wins = rng.randint(0, child.visits * 2) / 2
+        node.children.append(child)
+        node.visits += child.visits
+    return node
+
+def main():
+    rng = random.Random(0)
+    nodes = [random_node(rng) for _ in range(200)]
+
+    uct = UCTPolicy()
+    assert all(sort_selection(node) is uct.select(node) for node in nodes)
+
+    calls, duration = timed(lambda: [sort_selection(node) for node in nodes])
+    baseline = 1e6 * duration / (calls * len(nodes))
+    print("sort with numpy:   %6.2f us/selection" % baseline)
+    for name, policy in (('UCTPolicy', uct), ('ProgressiveBias', ProgressiveBiasPolicy())):
+        calls, duration = timed(lambda: [policy.select(node) for node in nodes])
+        cost = 1e6 * duration / (calls * len(nodes))
+        print("%-17s  %6.2f us/selection (%s)" % (name + ':', cost, ratio(baseline, cost)))
+
+if __name__ == '__main__':
+    main()
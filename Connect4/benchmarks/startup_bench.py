@@ -0,0 +1,104 @@
+"""
+File Name: startup_bench.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Measures how long a headless start takes and checks it never loads pygame:
+1. importing the engine packages (board, bots) in a new interpreter
+2. a full "game.py --ui false" bot vs bot game from the command line
+3. starting a spawned worker process that imports the bots
+
+Exits with 1 if one of them imported pygame.
+
+Run with "python -m benchmarks.startup_bench" from the Connect4 folder.
+"""
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+CHECK = "import sys\n%s\nsys.stderr.write('pygame loaded: %%s' %% ('pygame' in sys.modules))"
+
+"""
+function name: run_python
+precondition: code to run, repeats
+postcondition: returns (mean seconds, if pygame was loaded)
+
+Description:
+Runs the code in a new interpreter, it reports on stderr whether pygame
+was imported
+"""
+def run_python(code, repeats):
+    total = 0
+    loaded = False
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', CHECK % code], capture_output=True, text=True)
+        total += time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr)
+        loaded |= 'pygame loaded: True' in result.stderr
+    return total / repeats, loaded
+
+"""
+function name: worker_ready
+precondition: runs in a worker process
+postcondition: returns if pygame was loaded
+
+Description:
+Imports what a search worker needs
+"""
+def worker_ready():
+    import bots
+    import board
+    return 'pygame' in sys.modules
+
+"""
+function name: spawn_worker
+precondition: repeats
+postcondition: returns (mean seconds until a spawned worker answered, if pygame was loaded)
+
+Description:
+spawn starts every worker as a new interpreter, like on Windows and macOS
+"""
+def spawn_worker(repeats):
+    total = 0
+    loaded = False
+    context = multiprocessing.get_context('spawn')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            loaded |= executor.submit(worker_ready).result()
+        total += time.perf_counter() - start
+    return total / repeats, loaded
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeats', help='runs to average over (default 5)', type=int, default=5)
+    args = parser.parse_args()
+
+    results = [
+        ('import board, bots', run_python('import board, bots', args.repeats)),
+        ('import pygame (for reference)', run_python('import pygame', args.repeats)),
+        ('game.py --ui false', run_python("sys.argv = ['game.py', '--p1', 'random', '--p2', 'random', '--ui', 'false']; "
+                                          "import game\ntry:\n    game.main()\nexcept SystemExit:\n    pass", args.repeats)),
+        ('spawn worker', spawn_worker(args.repeats)),
+    ]
+
+    failed = False
+    print("%-32s %10s %8s" % ('startup', 'seconds', 'pygame'))
+    for name, (seconds, loaded) in results:
+        print("%-32s %10.3f %8s" % (name, seconds, 'yes' if loaded else 'no'))
+        failed |= loaded and 'pygame' not in name
+    if failed:
+        print("\na headless start imported pygame")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
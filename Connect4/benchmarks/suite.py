@@ -0,0 +1,212 @@
+"""
+File Name: suite.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+The standard benchmark suite. Runs without a display and measures:
+1. drop_piece (with undo_move), winning_move and get_valid_locations ops/sec
+2. score_position evals/sec
+3. MiniMaxBot nodes/sec and time to every depth on fixed test positions
+4. MonteCarloBot playouts/sec
+
+The results are written as JSON. With --compare the results are checked
+against a saved baseline, every metric that got worse by more than the
+threshold is flagged and the script exits with 1.
+
+Run from the Connect4 folder:
+python -m benchmarks.suite --output baseline.json
+python -m benchmarks.suite --compare baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from board import Board, BitBoard
+from bots import MiniMaxBot, MonteCarloBot
+from bots.evaluation import Evaluation
+from benchmarks.common import random_positions, timed
+
+"""
+function name: metric
+precondition: value, unit, if a higher value is better
+postcondition: returns the metric as a dictionary
+
+Description:
+Every metric in the JSON has the same three fields
+"""
+def metric(value, unit, higher_is_better=True):
+    return {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+
+"""
+function name: board_metrics
+precondition: board class, test positions, seconds per measurement
+postcondition: returns the ops/sec of the board functions
+
+Description:
+drop_piece is measured together with undo_move so every call starts
+from the same position
+"""
+def board_metrics(board_cls, positions, min_time):
+    name = board_cls.__name__
+    moves = [(p, p.get_valid_locations()[0]) for p in positions]
+
+    def drop():
+        for p, col in moves:
+            p.drop_piece(col, p.CURR_PLAYER)
+            p.undo_move()
+
+    results = {}
+    for key, function in (('drop_piece', drop),
+                          ('winning_move', lambda: [p.winning_move(p.PREV_PLAYER) for p in positions]),
+                          ('get_valid_locations', lambda: [p.get_valid_locations() for p in positions])):
+        calls, duration = timed(function, min_time)
+        results['%s.%s' % (name, key)] = metric(calls * len(positions) / duration, 'ops/sec')
+    return results
+
+"""
+function name: evaluation_metrics
+precondition: test positions, seconds per measurement
+postcondition: returns the evals/sec of score_position
+
+Description:
+Scores every position from the side of player 1
+"""
+def evaluation_metrics(positions, min_time):
+    evaluation = Evaluation(Board.PLAYER1_PIECE)
+    calls, duration = timed(lambda: [evaluation.score_position(p) for p in positions], min_time)
+    return {'score_position': metric(calls * len(positions) / duration, 'evals/sec')}
+
+"""
+function name: minimax_metrics
+precondition: test positions, deepest depth
+postcondition: returns nodes/sec and the seconds to reach every depth
+
+Description:
+A new bot searches every position at every depth, so no table entries
+carry over between measurements
+"""
+def minimax_metrics(positions, depth):
+    results = {}
+    nodes = 0
+    seconds = 0
+    for d in range(1, depth + 1):
+        total = 0
+        for p in positions:
+            bot = MiniMaxBot(p.CURR_PLAYER, depth=d)
+            start = time.perf_counter()
+            bot.get_move(p)
+            duration = time.perf_counter() - start
+            total += duration
+            if d == depth:
+                nodes += bot.nodes
+                seconds += duration
+        results['minimax.time_to_depth_%d' % d] = metric(total / len(positions), 'sec', False)
+    results['minimax.nodes'] = metric(nodes / seconds, 'nodes/sec')
+    return results
+
+"""
+function name: montecarlo_metrics
+precondition: test positions, iterations per search
+postcondition: returns the playouts/sec
+
+Description:
+Each search runs for a fixed amount of iterations with no timeout
+"""
+def montecarlo_metrics(positions, iterations):
+    playouts = 0
+    seconds = 0
+    for p in positions:
+        bot = MonteCarloBot(p.CURR_PLAYER, max_iterations=iterations, timeout=sys.float_info.max)
+        start = time.perf_counter()
+        bot.get_move(p)
+        seconds += time.perf_counter() - start
+        playouts += bot.playouts
+    return {'montecarlo.playouts': metric(playouts / seconds, 'playouts/sec')}
+
+"""
+function name: run
+precondition: parsed arguments
+postcondition: returns the results of the whole suite
+
+Description:
+The test positions come from a fixed seed, so every run measures the same work
+"""
+def run(args):
+    metrics = {}
+    for board_cls in (Board, BitBoard):
+        metrics.update(board_metrics(board_cls, random_positions(board_cls, args.positions, 10), args.min_time))
+    positions = random_positions(Board, args.positions, 10)
+    metrics.update(evaluation_metrics(positions, args.min_time))
+    metrics.update(minimax_metrics(positions, args.depth))
+    metrics.update(montecarlo_metrics(positions, args.iterations))
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'settings': {'positions': args.positions, 'depth': args.depth, 'iterations': args.iterations},
+        'metrics': metrics,
+    }
+
+"""
+function name: compare
+precondition: baseline results, new results, allowed relative slowdown
+postcondition: prints the changes, returns the names of the regressions
+
+Description:
+The change is positive when a metric got better, whatever its direction
+"""
+def compare(baseline, results, threshold):
+    regressions = []
+    print("%-34s %14s %14s %9s" % ('metric', 'baseline', 'current', 'change'))
+    for name, current in results['metrics'].items():
+        old = baseline['metrics'].get(name)
+        if old is None or old['value'] == 0:
+            print("%-34s %14s %14.4g %9s" % (name, '-', current['value'], 'new'))
+            continue
+        if not current['higher_is_better'] and current['value'] == 0:
+            print("%-34s %14.4g %14.4g %9s" % (name, old['value'], current['value'], '-'))
+            continue
+        change = current['value'] / old['value'] - 1
+        if not current['higher_is_better']:
+            change = old['value'] / current['value'] - 1
+        flag = ''
+        if change < -threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print("%-34s %14.4g %14.4g %+8.1f%%%s" % (name, old['value'], current['value'], 100 * change, flag))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', help='amount of test positions (default 8)', type=int, default=8)
+    parser.add_argument('--depth', help='deepest minimax depth (default 4)', type=int, default=4)
+    parser.add_argument('--iterations', help='monte carlo iterations per position (default 2000)', type=int, default=2000)
+    parser.add_argument('--min-time', help='seconds per throughput measurement (default 1)', type=float, default=1.0)
+    parser.add_argument('--output', help='JSON file to write the results to', type=str)
+    parser.add_argument('--compare', help='baseline JSON file to check for regressions', type=str)
+    parser.add_argument('--threshold', help='slowdown that counts as a regression (default 0.10)', type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print("\n%d regression(s): %s" % (len(regressions), ', '.join(regressions)))
+            sys.exit(1)
+        print("\nno regressions")
+    else:
+        for name, m in results['metrics'].items():
+            print("%-34s %14.4g %s" % (name, m['value'], m['unit']))
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,15 @@
 from .board import Board
-from .graphics import GBoard
+from .bitboard import BitBoard
 
 __all__ = [
     'Board',
-    'GBoard'
+    'BitBoard'
 ]
+
+# GBoard needs pygame, so it is only imported when the UI asks for it.
+# It is left out of __all__ so "from board import *" stays free of pygame.
+def __getattr__(name):
+    if name == 'GBoard':
+        from .graphics import GBoard
+        return GBoard
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
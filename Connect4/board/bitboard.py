@@ -0,0 +1,268 @@
+"""
+File Name: bitboard.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Holds a bitboard version of the connect 4 board. It has the same
+public functions as Board, but keeps the state as one integer per
+player plus a mask of filled slots and a height for every column.
+
+Every column uses ROW_COUNT + 1 bits, the extra bit on top is always
+empty so shifted lines can not wrap into the next column:
+
+     6 13 20 27 34 41 48
+     5 12 19 26 33 40 47
+     4 11 18 25 32 39 46
+     3 10 17 24 31 38 45
+     2  9 16 23 30 37 44
+     1  8 15 22 29 36 43
+     0  7 14 21 28 35 42
+
+The bitboards are python integers, so a bigger board just uses more
+bits: 56 for 8x7, 72 for 9x8.
+"""
+import numpy as np
+from .board import Board
+
+"""
+function name: line_shifts
+precondition: shift of a direction, length of a winning line
+postcondition: returns the shifts that leave the pieces starting a line
+
+Description:
+b & (b >> s) keeps the pieces that start two in a row. Doing that
+again with the shift doubled makes it four in a row, and so on, and
+the last shift adds whatever is still missing to the length.
+"""
+def line_shifts(shift, length):
+    shifts = []
+    covered = 1
+    while covered * 2 <= length:
+        shifts.append(covered * shift)
+        covered *= 2
+    if covered < length:
+        shifts.append((length - covered) * shift)
+    return tuple(shifts)
+
+class BitBoard(Board):
+    COLUMN_HEIGHT = Board.ROW_COUNT + 1                 #bits used by every column (with the empty top bit)
+
+    # shift amounts for vertical, horizontal and both diagonal lines
+    DIRECTIONS = (1, COLUMN_HEIGHT, COLUMN_HEIGHT - 1, COLUMN_HEIGHT + 1)
+
+    WIN_SHIFTS = tuple(line_shifts(shift, Board.WINDOW_LENGTH) for shift in DIRECTIONS)
+
+    """
+    function name: __init__
+    precondition: current_player, optional rows, columns and length of a winning line
+    postcondition: none
+
+    Description:
+    Initialize an empty bitboard
+    """
+    def __init__(self, current_player, rows=None, columns=None, connect=None):
+        self.set_size(rows, columns, connect)
+        self.bitboards = [0, 0, 0]                      #pieces of each player, indexed by the piece number
+        self.mask = 0                                   #every filled slot
+        self.heights = [0] * self.COLUMN_COUNT          #amount of pieces in each column
+        self.num_slots_filled = 0
+        self.CURR_PLAYER = current_player
+        self.PREV_PLAYER = self.get_opp_player(current_player)
+        self.move_stack = []                            #holds (col, row, PREV_MOVE, PREV_PLAYER, CURR_PLAYER) from before every move
+        self.zobrist_key = 0                            #xor of the zobrist keys of every piece on the board
+
+    """
+    function name: set_size
+    precondition: rows, columns and length of a winning line, None keeps the default
+    postcondition: the board uses that size
+
+    Description:
+    Also works out the bit layout and the shifts of the win check
+    """
+    def set_size(self, rows=None, columns=None, connect=None):
+        super().set_size(rows, columns, connect)
+        self.COLUMN_HEIGHT = self.ROW_COUNT + 1
+        self.DIRECTIONS = (1, self.COLUMN_HEIGHT, self.COLUMN_HEIGHT - 1, self.COLUMN_HEIGHT + 1)
+        self.WIN_SHIFTS = tuple(line_shifts(shift, self.WINDOW_LENGTH) for shift in self.DIRECTIONS)
+
+    """
+    function name: from_board
+    precondition: any board with the Board functions
+    postcondition: returns a bitboard with the same state and size
+
+    Description:
+    Converts a board (for example the numpy Board) into a bitboard
+    """
+    @classmethod
+    def from_board(cls, board):
+        b = cls(board.CURR_PLAYER, board.ROW_COUNT, board.COLUMN_COUNT, board.WINDOW_LENGTH)
+        for col in range(b.COLUMN_COUNT):
+            for row in range(b.ROW_COUNT):
+                piece = board.get_row_col(row, col)
+                if piece == cls.EMPTY:
+                    break
+                bit = 1 << (col * b.COLUMN_HEIGHT + row)
+                b.bitboards[piece] |= bit
+                b.mask |= bit
+                b.heights[col] += 1
+                b.num_slots_filled += 1
+                b.zobrist_key ^= b.ZOBRIST[piece][row][col]
+        b.PREV_MOVE = board.PREV_MOVE
+        b.PREV_PLAYER = board.PREV_PLAYER
+        return b
+
+    """
+    function name: copy_board
+    precondition: board state
+    postcondition: returns a copy of the board
+
+    Description:
+    Copys the board state without going through deepcopy
+    """
+    def copy_board(self):
+        c = type(self).__new__(type(self))
+        c.__dict__.update(self.__dict__)
+        c.bitboards = self.bitboards[:]
+        c.heights = self.heights[:]
+        c.move_stack = self.move_stack[:]
+        return c
+
+    """
+    function name: get_board
+    precondition: board
+    postcondition: returns board state
+
+    Description:
+    Builds the numpy version of the board state
+    """
+    def get_board(self):
+        grid = np.zeros((self.ROW_COUNT, self.COLUMN_COUNT), dtype=int)
+        for piece in (self.PLAYER1_PIECE, self.PLAYER2_PIECE):
+            b = self.bitboards[piece]
+            for col in range(self.COLUMN_COUNT):
+                for row in range(self.heights[col]):
+                    if b >> (col * self.COLUMN_HEIGHT + row) & 1:
+                        grid[row][col] = piece
+        return grid
+
+    """
+    function name: get_row_col
+    precondition: board, row, col
+    postcondition: returns the piece at row and column
+
+    Description:
+    function to retrieve the wanted position at row and col
+    """
+    def get_row_col(self, row, col):
+        bit = col * self.COLUMN_HEIGHT + row
+        if self.bitboards[self.PLAYER1_PIECE] >> bit & 1:
+            return self.PLAYER1_PIECE
+        if self.bitboards[self.PLAYER2_PIECE] >> bit & 1:
+            return self.PLAYER2_PIECE
+        return self.EMPTY
+
+    """
+    function name: drop_piece
+    precondition: board, column, current player
+    postcondition: move made and moves to next players
+
+    Description:
+    Sets the lowest empty bit of the column for the player, raises
+    ValueError for a full column before anything is changed
+    """
+    def drop_piece(self, col, piece):
+        row = self.heights[col]
+        if row >= self.ROW_COUNT:
+            raise ValueError("column %d is full" % col)
+        self.move_stack.append((col, row, self.PREV_MOVE, self.PREV_PLAYER, self.CURR_PLAYER))
+        bit = 1 << (col * self.COLUMN_HEIGHT + row)
+        self.bitboards[piece] |= bit
+        self.mask |= bit
+        self.zobrist_key ^= self.ZOBRIST[piece][row][col]
+        self.heights[col] = row + 1
+        self.num_slots_filled += 1
+        self.PREV_MOVE = col
+        self.PREV_PLAYER = piece
+        self.CURR_PLAYER = self.get_opp_player(piece)
+
+    """
+    function name: undo_move
+    precondition: at least one move made with drop_piece
+    postcondition: the last move is taken back, returns its column
+
+    Description:
+    Clears the bit of the last move and puts the previous move and players back
+    """
+    def undo_move(self):
+        col, row, self.PREV_MOVE, self.PREV_PLAYER, self.CURR_PLAYER = self.move_stack.pop()
+        bit = 1 << (col * self.COLUMN_HEIGHT + row)
+        piece = self.PLAYER1_PIECE if self.bitboards[self.PLAYER1_PIECE] & bit else self.PLAYER2_PIECE
+        self.bitboards[piece] ^= bit
+        self.zobrist_key ^= self.ZOBRIST[piece][row][col]
+        self.mask &= ~bit
+        self.heights[col] = row
+        self.num_slots_filled -= 1
+        return col
+
+    """
+    function name: is_valid_location
+    precondition: move is made
+    postcondition: returns if move is valid or not
+
+    Description:
+    makes sure that the column still has room
+    """
+    def is_valid_location(self, col):
+        return self.heights[col] < self.ROW_COUNT
+
+    """
+    function name: get_next_open_row
+    precondition: none
+    postcondition: returns an open row
+
+    Description:
+    returns the height of the column, or None if it is full
+    """
+    def get_next_open_row(self, col):
+        if self.heights[col] < self.ROW_COUNT:
+            return self.heights[col]
+
+    """
+    function name: winning_move
+    precondition: move is made
+    postcondition: returns if the player has WINDOW_LENGTH in a row
+
+    Description:
+    For each direction, b & (b >> s) keeps the pieces that have a
+    neighbour, doing it again with 2*s leaves pieces that start a line of
+    four. WIN_SHIFTS holds these shifts for the length of a winning line.
+    """
+    def winning_move(self, piece):
+        b = self.bitboards[piece]
+        if self.WINDOW_LENGTH == 4:                     #the usual game, without the inner loop
+            for shift in self.DIRECTIONS:
+                m = b & (b >> shift)
+                if m & (m >> (2 * shift)):
+                    return True
+            return False
+        for shifts in self.WIN_SHIFTS:
+            m = b
+            for shift in shifts:
+                m &= m >> shift
+            if m:
+                return True
+        return False
+
+    """
+    function name: get_valid_locations
+    precondition: move is made
+    postcondition: returns valid locations
+
+    Description:
+    checks all valid column locations
+    """
+    def get_valid_locations(self):
+        return [col for col in range(self.COLUMN_COUNT) if self.heights[col] < self.ROW_COUNT]
@@ -14,9 +14,57 @@ Holds class for connect 4 board. Does the following things:
 5. Check valid move
 6. Print the board state
 7. Check if there's a winning state
+8. Keep a zobrist hash of the board state
+
+The size of the board and the length of a winning line can be given
+to every board, 6 rows, 7 columns and connect 4 when they are not.
 """
 import numpy as np
 import copy
+import random
+from functools import lru_cache
+
+"""
+function name: zobrist_keys
+precondition: amount of rows and columns
+postcondition: returns a random 64 bit key for every piece, row and column
+
+Description:
+Builds the zobrist keys. The seed is fixed so every board (and every
+process) hashes the same position to the same key.
+"""
+@lru_cache(maxsize=None)
+def zobrist_keys(rows, columns, seed=2021):
+    rng = random.Random(seed)
+    return [None] + [[[rng.getrandbits(64) for c in range(columns)] for r in range(rows)] for piece in range(2)]
+
+"""
+function name: winning_lines
+precondition: amount of rows and columns, length of a winning line
+postcondition: returns a (lines, length) numpy array of flat cell indexes
+
+Description:
+Every horizontal, vertical and diagonal line a player can win with,
+made once for every board size. The evaluation reads its windows from
+this table too, in the same order: horizontal, vertical, positive
+sloped and then negative sloped diagonals.
+"""
+@lru_cache(maxsize=None)
+def winning_lines(rows, columns, length):
+    lines = []
+    for r in range(rows):
+        for c in range(columns-length+1):
+            lines.append([r*columns + c+i for i in range(length)])
+    for c in range(columns):
+        for r in range(rows-length+1):
+            lines.append([(r+i)*columns + c for i in range(length)])
+    for r in range(rows-length+1):
+        for c in range(columns-length+1):
+            lines.append([(r+i)*columns + c+i for i in range(length)])
+    for r in range(rows-length+1):
+        for c in range(columns-length+1):
+            lines.append([(r+length-1-i)*columns + c+i for i in range(length)])
+    return np.array(lines, dtype=np.intp).reshape(-1, length)
 
 class Board:
     ROW_COUNT = 6           #amount of rows in connect 4 board
@@ -26,25 +74,82 @@ class Board:
     PLAYER1_PIECE = 1       #represents player 1 piece on board
     PLAYER2_PIECE = 2       #represents player 2 piece on board
 
-    WINDOW_LENGTH = 4
+    WINDOW_LENGTH = 4       #pieces in a row needed to win
 
     PREV_MOVE = None        #holds the previous move made
     PREV_PLAYER = None      #holds who the previous player was
     CURR_PLAYER = None      #holds who is the current player making a move
 
+    ZOBRIST = zobrist_keys(ROW_COUNT, COLUMN_COUNT)     #ZOBRIST[piece][row][col]
+    LINES = winning_lines(ROW_COUNT, COLUMN_COUNT, WINDOW_LENGTH)
+
     """
     function name: __init__
-    precondition: board state and current_player
+    precondition: current_player, optional rows, columns and length of a winning line
     postcondition: none
     
     Description:
     Initialize the board states
     """
-    def __init__(self, current_player):
+    def __init__(self, current_player, rows=None, columns=None, connect=None):
+        self.set_size(rows, columns, connect)
         self.board = np.zeros((self.ROW_COUNT, self.COLUMN_COUNT), dtype=int)
         self.num_slots_filled = 0
         self.CURR_PLAYER = current_player
         self.PREV_PLAYER = self.get_opp_player(current_player)
+        self.move_stack = []    #holds (col, row, PREV_MOVE, PREV_PLAYER, CURR_PLAYER) from before every move
+        self.zobrist_key = 0    #xor of the zobrist keys of every piece on the board
+
+    """
+    function name: set_size
+    precondition: rows, columns and length of a winning line, None keeps the default
+    postcondition: the board uses that size
+
+    Description:
+    The size and the tables made from it are kept on the instance, the
+    class constants stay the defaults. Tables are shared by every board
+    of the same size.
+    """
+    def set_size(self, rows=None, columns=None, connect=None):
+        self.ROW_COUNT = rows if rows is not None else type(self).ROW_COUNT
+        self.COLUMN_COUNT = columns if columns is not None else type(self).COLUMN_COUNT
+        self.WINDOW_LENGTH = connect if connect is not None else type(self).WINDOW_LENGTH
+        if min(self.ROW_COUNT, self.COLUMN_COUNT) < 1 or not 1 < self.WINDOW_LENGTH <= max(self.ROW_COUNT, self.COLUMN_COUNT):
+            raise ValueError("can not connect %d on a board of %d rows and %d columns" % (self.WINDOW_LENGTH, self.ROW_COUNT, self.COLUMN_COUNT))
+        self.ZOBRIST = zobrist_keys(self.ROW_COUNT, self.COLUMN_COUNT)
+        self.LINES = winning_lines(self.ROW_COUNT, self.COLUMN_COUNT, self.WINDOW_LENGTH)
+
+    """
+    function name: __getstate__
+    precondition: board state
+    postcondition: returns the state to pickle
+
+    Description:
+    Leaves out the size tables, a board sent to a worker process is then
+    a few hundred bytes instead of a few kilobytes
+    """
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['ZOBRIST'], state['LINES']
+        return state
+
+    """
+    function name: __setstate__
+    precondition: pickled state
+    postcondition: the board has its state and the tables of its size again
+    """
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.ZOBRIST = zobrist_keys(self.ROW_COUNT, self.COLUMN_COUNT)
+        self.LINES = winning_lines(self.ROW_COUNT, self.COLUMN_COUNT, self.WINDOW_LENGTH)
+
+    """
+    function name: size
+    precondition: none
+    postcondition: returns (rows, columns, length of a winning line)
+    """
+    def size(self):
+        return self.ROW_COUNT, self.COLUMN_COUNT, self.WINDOW_LENGTH
 
     """
     function name: copy_board
@@ -52,10 +157,10 @@ class Board:
     postcondition: returns a copy of the board
     
     Description: 
-    Copys the board state
+    Copys the board state, the size tables are shared
     """
     def copy_board(self):
-        c = copy.deepcopy(self)
+        c = copy.deepcopy(self, {id(self.ZOBRIST): self.ZOBRIST, id(self.LINES): self.LINES})
         return c
 
     """
@@ -101,16 +206,37 @@ class Board:
     
     Description:
     Once a player makes a move, the move is made and 
-    moves to the next player
+    moves to the next player. A full column raises ValueError and
+    leaves the board as it was
     """
     def drop_piece(self, col, piece):
         row = self.get_next_open_row(col)
+        if row is None:
+            raise ValueError("column %d is full" % col)
+        self.move_stack.append((col, row, self.PREV_MOVE, self.PREV_PLAYER, self.CURR_PLAYER))
         self.board[row][col] = piece
+        self.zobrist_key ^= self.ZOBRIST[piece][row][col]
         self.num_slots_filled += 1
         self.PREV_MOVE = col
         self.PREV_PLAYER = piece
         self.CURR_PLAYER = self.get_opp_player(piece)
 
+    """
+    function name: undo_move
+    precondition: at least one move made with drop_piece
+    postcondition: the last move is taken back, returns its column
+    
+    Description:
+    Empties the slot of the last move and puts the previous move
+    and players back, so a search can use one board instead of copies
+    """
+    def undo_move(self):
+        col, row, self.PREV_MOVE, self.PREV_PLAYER, self.CURR_PLAYER = self.move_stack.pop()
+        self.zobrist_key ^= self.ZOBRIST[self.board[row][col]][row][col]
+        self.board[row][col] = self.EMPTY
+        self.num_slots_filled -= 1
+        return col
+
     """
     function name: is_valid_location
     precondition: move is made
@@ -146,7 +272,7 @@ class Board:
     Prints the board state
     """
     def print_board(self):
-        print(np.flip(self.board, 0))
+        print(np.flip(self.get_board(), 0))
 
     """
     function name: winning_move
@@ -154,32 +280,12 @@ class Board:
     postcondition: returns if move is a winnning position
     
     Description:
-    checks if the mode that was made is a win move state
+    checks if the mode that was made is a win move state, meaning the
+    player has WINDOW_LENGTH pieces in a row
     """
     def winning_move(self, piece):
-        # Check horizontal locations for win
-        for c in range(self.COLUMN_COUNT-3):
-            for r in range(self.ROW_COUNT):
-                if self.board[r][c] == piece and self.board[r][c+1] == piece and self.board[r][c+2] == piece and self.board[r][c+3] == piece:
-                    return True
-
-        # Check vertical locations for win
-        for c in range(self.COLUMN_COUNT):
-            for r in range(self.ROW_COUNT-3):
-                if self.board[r][c] == piece and self.board[r+1][c] == piece and self.board[r+2][c] == piece and self.board[r+3][c] == piece:
-                    return True
-
-        # Check positively sloped diaganols
-        for c in range(self.COLUMN_COUNT-3):
-            for r in range(self.ROW_COUNT-3):
-                if self.board[r][c] == piece and self.board[r+1][c+1] == piece and self.board[r+2][c+2] == piece and self.board[r+3][c+3] == piece:
-                    return True
-
-        # Check negatively sloped diaganols
-        for c in range(self.COLUMN_COUNT-3):
-            for r in range(3, self.ROW_COUNT):
-                if self.board[r][c] == piece and self.board[r-1][c+1] == piece and self.board[r-2][c+2] == piece and self.board[r-3][c+3] == piece:
-                    return True
+        # every line is checked at once, LINES holds the cells of each line
+        return bool((self.board.take(self.LINES) == piece).all(axis=1).any())
 
     """
     function name: get_valid_locations
@@ -0,0 +1,266 @@
+"""
+File Name: encoding.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Compact ways to store positions and games.
+
+A position key is a 64 bit integer made from the bitboard layout: the
+pieces of the player to move plus the mask of all pieces. A column with
+h pieces adds up to a number from 2^h - 1 to 2^(h+1) - 2, so the sums of
+different heights never meet and the key is unique for the position and
+the player to move. The canonical key is the smaller of the key and
+the key of the mirrored board, a position and its mirror share it.
+
+A game record file is a 16 byte header and then fixed size records of
+24 bytes: the amount of moves, the first player, the winner (0 for a
+draw) and the columns packed two per byte. Records can be appended to
+the file, and the file is read with numpy.memmap so a reader only
+touches the games it is asked for. Boards are built from a record only
+when they are needed.
+"""
+import os
+import struct
+import numpy as np
+from .board import Board
+from .bitboard import BitBoard
+
+COLUMN_BITS = (1 << BitBoard.COLUMN_HEIGHT) - 1
+
+"""
+function name: position_key
+precondition: pieces of the player to move, mask of all pieces
+postcondition: returns the key of the position
+"""
+def position_key(position, mask):
+    return position + mask
+
+"""
+function name: mirror_key
+precondition: position key
+postcondition: returns the key of the mirrored position
+
+Description:
+Every column keeps its own bits in the key, so mirroring only swaps columns
+"""
+def mirror_key(key):
+    mirrored = 0
+    for col in range(BitBoard.COLUMN_COUNT):
+        mirrored |= ((key >> (col * BitBoard.COLUMN_HEIGHT)) & COLUMN_BITS) << ((BitBoard.COLUMN_COUNT - 1 - col) * BitBoard.COLUMN_HEIGHT)
+    return mirrored
+
+"""
+function name: canonical_key
+precondition: position key
+postcondition: returns the smaller of the key and the mirrored key
+"""
+def canonical_key(key):
+    return min(key, mirror_key(key))
+
+"""
+function name: encode
+precondition: any board with the Board functions
+postcondition: returns the position key of the board
+
+Description:
+Reads the pieces of the player to move and the mask from a bitboard
+"""
+def encode(board):
+    if not isinstance(board, BitBoard):
+        board = BitBoard.from_board(board)
+    return position_key(board.bitboards[board.CURR_PLAYER], board.mask)
+
+"""
+function name: encode_canonical
+precondition: any board with the Board functions
+postcondition: returns the canonical key of the board
+"""
+def encode_canonical(board):
+    return canonical_key(encode(board))
+
+"""
+function name: decode
+precondition: position key, piece of the player to move, board class
+postcondition: returns a board with the position
+
+Description:
+The height of a column follows from the range its part of the key is
+in, what is left are the pieces of the player to move. The order the
+pieces were played in is not stored, so the pieces are put down column
+by column and the board has no move history.
+"""
+def decode(key, current_player, board_cls = Board):
+    board = board_cls(current_player)
+    opponent = board.get_opp_player(current_player)
+    for col in range(board_cls.COLUMN_COUNT):
+        column = (key >> (col * BitBoard.COLUMN_HEIGHT)) & COLUMN_BITS
+        height = (column + 1).bit_length() - 1
+        position = column - ((1 << height) - 1)
+        for row in range(height):
+            board.drop_piece(col, current_player if position >> row & 1 else opponent)
+    board.move_stack = []
+    board.CURR_PLAYER = current_player
+    board.PREV_PLAYER = opponent
+    board.PREV_MOVE = None
+    return board
+
+MAGIC = b'C4GR'
+HEADER = struct.Struct('<4sBBBB8x')     #magic, version, rows, columns, record size
+VERSION = 1
+MAX_MOVES = Board.ROW_COUNT * Board.COLUMN_COUNT
+RECORD = np.dtype([('length', 'u1'), ('first_player', 'u1'), ('winner', 'u1'), ('moves', 'u1', ((MAX_MOVES + 1) // 2,))])
+
+"""
+function name: pack_moves
+precondition: list of columns
+postcondition: returns the columns packed two per byte
+
+Description:
+The first move of a pair goes in the low four bits
+"""
+def pack_moves(moves):
+    packed = np.zeros(RECORD['moves'].shape, dtype = np.uint8)
+    for i, col in enumerate(moves):
+        packed[i // 2] |= col << (4 * (i % 2))
+    return packed
+
+"""
+function name: unpack_moves
+precondition: packed columns, amount of moves
+postcondition: returns the list of columns
+"""
+def unpack_moves(packed, length):
+    return [int(packed[i // 2] >> (4 * (i % 2))) & 15 for i in range(length)]
+
+class GameRecord:
+
+    """
+    function name: __init__
+    precondition: one record from the file
+    postcondition: none
+
+    Description:
+    Holds a view of the record, the moves are unpacked on first use
+    """
+    def __init__(self, record):
+        self.record = record
+        self.first_player = int(record['first_player'])
+        self.winner = int(record['winner']) or None
+        self.length = int(record['length'])
+        self._moves = None
+
+    @property
+    def moves(self):
+        if self._moves is None:
+            self._moves = unpack_moves(self.record['moves'], self.length)
+        return self._moves
+
+    """
+    function name: board
+    precondition: optional amount of moves, board class
+    postcondition: returns the board after that many moves, the end of the game by default
+    """
+    def board(self, ply = None, board_cls = Board):
+        board = board_cls(self.first_player)
+        for col in self.moves[:self.length if ply is None else ply]:
+            board.drop_piece(col, board.CURR_PLAYER)
+        return board
+
+    """
+    function name: positions
+    precondition: optional board class
+    postcondition: yields (board, column played next) for every move of the game
+
+    Description:
+    One board is played forward, so a copy is needed to keep a position
+    """
+    def positions(self, board_cls = Board):
+        board = board_cls(self.first_player)
+        for col in self.moves:
+            yield board, col
+            board.drop_piece(col, board.CURR_PLAYER)
+
+class GameWriter:
+
+    """
+    function name: __init__
+    precondition: path of the record file
+    postcondition: the file is opened for appending
+
+    Description:
+    A new file gets the header, an existing one is checked and appended to
+    """
+    def __init__(self, path):
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not new:
+            read_header(path)
+        self.file = open(path, 'ab')
+        if new:
+            self.file.write(HEADER.pack(MAGIC, VERSION, Board.ROW_COUNT, Board.COLUMN_COUNT, RECORD.itemsize))
+
+    """
+    function name: write
+    precondition: columns played, first player, winning piece or None for a draw
+    postcondition: one record is appended
+    """
+    def write(self, moves, first_player, winner):
+        record = np.zeros(1, dtype = RECORD)
+        record['length'] = len(moves)
+        record['first_player'] = first_player
+        record['winner'] = winner or 0
+        record['moves'] = pack_moves(moves)
+        self.file.write(record.tobytes())
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+"""
+function name: read_header
+precondition: path of a record file
+postcondition: raises ValueError if the file is not a game record file for this board
+"""
+def read_header(path):
+    with open(path, 'rb') as f:
+        magic, version, rows, columns, size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or rows != Board.ROW_COUNT or columns != Board.COLUMN_COUNT or size != RECORD.itemsize:
+        raise ValueError("%s is not a game record file for a %dx%d board" % (path, Board.ROW_COUNT, Board.COLUMN_COUNT))
+
+class GameReader:
+
+    """
+    function name: __init__
+    precondition: path of the record file
+    postcondition: the records are memory mapped
+
+    Description:
+    Only whole records are mapped, a record still being appended is left out
+    """
+    def __init__(self, path):
+        read_header(path)
+        count = (os.path.getsize(path) - HEADER.size) // RECORD.itemsize
+        if count:
+            self.records = np.memmap(path, dtype = RECORD, mode = 'r', offset = HEADER.size, shape = (count,))
+        else:
+            self.records = np.zeros(0, dtype = RECORD)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, i):
+        return GameRecord(self.records[i])
+
+    def __iter__(self):
+        for record in self.records:
+            yield GameRecord(record)
@@ -0,0 +1,87 @@
+"""
+file name: events.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+description:
+The event loop every UI screen runs. It sleeps in pygame.event.wait
+until something happens instead of asking for events in a busy loop,
+and only draws when a handler said the screen changed. The frame rate
+is capped with a pygame.time.Clock, so a fast moving mouse can not make
+it draw more than FPS frames a second.
+"""
+import sys
+import pygame
+
+class EventLoop:
+    FPS = 60
+
+    """
+    function name: __init__
+    precondition: function that draws the screen, optional frame cap
+    postcondition: none
+
+    description:
+    Closing the window exits the program, like it did in every screen
+    """
+    def __init__(self, draw, fps = FPS):
+        self.draw = draw
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.handlers = {pygame.QUIT: lambda event: sys.exit()}
+        self.dirty = True
+        self.running = False
+        self.result = None
+
+    """
+    function name: on
+    precondition: pygame event type, function taking the event
+    postcondition: the function is called for every event of that type
+    """
+    def on(self, event_type, handler):
+        self.handlers[event_type] = handler
+
+    """
+    function name: redraw
+    precondition: none
+    postcondition: the screen is drawn before the loop waits again
+    """
+    def redraw(self):
+        self.dirty = True
+
+    """
+    function name: stop
+    precondition: optional result
+    postcondition: run returns the result after the current event
+    """
+    def stop(self, result = None):
+        self.running = False
+        self.result = result
+
+    """
+    function name: run
+    precondition: none
+    postcondition: returns the result given to stop
+
+    description:
+    Waits for one event, then handles every event already queued so a
+    burst of mouse motion is drawn once
+    """
+    def run(self):
+        self.running = True
+        self.result = None
+        while self.running:
+            if self.dirty:
+                self.dirty = False
+                self.draw()
+                self.clock.tick(self.fps)
+
+            event = pygame.event.wait()
+            while self.running and event.type != pygame.NOEVENT:
+                handler = self.handlers.get(event.type)
+                if handler is not None:
+                    handler(event)
+                event = pygame.event.poll()
+        return self.result
@@ -6,13 +6,14 @@ Author: Paul Lee, Thomas Tran
 Last Modification Date: 4/25/2021
 
 description:
-Provides the graphics for the connect 4 UI
+Provides the graphics for the connect 4 UI. The empty board is drawn
+once into a surface that is copied to the screen, fonts and rendered
+text are kept in caches, and after the first frame only the slots that
+changed are drawn and sent to the display.
 """
 import pygame
 import pygame.gfxdraw
 
-pygame.init()
-
 class GBoard:
     #wanted colors for graphics
     BLUE = (63,124,230)
@@ -26,9 +27,13 @@ class GBoard:
 
     RADIUS = int(SQUARESIZE/2 - 5)
 
-    myfont = pygame.font.SysFont("monospace", 75)
-    
-    
+    myfont = None   #made with the first GBoard, so importing the module does not scan the fonts
+
+    fonts = {}          #(face, size) -> font
+    texts = {}          #(face, size, text, colour) -> rendered text surface
+    backgrounds = {}    #(columns, rows) -> surface of the empty board
+    drawn = None        #pieces on the screen as the last draw_gboard left them, None when unknown
+
     """
     function name: __init__
     precondition: none
@@ -38,10 +43,80 @@ class GBoard:
     function to start the screen in a specific size
     """
     def __init__(self, board):
+        if not pygame.get_init():
+            pygame.init()
+        if GBoard.myfont is None:
+            GBoard.myfont = GBoard.font("monospace", 75)
         self.width = board.COLUMN_COUNT * self.SQUARESIZE
         self.height = (board.ROW_COUNT+1) * self.SQUARESIZE
         self.size = (self.width, self.height)
-        self.screen = pygame.display.set_mode(self.size)
+        # the window is shared by every GBoard, making it again would wipe the screen
+        screen = pygame.display.get_surface()
+        if screen is None or screen.get_size() != self.size:
+            screen = pygame.display.set_mode(self.size)
+            GBoard.drawn = None
+        self.screen = screen
+
+    """
+    function name: font
+    precondition: font face and size
+    postcondition: returns the font
+
+    description:
+    SysFont searches the system fonts, so every font is only made once
+    """
+    @classmethod
+    def font(cls, face, size):
+        font = cls.fonts.get((face, size))
+        if font is None:
+            font = cls.fonts[(face, size)] = pygame.font.SysFont(face, size)
+        return font
+
+    """
+    function name: text_surface
+    precondition: text, colour, font size, font face
+    postcondition: returns the rendered text
+
+    description:
+    Menus write the same text every frame, so it is only rendered once
+    """
+    @classmethod
+    def text_surface(cls, text, colour, fontsize, face = "inkfree"):
+        key = (face, fontsize, text, colour)
+        surface = cls.texts.get(key)
+        if surface is None:
+            surface = cls.texts[key] = cls.font(face, fontsize).render(text, True, colour)
+        return surface
+
+    """
+    function name: background
+    precondition: board
+    postcondition: returns the surface of the empty board
+
+    description:
+    Draws the blue board with its black holes once for every board size
+    """
+    def background(self, board):
+        key = (board.COLUMN_COUNT, board.ROW_COUNT)
+        surface = self.backgrounds.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.width, self.height - self.SQUARESIZE))
+            for c in range(board.COLUMN_COUNT):
+                for r in range(board.ROW_COUNT):
+                    pygame.draw.rect(surface, self.BLUE, (c*self.SQUARESIZE, r*self.SQUARESIZE, self.SQUARESIZE, self.SQUARESIZE))
+                    pygame.draw.circle(surface, self.BLACK, (int(c*self.SQUARESIZE+self.SQUARESIZE/2), \
+                        int(r*self.SQUARESIZE+self.SQUARESIZE/2)), self.RADIUS)
+            self.backgrounds[key] = surface
+        return surface
+
+    """
+    function name: invalidate
+    precondition: something else was drawn over the board
+    postcondition: the next draw_gboard draws the whole board
+    """
+    @classmethod
+    def invalidate(cls):
+        cls.drawn = None
 
     """
     function name: update_gboard
@@ -51,8 +126,11 @@ class GBoard:
     description: 
     When an event happens, this function will update the screen
     """
-    def update_gboard(self):
-        pygame.display.update()
+    def update_gboard(self, rects = None):
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
     
     
     """
@@ -64,22 +142,33 @@ class GBoard:
     function to draw and update the connect 4 board
     """
     def draw_gboard(self, board):
-        for c in range(board.COLUMN_COUNT):
-            for r in range(board.ROW_COUNT):
-                pygame.draw.rect(self.screen, self.BLUE, (c*self.SQUARESIZE, r*self.SQUARESIZE+self.SQUARESIZE, \
-                    self.SQUARESIZE, self.SQUARESIZE))
-                pygame.draw.circle(self.screen, self.BLACK, (int(c*self.SQUARESIZE+self.SQUARESIZE/2), \
-                    int(r*self.SQUARESIZE+self.SQUARESIZE+self.SQUARESIZE/2)), self.RADIUS)
-        
-        for c in range(board.COLUMN_COUNT):
-            for r in range(board.ROW_COUNT):		
-                if board.get_row_col(r, c) == 1:
-                    pygame.draw.circle(self.screen, self.RED, (int(c*self.SQUARESIZE+self.SQUARESIZE/2),\
-                         self.height-int(r*self.SQUARESIZE+self.SQUARESIZE/2)), self.RADIUS)
-                elif board.get_row_col(r, c) == 2: 
-                    pygame.draw.circle(self.screen, self.YELLOW, (int(c*self.SQUARESIZE+self.SQUARESIZE/2), \
-                        self.height-int(r*self.SQUARESIZE+self.SQUARESIZE/2)), self.RADIUS)
-        self.update_gboard()
+        grid = board.get_board()
+        background = self.background(board)
+        if GBoard.drawn is None or GBoard.drawn.shape != grid.shape:
+            # first frame, the whole board is drawn
+            self.screen.blit(background, (0, self.SQUARESIZE))
+            changed = zip(*grid.nonzero())
+            rects = None
+        else:
+            # only the slots that changed since the last frame
+            changed = zip(*(grid != GBoard.drawn).nonzero())
+            rects = []
+
+        for r, c in changed:
+            cell = pygame.Rect(c*self.SQUARESIZE, self.height-(r+1)*self.SQUARESIZE, self.SQUARESIZE, self.SQUARESIZE)
+            self.screen.blit(background, cell, cell.move(0, -self.SQUARESIZE))
+            if grid[r][c] == 1:
+                pygame.draw.circle(self.screen, self.RED, cell.center, self.RADIUS)
+            elif grid[r][c] == 2:
+                pygame.draw.circle(self.screen, self.YELLOW, cell.center, self.RADIUS)
+            if rects is not None:
+                rects.append(cell)
+
+        GBoard.drawn = grid.copy()
+        if rects is None:
+            self.update_gboard()
+        elif rects:
+            self.update_gboard(rects)
 
     """
     function name: draw_rect
@@ -112,8 +201,7 @@ class GBoard:
     given a set of parameters, the function will write inputted text
     """
     def write_on_board(self, text, color, posx, posy, fontsize, inCenter = False):
-        textfont = pygame.font.SysFont("inkfree", fontsize)
-        text_surface = textfont.render(text, True, color)
+        text_surface = self.text_surface(text, color, fontsize)
         if(inCenter):
             text_position = text_surface.get_rect(center = (posx, posy))
         else:
@@ -141,8 +229,7 @@ class GBoard:
     given a set of parameters, the function will create a button
     """
     def create_button(self, posx, posy, width, height, label, callback, optional_arguments = None):
-        textfont = pygame.font.SysFont("inkfree", 25)
-        text_surface = textfont.render(label, True, self.WHITE)
+        text_surface = self.text_surface(label, self.WHITE, 25)
 
         button_position = pygame.Rect(posx, posy, width, height)
         text_rectangle = text_surface.get_rect(topleft = (posx + 10, posy + 5))
@@ -2,10 +2,12 @@ from .human import Human
 from .random import RandomBot
 from .minimax import MiniMaxBot
 from .montecarlo import MonteCarloBot
+from .solver import SolverBot
 
 __all__ = [
     'Human',
     'RandomBot',
     'MiniMaxBot',
-    'MonteCarloBot'
+    'MonteCarloBot',
+    'SolverBot'
 ]
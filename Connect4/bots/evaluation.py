@@ -9,6 +9,41 @@ description:
 Support class for minimax agent. Helps determine the 
 best move for the minimax agent.
 """
+import numpy as np
+from functools import lru_cache
+from board.board import winning_lines
+
+"""
+function name: board_windows
+precondition: amount of rows and columns, window length
+postcondition: returns every window as a tuple of (row, col) cells
+
+description:
+Lists the windows in the same order score_position scores them:
+horizontal, vertical, positive sloped and negative sloped diagonals.
+They are the winning lines of the board, turned from flat indexes
+into cells.
+"""
+@lru_cache(maxsize=None)
+def board_windows(rows, columns, length):
+    return tuple(tuple(divmod(int(cell), columns) for cell in line) for line in winning_lines(rows, columns, length))
+
+"""
+function name: cell_windows
+precondition: amount of rows and columns, window length
+postcondition: returns cells[row][col] = indexes of the windows holding that cell
+
+description:
+Lets an incremental evaluator touch only the windows a new piece is in
+"""
+@lru_cache(maxsize=None)
+def cell_windows(rows, columns, length):
+    cells = [[[] for c in range(columns)] for r in range(rows)]
+    for index, window in enumerate(board_windows(rows, columns, length)):
+        for r, c in window:
+            cells[r][c].append(index)
+    return tuple(tuple(tuple(w) for w in row) for row in cells)
+
 class Evaluation:
 
     """
@@ -33,18 +68,20 @@ class Evaluation:
     
     Description: 
     Given a board and window, the function gives a score depending
-    on how many of the same pieces are by each other.
+    on how many of the same pieces are by each other. The counts are
+    relative to the window length, so connect 5 scores 5, 4 and 3 pieces.
     """
     def evaluate_window(self, board, window):
         score = 0
-        if window.count(self.bot_piece) == 4:
+        length = len(window)
+        if window.count(self.bot_piece) == length:
             score += 100
-        elif window.count(self.bot_piece) == 3 and window.count(board.EMPTY) == 1:
+        elif window.count(self.bot_piece) == length - 1 and window.count(board.EMPTY) == 1:
             score += 5
-        elif window.count(self.bot_piece) == 2 and window.count(board.EMPTY) == 2:
+        elif window.count(self.bot_piece) == length - 2 and window.count(board.EMPTY) == 2:
             score += 2
 
-        if window.count(self.opp_piece) == 3 and window.count(board.EMPTY) == 1:
+        if window.count(self.opp_piece) == length - 1 and window.count(board.EMPTY) == 1:
             score -= 4
 
         return score
@@ -60,36 +97,38 @@ class Evaluation:
     """
     def score_position(self, board):
         score = 0
+        grid = board.get_board()
+        last = board.WINDOW_LENGTH - 1      #windows start this far from the edge
 
 		## Score center column
-        center_array = [int(i) for i in list(board.get_board()[:, board.COLUMN_COUNT//2])]
+        center_array = [int(i) for i in list(grid[:, board.COLUMN_COUNT//2])]
         center_count = center_array.count(self.bot_piece)
         score += center_count * 3
 
 		## Score Horizontal
         for r in range(board.ROW_COUNT):
-            row_array = [int(i) for i in list(board.get_board()[r,:])]
-            for c in range(board.COLUMN_COUNT-3):
+            row_array = [int(i) for i in list(grid[r,:])]
+            for c in range(board.COLUMN_COUNT-last):
                 window = row_array[c:c+board.WINDOW_LENGTH]
                 score += self.evaluate_window(board, window)
 
 		## Score Vertical
         for c in range(board.COLUMN_COUNT):
-            col_array = [int(i) for i in list(board.get_board()[:,c])]
-            for r in range(board.ROW_COUNT-3):
+            col_array = [int(i) for i in list(grid[:,c])]
+            for r in range(board.ROW_COUNT-last):
                 window = col_array[r:r+board.WINDOW_LENGTH]
                 score += self.evaluate_window(board, window)
 
 		## Score positive sloped diagonal
-        for r in range(board.ROW_COUNT-3):
-            for c in range(board.COLUMN_COUNT-3):
-                window = [board.get_board()[r+i][c+i] for i in range(board.WINDOW_LENGTH)]
+        for r in range(board.ROW_COUNT-last):
+            for c in range(board.COLUMN_COUNT-last):
+                window = [grid[r+i][c+i] for i in range(board.WINDOW_LENGTH)]
                 score += self.evaluate_window(board, window)
 
 		## Score negative sloped diagonal
-        for r in range(board.ROW_COUNT-3):
-            for c in range(board.COLUMN_COUNT-3):
-                window = [board.get_board()[r+3-i][c+i] for i in range(board.WINDOW_LENGTH)]
+        for r in range(board.ROW_COUNT-last):
+            for c in range(board.COLUMN_COUNT-last):
+                window = [grid[r+last-i][c+i] for i in range(board.WINDOW_LENGTH)]
                 score += self.evaluate_window(board, window)
 
         return score
@@ -104,3 +143,164 @@ class Evaluation:
     """
     def is_terminal_node(self, board):
         return board.winning_move(self.bot_piece) or board.winning_move(self.opp_piece) or len(board.get_valid_locations()) == 0
+
+class IncrementalEvaluation(Evaluation):
+
+    """
+    function name: __init__
+    precondition: funciton is initialized
+    postcondition: sets the pieces, the counts are made by reset
+
+    description:
+    Every window keeps a code of bot_count * (length+1) + opp_count and
+    window_scores[code] is what evaluate_window gives for those counts.
+    total is always equal to score_position of the tracked board.
+    """
+    def __init__(self, piece):
+        super().__init__(piece)
+        self.total = 0
+        self.window_codes = []
+        self.window_scores = []
+        self.cells = ()
+        self.center = 0
+        self.step = 0
+
+    """
+    function name: reset
+    precondition: board state
+    postcondition: window counts and total match the board
+
+    description:
+    Rebuilds the counts from the whole board, needed once before
+    add_piece and remove_piece are used
+    """
+    def reset(self, board):
+        length = board.WINDOW_LENGTH
+        self.step = length + 1
+        self.center = board.COLUMN_COUNT // 2
+        self.cells = cell_windows(board.ROW_COUNT, board.COLUMN_COUNT, length)
+
+        # score every possible (bot, opp) count with the normal window scoring
+        self.window_scores = [0] * (self.step * self.step)
+        for bot in range(length+1):
+            for opp in range(length+1-bot):
+                window = [self.bot_piece]*bot + [self.opp_piece]*opp + [board.EMPTY]*(length-bot-opp)
+                self.window_scores[bot*self.step + opp] = self.evaluate_window(board, window)
+
+        self.window_codes = [0] * len(board_windows(board.ROW_COUNT, board.COLUMN_COUNT, length))
+        self.total = self.window_scores[0] * len(self.window_codes)
+        for r in range(board.ROW_COUNT):
+            for c in range(board.COLUMN_COUNT):
+                piece = board.get_row_col(r, c)
+                if piece != board.EMPTY:
+                    self.add_piece(r, c, piece)
+
+    """
+    function name: add_piece
+    precondition: reset was called, a piece was dropped at row and col
+    postcondition: total is updated
+
+    description:
+    Only the windows through the new piece change, so this is O(1)
+    """
+    def add_piece(self, row, col, piece):
+        step = self.step if piece == self.bot_piece else 1
+        codes = self.window_codes
+        scores = self.window_scores
+        total = self.total
+        for w in self.cells[row][col]:
+            code = codes[w]
+            total += scores[code + step] - scores[code]
+            codes[w] = code + step
+        if col == self.center and piece == self.bot_piece:
+            total += 3
+        self.total = total
+
+    """
+    function name: remove_piece
+    precondition: reset was called, the piece at row and col was undone
+    postcondition: total is updated
+
+    description:
+    Reverse of add_piece
+    """
+    def remove_piece(self, row, col, piece):
+        step = self.step if piece == self.bot_piece else 1
+        codes = self.window_codes
+        scores = self.window_scores
+        total = self.total
+        for w in self.cells[row][col]:
+            code = codes[w]
+            total += scores[code - step] - scores[code]
+            codes[w] = code - step
+        if col == self.center and piece == self.bot_piece:
+            total -= 3
+        self.total = total
+
+class VectorEvaluation(Evaluation):
+
+    """
+    function name: __init__
+    precondition: funciton is initialized
+    postcondition: sets the pieces, the tables are made on first use
+
+    description:
+    Scores boards with numpy instead of python loops. All windows are
+    gathered at once through an (windows, length) table of flat cell indexes.
+    """
+    def __init__(self, piece):
+        super().__init__(piece)
+        self.shape = None
+        self.window_index = None
+        self.window_scores = None
+        self.center_index = None
+
+    """
+    function name: build_tables
+    precondition: board
+    postcondition: index and score tables match the board size
+
+    description:
+    window_scores[bot_count, opp_count] is what evaluate_window gives for those counts
+    """
+    def build_tables(self, board):
+        length = board.WINDOW_LENGTH
+        rows, columns = board.ROW_COUNT, board.COLUMN_COUNT
+        self.shape = (rows, columns, length)
+        self.window_index = np.array([[r*columns + c for r, c in window]
+                                      for window in board_windows(rows, columns, length)], dtype=np.intp)
+        self.center_index = np.arange(rows) * columns + columns // 2
+        self.window_scores = np.zeros((length+1, length+1), dtype=np.int64)
+        for bot in range(length+1):
+            for opp in range(length+1-bot):
+                window = [self.bot_piece]*bot + [self.opp_piece]*opp + [board.EMPTY]*(length-bot-opp)
+                self.window_scores[bot, opp] = self.evaluate_window(board, window)
+
+    """
+    function name: score_position
+    precondition: board state
+    postcondition: returns the same score as Evaluation.score_position
+
+    description:
+    One gather of every window and one sum, no python loop over windows
+    """
+    def score_position(self, board):
+        return int(self.score_batch(board.get_board()[np.newaxis], board)[0])
+
+    """
+    function name: score_batch
+    precondition: grids of shape (N, rows, columns), a board of the same size
+    postcondition: returns the N scores as a numpy array
+
+    description:
+    Scores a stack of boards in one call, for example all children of a node
+    """
+    def score_batch(self, grids, board):
+        if self.shape != (board.ROW_COUNT, board.COLUMN_COUNT, board.WINDOW_LENGTH):
+            self.build_tables(board)
+        flat = grids.reshape(len(grids), -1)
+        windows = flat[:, self.window_index]                         #(N, windows, length)
+        bot = (windows == self.bot_piece).sum(axis=2)
+        opp = (windows == self.opp_piece).sum(axis=2)
+        center = (flat[:, self.center_index] == self.bot_piece).sum(axis=1)
+        return self.window_scores[bot, opp].sum(axis=1) + center * 3
@@ -8,12 +8,10 @@ Last Modification Date: 4/25/2021
 description: 
 class to handle human player moves. 
 """
-import pygame
 import math
-import sys
-from board.graphics import GBoard
+from bots.stats import Instrumented
 
-class Human:
+class Human(Instrumented):
 
     """
     function name: __init__
@@ -36,6 +34,9 @@ class Human:
     follows human player's mouse and gets desired move
     """
     def get_move(self, board):
+        import pygame                           #only a game with the UI loads pygame
+        from board.graphics import GBoard
+        from board.events import EventLoop
         gb = GBoard(board)
         gb.draw_gboard(board)
 
@@ -45,20 +46,29 @@ class Human:
             else:
                 self.colour = gb.YELLOW
 
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
+        top = (0, 0, gb.width, gb.SQUARESIZE)        #only the row above the board changes while choosing
+        posx = None
 
-                if event.type == pygame.MOUSEMOTION:
-                    gb.draw_rect(gb.BLACK, (0, 0, gb.width, gb.SQUARESIZE))
-                    posx = event.pos[0]
-                    gb.draw_circle(self.colour, (posx, int(gb.SQUARESIZE/2)), gb.RADIUS)
+        def draw():                                 #the piece follows the mouse above the board
+            gb.draw_rect(gb.BLACK, top)
+            if posx is not None:
+                gb.draw_circle(self.colour, (posx, int(gb.SQUARESIZE/2)), gb.RADIUS)
+            gb.update_gboard([top])
 
-                gb.update_gboard()
+        loop = EventLoop(draw)
 
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    gb.draw_rect(gb.BLACK, (0, 0, gb.width, gb.SQUARESIZE))
-                    posx = event.pos[0]
-                    col = int(math.floor(posx/gb.SQUARESIZE))
-                    return col
+        def motion(event):
+            nonlocal posx
+            posx = event.pos[0]
+            loop.redraw()
+
+        def click(event):
+            loop.stop(int(math.floor(event.pos[0]/gb.SQUARESIZE)))
+
+        loop.on(pygame.MOUSEMOTION, motion)
+        loop.on(pygame.MOUSEBUTTONDOWN, click)
+        col = loop.run()                            #sleeps until the mouse moves or clicks
+
+        gb.draw_rect(gb.BLACK, top)
+        gb.update_gboard([top])
+        return col
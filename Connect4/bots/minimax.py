@@ -9,37 +9,114 @@ description:
 Holds the minimax agent. Evaluates board states and finds the 
 best move.
 """
-import random
 import math
-from bots.evaluation import Evaluation
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from bots.evaluation import IncrementalEvaluation, VectorEvaluation
+from bots.transposition import TranspositionTable
+from bots.ordering import MoveOrdering
+from bots.stats import Instrumented, SearchStats
+from bots.ponder import Pondering
+
+class SearchTimeout(Exception):
+	# raised inside the search when the time budget of the move is used up
+	pass
+
+class SearchCancelled(SearchTimeout):
+	# raised inside the search after cancel was called, get_move passes it on
+	pass
     
-class MiniMaxBot(Evaluation):
-	def __init__(self, piece, depth=5):
+class MiniMaxBot(IncrementalEvaluation, Instrumented, Pondering):
+	WIN_SCORE = 100000000000000
+	LOSS_SCORE = -10000000000000
+	# xored into the table key when player 2 is to move. The zobrist key of the
+	# board only holds the stones, the same stones with the other player to move
+	# are another position with another value.
+	SIDE_KEY = 0x5D588B656C078965
+
+	def __init__(self, piece, depth=5, timeout=None, tt_size=1 << 18, ordering=None, incremental=True, batch=False, workers=1):
 		super().__init__(piece)
-		self.depth = depth
+		self.workers = workers      # processes that split the root moves, 1 searches in this process
+		self.executor = None        # made on the first parallel search and kept for the whole game
+		self.incremental = incremental  # keep the leaf score up to date while moving instead of rescanning the board
+		self.vector = VectorEvaluation(piece) if batch else None   # scores all children of a depth 1 node in one numpy call
+		self.depth = depth          # search depth, used when there is no timeout
+		self.timeout = timeout      # seconds per move, searches deeper until they are used up
+		self.deadline = None
+		self.cancelled = False      # set by cancel from another thread, every search stops at its next check
+		self.ordering = ordering if ordering is not None else MoveOrdering()
+		self.root_filled = 0        # slots filled at the root, to know the ply of a node
+		# nodes and cutoffs are counted with the stats off too: the node count times
+		# the deadline and cancel checks and is reported by pondering, the parallel
+		# root and the server, and a cutoff is counted in the branch that already
+		# updates the move ordering, so a stats check would cost as much as the count
+		self.nodes = 0              # nodes searched for the last move
+		self.cutoffs = 0            # alpha-beta cutoffs for the last move
+		self.depth_reached = 0      # depth of the last completed search for the last move
+		self.depth_times = []       # seconds every completed depth of the iterative deepening took
+		self.tt = TranspositionTable(tt_size)  # kept for the whole game, hits and misses are counted in the table
+		self.ponder_nodes = {}      # zobrist key of a position searched while pondering -> nodes spent on it
 
 	def minimax(self, board, depth, alpha, beta, maximizingPlayer):
+		self.nodes += 1
+		key = board.zobrist_key
+		if board.CURR_PLAYER == board.PLAYER2_PIECE:
+			key ^= self.SIDE_KEY
+		if self.nodes & 255 == 0:
+			if self.cancelled or self.ponder_stop:
+				raise SearchCancelled()
+			if self.deadline is not None and time.perf_counter() > self.deadline:
+				raise SearchTimeout()
+
+		# only entries searched to the same depth are used, so the result is the
+		# same as a search without the table, just reached with fewer nodes
+		entry = self.tt.probe(key)
+		if entry is not None and entry[1] == depth:
+			if entry[3] == TranspositionTable.EXACT:
+				return entry[4], entry[2]
+			elif entry[3] == TranspositionTable.LOWERBOUND:
+				alpha = max(alpha, entry[2])
+			else:
+				beta = min(beta, entry[2])
+			if alpha >= beta:
+				return entry[4], entry[2]
+		alpha_orig, beta_orig = alpha, beta
+
 		valid_locations = board.get_valid_locations()
 		is_terminal = super().is_terminal_node(board)
 
 		if depth == 0 or is_terminal:
 			if is_terminal:
 				if board.winning_move(self.bot_piece):
-					return (None, 100000000000000)
+					value = self.WIN_SCORE
 				elif board.winning_move(self.opp_piece):
-					return (None, -10000000000000)
+					value = self.LOSS_SCORE
 				else: # Game is over, no more valid moves
-					return (None, 0)
-			else: # Depth is zero
-				return (None, super().score_position(board))
+					value = 0
+			elif self.incremental: # Depth is zero
+				value = self.total
+			else:
+				value = super().score_position(board)
+			self.tt.store(key, depth, value, TranspositionTable.EXACT, None)
+			return (None, value)
+
+		# search the most promising columns first, the best move stored for this position
+		# by an earlier search (the principal variation) can lead
+		piece = self.bot_piece if maximizingPlayer else self.opp_piece
+		ply = board.num_slots_filled - self.root_filled
+		valid_locations = self.ordering.order(board, valid_locations, piece, ply, entry[4] if entry is not None else None)
+		column = valid_locations[0]
+
+		if depth == 1 and self.vector is not None:
+			return self.frontier(board, alpha_orig, beta_orig, maximizingPlayer, valid_locations)
 
 		if maximizingPlayer:
 			value = -math.inf
-			column = random.choice(valid_locations)
 			for col in valid_locations:
-				b_copy = board.copy_board()
-				b_copy.drop_piece(col, self.bot_piece)
-				new_score = self.minimax(b_copy, depth-1, alpha, beta, False)[1]
+				self.play(board, col, self.bot_piece)
+				new_score = self.minimax(board, depth-1, alpha, beta, False)[1]
+				self.unplay(board)
 
 				if new_score > value:
 					value = new_score
@@ -47,15 +124,17 @@ class MiniMaxBot(Evaluation):
 
 				alpha = max(alpha, value)
 				if alpha >= beta:
+					self.cutoffs += 1
+					self.ordering.cutoff(col, piece, ply, depth)
 					break
+			self.store(key, depth, alpha_orig, beta_orig, column, value)
 			return column, value
 		else: # Minimizing player
 			value = math.inf
-			column = random.choice(valid_locations)
 			for col in valid_locations:
-				b_copy = board.copy_board()
-				b_copy.drop_piece(col, self.opp_piece)
-				new_score = self.minimax(b_copy, depth-1, alpha, beta, True)[1]
+				self.play(board, col, self.opp_piece)
+				new_score = self.minimax(board, depth-1, alpha, beta, True)[1]
+				self.unplay(board)
 
 				if new_score < value:
 					value = new_score
@@ -63,9 +142,256 @@ class MiniMaxBot(Evaluation):
 
 				beta = min(beta, value)
 				if alpha >= beta:
+					self.cutoffs += 1
+					self.ordering.cutoff(col, piece, ply, depth)
 					break
+			self.store(key, depth, alpha_orig, beta_orig, column, value)
 			return column, value
 
+	def frontier(self, board, alpha, beta, maximizingPlayer, valid_locations):
+		# children that end the game get their terminal score, the rest are scored together
+		piece = self.bot_piece if maximizingPlayer else self.opp_piece
+		values = [None] * len(valid_locations)
+		grids = []
+		for i, col in enumerate(valid_locations):
+			board.drop_piece(col, piece)
+			if board.winning_move(piece):
+				values[i] = self.WIN_SCORE if maximizingPlayer else self.LOSS_SCORE
+			elif not board.get_valid_locations():
+				values[i] = 0
+			else:
+				grids.append(board.get_board().copy())
+			board.undo_move()
+		self.nodes += len(valid_locations)
+
+		if grids:
+			scores = iter(self.vector.score_batch(np.stack(grids), board).tolist())
+			values = [next(scores) if v is None else v for v in values]
+
+		value = max(values) if maximizingPlayer else min(values)
+		column = valid_locations[values.index(value)]
+		self.store(self.tt_key(board), 1, alpha, beta, column, value)
+		return column, value
+
+	def play(self, board, col, piece):
+		board.drop_piece(col, piece)
+		if self.incremental:
+			self.add_piece(board.move_stack[-1][1], col, piece)
+
+	def unplay(self, board):
+		if self.incremental:
+			col, row = board.move_stack[-1][:2]
+			self.remove_piece(row, col, board.PREV_PLAYER)
+		board.undo_move()
+
+	def tt_key(self, board):
+		# key of the position in the table, the stones and the player to move
+		if board.CURR_PLAYER == board.PLAYER2_PIECE:
+			return board.zobrist_key ^ self.SIDE_KEY
+		return board.zobrist_key
+
+	def store(self, key, depth, alpha, beta, column, value):
+		# alpha and beta are the bounds the node was searched with
+		if value <= alpha:
+			flag = TranspositionTable.UPPERBOUND
+		elif value >= beta:
+			flag = TranspositionTable.LOWERBOUND
+		else:
+			flag = TranspositionTable.EXACT
+		self.tt.store(key, depth, value, flag, column)
+
+	def iterative_deepening(self, board):
+		# depth 1 always finishes, so there is a move even with a tiny budget
+		self.deadline = None
+		col = None
+		max_depth = board.ROW_COUNT * board.COLUMN_COUNT - board.num_slots_filled
+		start = time.perf_counter()
+		for depth in range(1, max_depth + 1):
+			depth_start = time.perf_counter()
+			try:
+				col, minimax_score = self.search_root(board, depth)
+			except SearchCancelled:
+				raise
+			except SearchTimeout:
+				break
+			finally:
+				self.deadline = start + self.timeout
+			self.depth_reached = depth
+			self.depth_times.append(time.perf_counter() - depth_start)
+			if minimax_score >= self.WIN_SCORE or minimax_score <= self.LOSS_SCORE:
+				break   # the result is forced, searching deeper will not change it
+			if time.perf_counter() > self.deadline:
+				break
+		self.deadline = None
+		return col
+
 	def get_move(self, board):
-		col, minimax_score = self.minimax(board, self.depth, -math.inf, math.inf, True)
+		self.stop_pondering()
+		# the opponent's reply was searched while pondering if its position is in ponder_nodes
+		self.pondered = self.ponder_nodes.get(self.tt_key(board), 0)
+		self.ponder_nodes = {}
+		self.nodes = self.cutoffs = 0
+		self.depth_times = []
+		self.root_filled = board.num_slots_filled
+		self.ordering.new_search()
+		if self.incremental:
+			self.reset(board)
+		# the search drops and undoes moves on a single copy of the game board
+		if self.timeout is not None:
+			return self.iterative_deepening(board.copy_board())
+		col, minimax_score = self.search_root(board.copy_board(), self.depth)
+		self.depth_reached = self.depth
 		return col
+
+	def search_root(self, board, depth):
+		if self.workers > 1 and depth > 1 and not super().is_terminal_node(board):
+			return self.root_parallel(board, depth)
+		return self.minimax(board, depth, -math.inf, math.inf, True)
+
+	def root_parallel(self, board, depth):
+		# Young Brothers Wait: the first (best ordered) column is searched here to get an
+		# alpha bound, then the other columns are split over the worker processes. Every
+		# column is sent with the best value known at that time, so later columns prune
+		# more. The value is the same as the serial search, the column can differ when
+		# columns tie: a column that fails low is only known to be no better than best,
+		# and the workers order their moves with fresh killers and tables.
+		if self.executor is None:
+			self.executor = ProcessPoolExecutor(max_workers=self.workers)
+		entry = self.tt.probe(self.tt_key(board))
+		moves = self.ordering.order(board, board.get_valid_locations(), self.bot_piece, 0, entry[4] if entry is not None else None)
+
+		self.play(board, moves[0], self.bot_piece)
+		best = self.minimax(board, depth-1, -math.inf, math.inf, False)[1]
+		self.unplay(board)
+		values = {moves[0]: best}
+
+		timeout = None if self.deadline is None else self.deadline - time.perf_counter()
+		options = self.worker_options()
+		remaining = iter(moves[1:])
+		pending = set()
+		timed_out = False
+		while True:
+			while len(pending) < self.workers and not timed_out:
+				col = next(remaining, None)
+				if col is None:
+					break
+				pending.add(self.executor.submit(search_root_move, board, col, self.bot_piece, depth, best, timeout, options))
+			if not pending:
+				break
+			# wakes up now and then to see if the search was cancelled, the columns
+			# already running in the workers are left to finish on their own
+			done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+			if self.cancelled:
+				for future in pending:
+					future.cancel()
+				raise SearchCancelled()
+			for future in done:
+				col, value, nodes = future.result()
+				self.nodes += nodes
+				if value is None:
+					timed_out = True
+				else:
+					values[col] = value
+					best = max(best, value)
+		if timed_out:
+			raise SearchTimeout()
+
+		value = max(values.values())
+		column = next(col for col in moves if values[col] == value)
+		self.tt.store(self.tt_key(board), depth, value, TranspositionTable.EXACT, column)
+		return column, value
+
+	def search_child(self, board, col, depth, alpha, timeout):
+		# runs in a worker process: searches one root column with the window (alpha, inf)
+		self.nodes = self.cutoffs = 0
+		self.root_filled = board.num_slots_filled
+		if self.incremental:
+			self.reset(board)
+		self.deadline = None if timeout is None else time.perf_counter() + timeout
+		self.play(board, col, self.bot_piece)
+		try:
+			value = self.minimax(board, depth-1, alpha, math.inf, False)[1]
+		except SearchTimeout:
+			value = None
+		finally:
+			self.deadline = None
+		return col, value, self.nodes
+
+	def stats_snapshot(self):
+		return self.tt.hits, self.tt.misses
+
+	def search_stats(self, before):
+		# the effective branching factor is the one a uniform tree of the same size would have
+		hits = self.tt.hits - before[0]
+		probes = hits + self.tt.misses - before[1]
+		depth = self.depth_reached
+		return SearchStats(
+			type(self).__name__,
+			nodes = self.nodes,
+			cutoffs = self.cutoffs,
+			tt_hits = hits,
+			tt_probes = probes,
+			depth = depth,
+			branching_factor = self.nodes ** (1 / depth) if depth and self.nodes else 0.0,
+			pondered = self.pondered,
+			phases = {'depth %d' % (i + 1): seconds for i, seconds in enumerate(self.depth_times)},
+		)
+
+	def worker_options(self):
+		# hashable settings, the workers build (and keep) a bot with the same settings
+		return (
+			('tt_size', self.tt.size),
+			('incremental', self.incremental),
+			('batch', self.vector is not None),
+			('ordering', (self.ordering.center, self.ordering.killers, self.ordering.history, self.ordering.tt_move)),
+		)
+
+	def ponder(self, board):
+		# searches the position after every reply of the opponent, the likeliest
+		# reply first, and leaves the results in the transposition table. A bot with
+		# a fixed depth searches every reply to that depth, so the next get_move finds
+		# its root in the table. A bot with a timeout deepens all replies together.
+		# The workers are not used, their tables are not the one get_move starts from.
+		entry = self.tt.probe(self.tt_key(board))
+		replies = self.ordering.order(board, board.get_valid_locations(), self.opp_piece, 0, entry[4] if entry is not None else None)
+		max_depth = board.ROW_COUNT * board.COLUMN_COUNT - board.num_slots_filled - 1
+		depths = range(1, max_depth + 1) if self.timeout is not None else (self.depth,)
+		self.ordering.new_search()
+		if self.incremental:
+			self.reset(board)
+		self.root_filled = board.num_slots_filled + 1
+		try:
+			for depth in depths:
+				for col in replies:
+					self.nodes = 0
+					self.play(board, col, self.opp_piece)
+					try:
+						if not super().is_terminal_node(board):
+							self.minimax(board, depth, -math.inf, math.inf, True)
+						key = self.tt_key(board)
+						self.ponder_nodes[key] = self.ponder_nodes.get(key, 0) + self.nodes
+					finally:
+						self.unplay(board)
+		except SearchCancelled:
+			pass
+
+	def cancel(self):
+		# safe to call from another thread: the search in progress raises SearchCancelled
+		# within 256 nodes, and so does every later search of this bot
+		self.cancelled = True
+
+	def close(self):
+		if self.executor is not None:
+			self.executor.shutdown()
+			self.executor = None
+
+# bots of every worker process, kept between moves so their tables stay warm
+worker_bots = {}
+
+def search_root_move(board, col, piece, depth, alpha, timeout, options):
+	bot = worker_bots.get((piece, options))
+	if bot is None:
+		settings = dict(options)
+		settings['ordering'] = MoveOrdering(*settings['ordering'])
+		bot = worker_bots[(piece, options)] = MiniMaxBot(piece, **settings)
+	return bot.search_child(board, col, depth, alpha, timeout)
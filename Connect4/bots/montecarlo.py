@@ -9,58 +9,123 @@ description:
 Holds the montecarlo agent. Evaluates board states and finds the 
 best move.
 """
-import numpy as np
+import math
 import sys
-import copy
+import pickle
 import time
 import random
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from board import BitBoard
+from bots.rollout import RolloutEngine
+from bots.selection import UCTPolicy
+from bots.stats import Instrumented, SearchStats
+from bots.ponder import Pondering
 
-class MonteCarloBot():
-    def __init__(self, piece, max_iterations = 20000 , timeout = 2):
+class MonteCarloBot(Instrumented, Pondering):
+    def __init__(self, piece, max_iterations = 20000 , timeout = 2, workers = 1, parallel = 'root', leaf_batch = 8, rollouts = 1, policy = None, ponder_limit = 200000):
         self.piece = piece
         self.max_iterations = max_iterations
         self.timeout = timeout
-        self.currentNode = None
+        self.currentNode = None         # node of the position after our last move, its subtree is reused
+        self.current_key = None         # zobrist key of that position, to check the game went on from it
+        self.inherited = 0              # playouts the root already had when the last move started
+        self.workers = workers          # processes used for the search, 1 searches in this process
+        self.parallel = parallel        # 'root': one tree per worker, 'leaf': one tree, rollouts on the workers
+        self.leaf_batch = leaf_batch    # rollouts every worker runs for one expanded node in 'leaf' mode
+        self.executor = None            # made on the first parallel search and kept for the whole game
+        self.cancelled = False          # set by cancel from another thread, the search stops after the iteration
+        self.ponder_visits = None       # visits of every reply of the opponent before pondering started
+        self.ponder_limit = ponder_limit    # nodes the tree may grow to while pondering (about 270 bytes each)
+        self.rollouts = rollouts        # rollouts per expanded node in this process, more than 1 plays them as a numpy batch
+        self.engine = RolloutEngine()
+        self.policy = policy if policy is not None else UCTPolicy()     # picks the child to walk down to
+        self.playouts = 0               # playouts of the last move
+        self.nodes_created = 0          # nodes added to the tree for the last move
+        self.worker_rates = []          # playouts per second of every worker for the last move
+        self.search_time = 0            # seconds the tree search of the last move took
+        self.tree_shape = (0, 0.0)      # (deepest node, mean children of expanded nodes), only measured with stats on
 
-    def montecarlo_tree_search(self, board, max_iterations, currentNode, timeout = 100):
+    def montecarlo_tree_search(self, board, max_iterations, currentNode, timeout = 100, max_nodes = None):
+        # max_nodes caps the nodes the search adds, after that the playouts start from
+        # the node the selection stopped at and only refine the visits already in the tree
         rootnode = Node(piece=board.PREV_PLAYER, board=board)
 
         if currentNode is not None:
             rootnode = currentNode
 
+        leaf_parallel = self.workers > 1 and self.parallel == 'leaf'
+        if leaf_parallel and self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        worker_playouts = {}
+        self.playouts = 0
+        self.nodes_created = 0
+
+        # the moves are replayed on a bitboard copy, which is much cheaper to copy and drop on
+        root_state = BitBoard.from_board(board)
+        self.policy.prepare(root_state)
+
         start = time.perf_counter()
         for i in range(max_iterations):
             node = rootnode
-            state = board.copy_board()
+            state = root_state.copy_board()
 
             # selection
             # keep going down the tree based on best UCT values until terminal or unexpanded node
             while node.available_moves == [] and node.children != []:
-                node = node.selection()
+                node = self.policy.select(node)
                 state.drop_piece(node.move, state.CURR_PLAYER)
 
             # expand
-            if node.available_moves != []:
+            if node.available_moves != [] and (max_nodes is None or self.nodes_created < max_nodes):
                 col = random.choice(node.available_moves)
                 state.drop_piece(col, state.CURR_PLAYER)
                 node = node.expand(col, state)
+                self.nodes_created += 1
 
-            # rollout
-            while state.get_valid_locations():
-                col = random.choice(state.get_valid_locations())
-                state.drop_piece(col, state.CURR_PLAYER)
-                if state.winning_move(state.PREV_PLAYER):
-                    break
+            if leaf_parallel:
+                # rollout a batch on every worker and backpropagate every result,
+                # the state is pickled once and the same bytes go to every worker
+                payload = pickle.dumps(state)
+                futures = [self.executor.submit(leaf_rollouts, payload, self.leaf_batch, random.getrandbits(32)) for _ in range(self.workers)]
+                winners = []
+                for future in futures:
+                    results, pid = future.result()
+                    worker_playouts[pid] = worker_playouts.get(pid, 0) + len(results)
+                    winners.extend(results)
+            elif self.rollouts > 1:
+                # rollout a batch of games in lockstep
+                winners = self.engine.rollout_batch(state, self.rollouts).tolist()
+            else:
+                # rollout
+                winners = [self.engine.rollout(state)]
 
             # backpropagate
-            while node is not None:
-                node.update(state.search_result(node.piece))
-                node = node.parent
+            for winner in winners:
+                leaf = node
+                while leaf is not None:
+                    if winner == leaf.piece:
+                        leaf.update(1)
+                    elif winner == RolloutEngine.DRAW:
+                        leaf.update(0.5)
+                    else:
+                        leaf.update(0)
+                    leaf = leaf.parent
+            self.playouts += len(winners)
 
             duration = time.perf_counter() - start
-            if duration > timeout:
+            if duration > timeout or self.cancelled or self.ponder_stop:
                 break
 
+        duration = time.perf_counter() - start
+        self.search_time = duration
+        if self.collect_stats:
+            self.tree_shape = self.measure_tree(rootnode)
+        if leaf_parallel:
+            self.worker_rates = [count / duration for count in worker_playouts.values()]
+        else:
+            self.worker_rates = [self.playouts / duration]
+
         win_ratio = lambda x: x.wins/x.visits
         sorted_children = sorted(rootnode.children, key = win_ratio)[::-1]
 
@@ -70,38 +135,201 @@ class MonteCarloBot():
 
         return rootnode, sorted_children[0].move
 
-    def get_child_node(self, node, board, move, piece):
-        for child in node.children:
-            if child.move == move:
-                return child
-        return Node(piece = piece, board = board)
+    def advance(self, node, move):
+        # makes the child of node for move the new root and lets go of its siblings,
+        # returns None if that move was never expanded
+        child = None
+        for c in node.children:
+            if c.move == move:
+                child = c
+        node.children = []
+        if child is not None:
+            child.parent = None
+        return child
+
+    def reuse_tree(self, board):
+        # the kept node is the position after our last move, the board should be
+        # that position plus the opponent's move
+        node = self.currentNode
+        self.currentNode = None
+        if node is None or not board.move_stack:
+            return None
+        col, row = board.move_stack[-1][:2]
+        if board.zobrist_key ^ board.ZOBRIST[board.PREV_PLAYER][row][col] != self.current_key:
+            return None
+        return self.advance(node, col)
+
+    def root_parallel_search(self, board):
+        # every worker grows its own tree from the same position, then the
+        # wins and visits of the root children are added up per move.
+        # The trees are thrown away, so there is no tree reuse in this mode.
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        iterations = [self.max_iterations // self.workers + (1 if i < self.max_iterations % self.workers else 0)
+                      for i in range(self.workers)]
+        futures = [self.executor.submit(root_tree_search, board, count, self.timeout, random.getrandbits(32), self.policy)
+                   for count in iterations if count > 0]
+        # wakes up now and then to see if the search was cancelled, then only the
+        # trees that are already done are counted
+        pending = futures
+        while pending:
+            done, pending = wait(pending, timeout=0.1)
+            if self.cancelled:
+                for future in pending:
+                    future.cancel()
+                futures = [future for future in futures if future.done() and not future.cancelled()]
+                break
+
+        wins = {}
+        visits = {}
+        self.playouts = 0
+        self.worker_rates = []
+        self.search_time = 0
+        for future in futures:
+            children, playouts, duration = future.result()
+            self.search_time = max(self.search_time, duration)
+            for move, child_wins, child_visits in children:
+                wins[move] = wins.get(move, 0) + child_wins
+                visits[move] = visits.get(move, 0) + child_visits
+            self.playouts += playouts
+            self.worker_rates.append(playouts / duration)
+        if not visits:
+            return random.choice(board.get_valid_locations())
+        return max(visits, key = lambda move: wins[move] / visits[move])
+
+    def tree_size(self, node = None):
+        # counts the nodes below (and including) node, the current tree by default
+        stack = [node if node is not None else self.currentNode]
+        count = 0
+        while stack:
+            node = stack.pop()
+            if node is not None:
+                count += 1
+                stack.extend(node.children)
+        return count
+
+    def measure_tree(self, node):
+        # walks the tree once, returns the deepest node and the mean amount of children of expanded nodes
+        stack = [(node, 0)]
+        deepest = 0
+        expanded = children = 0
+        while stack:
+            node, depth = stack.pop()
+            deepest = max(deepest, depth)
+            if node.children:
+                expanded += 1
+                children += len(node.children)
+                stack.extend((child, depth + 1) for child in node.children)
+        return deepest, children / expanded if expanded else 0.0
+
+    def search_stats(self, before):
+        depth, branching = self.tree_shape if self.workers == 1 or self.parallel == 'leaf' else (0, 0.0)
+        return SearchStats(
+            type(self).__name__,
+            nodes = self.nodes_created,
+            depth = depth,
+            playouts = self.playouts,
+            branching_factor = branching,
+            phases = {'search': self.search_time},
+            pondered = self.pondered,
+        )
+
+    def ponder(self, board):
+        # keeps growing the kept tree from the position after our move, every playout
+        # that goes through the reply the opponent plays is still in the tree for get_move.
+        # Root parallel searches keep no tree, so they do not ponder. The tree stops
+        # growing at ponder_limit nodes, the opponent may take much longer than a move of ours.
+        node = self.currentNode
+        if node is None or self.workers > 1 and self.parallel == 'root' or board.get_valid_locations() == []:
+            return
+        self.ponder_visits = {child.move: child.visits for child in node.children}
+        room = max(self.ponder_limit - self.tree_size(node), 0)
+        self.montecarlo_tree_search(board, sys.maxsize, node, math.inf, room)
+
+    def cancel(self):
+        # safe to call from another thread: the search returns the best move it has so far.
+        # A root parallel search stops waiting for its workers, the trees still growing
+        # there are left out.
+        self.cancelled = True
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
 
     def get_move(self, board):
-        if self.currentNode is None:
-            self.currentNode = Node(piece=self.piece, board=board)
-        
-        if board.PREV_MOVE is not None:
-            self.currentNode = self.get_child_node(self.currentNode, board, board.PREV_MOVE, board.CURR_PLAYER)
-
-        self.currentNode, col = self.montecarlo_tree_search(board, self.max_iterations, self.currentNode, self.timeout)
-        self.currentNode = self.get_child_node(self.currentNode, board, col, board.PREV_PLAYER)
+        self.stop_pondering()
+        if self.workers > 1 and self.parallel == 'root':
+            return self.root_parallel_search(board)
+
+        # when the opponent's move was never expanded the search starts a new root
+        rootnode = self.reuse_tree(board)
+        self.inherited = rootnode.visits if rootnode is not None else 0
+        self.pondered = 0
+        if self.ponder_visits is not None:
+            # the playouts through the opponent's move that were run while pondering
+            self.pondered = self.inherited - self.ponder_visits.get(rootnode.move, 0) if rootnode is not None else 0
+            self.ponder_visits = None
+
+        rootnode, col = self.montecarlo_tree_search(board, self.max_iterations, rootnode, self.timeout)
+        row = board.get_next_open_row(col)
+        self.currentNode = self.advance(rootnode, col)
+        self.current_key = board.zobrist_key ^ board.ZOBRIST[board.CURR_PLAYER][row][col]
         return col
 
+"""
+function name: root_tree_search
+precondition: board, iterations, timeout, seed, selection policy
+postcondition: returns (move, wins, visits) of the root children, playouts and seconds
+
+description:
+Runs in a worker process for the root parallel search. The seed makes
+sure forked workers do not all play the same random games.
+"""
+def root_tree_search(board, max_iterations, timeout, seed, policy):
+    random.seed(seed)
+    bot = MonteCarloBot(board.CURR_PLAYER, policy = policy)
+    start = time.perf_counter()
+    rootnode, col = bot.montecarlo_tree_search(board, max_iterations, None, timeout)
+    children = [(child.move, child.wins, child.visits) for child in rootnode.children]
+    return children, bot.playouts, time.perf_counter() - start
+
+"""
+function name: leaf_rollouts
+precondition: pickled board state of an expanded node, amount of rollouts, seed
+postcondition: returns the winner of every rollout and the worker process id
+
+description:
+Runs in a worker process for the leaf parallel search. A winner is the
+piece that won the random game, or RolloutEngine.DRAW.
+"""
+def leaf_rollouts(payload, rollouts, seed):
+    random.seed(seed)
+    board = pickle.loads(payload)
+    engine = RolloutEngine()
+    return [engine.rollout(board) for _ in range(rollouts)], os.getpid()
+
 class Node:
+    # __slots__ keeps every node small so the tree can hold many more of them.
+    # The board is not kept on the node, the search replays the moves from the root.
+    __slots__ = ('parent', 'move', 'available_moves', 'children', 'wins', 'visits', 'piece')
+
     def __init__(self, piece, board, parent=None, move=None):
-        self.board = board.copy_board()
         self.parent = parent
         self.move = move
-        self.available_moves = board.get_valid_locations()
+        # a position where the last move won has no moves left to expand
+        if board.PREV_PLAYER is not None and board.winning_move(board.PREV_PLAYER):
+            self.available_moves = []
+        else:
+            self.available_moves = board.get_valid_locations()
         self.children = []
         self.wins = 0
         self.visits = 0
         self.piece = piece
 
-    def selection(self):
-        # return child with largest UCT value
-        uct_val = lambda x: x.wins / x.visits + np.sqrt(2 * np.log(self.visits) / x.visits)
-        return sorted(self.children, key = uct_val)[-1]
+    def selection(self, policy = None):
+        # return child with largest UCT value, or the best child for another policy
+        return (policy if policy is not None else UCT).select(self)
 
     def expand(self, move, board):
         # return child when move is taken
@@ -114,3 +342,5 @@ class Node:
     def update(self, result):
         self.wins += result
         self.visits += 1
+
+UCT = UCTPolicy()     #policy of Node.selection when none is given
@@ -0,0 +1,57 @@
+"""
+file name: ponder.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+description:
+Lets a bot search while the opponent is choosing its move. The game
+calls start_pondering after the bot's own move and stop_pondering once
+the opponent has moved. get_move stops it too, in case the game did not.
+The bot searches on a thread in between and keeps whatever it found,
+the next get_move starts from it.
+"""
+import threading
+
+class Pondering:
+    ponder_thread = None        # thread running ponder, None while the bot is not pondering
+    ponder_stop = False         # set by stop_pondering, the search checks it like a cancel
+    pondered = 0                # work done while pondering that the last move could use
+
+    """
+    function name: start_pondering
+    precondition: board after the bot's own move
+    postcondition: ponder runs on a thread on a copy of the board
+    """
+    def start_pondering(self, board):
+        self.stop_pondering()
+        self.ponder_stop = False
+        self.ponder_thread = threading.Thread(target = self.ponder, args = (board.copy_board(),), daemon = True)
+        self.ponder_thread.start()
+
+    """
+    function name: stop_pondering
+    precondition: none
+    postcondition: the pondering thread has finished
+
+    description:
+    Waits for the search to notice ponder_stop, which takes a few hundred nodes
+    """
+    def stop_pondering(self):
+        if self.ponder_thread is not None:
+            self.ponder_stop = True
+            self.ponder_thread.join()
+            self.ponder_thread = None
+            self.ponder_stop = False
+
+    """
+    function name: ponder
+    precondition: copy of the board, the opponent is to move
+    postcondition: none
+
+    description:
+    Bots override this, it should return soon after ponder_stop is set
+    """
+    def ponder(self, board):
+        pass
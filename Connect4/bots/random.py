@@ -1,8 +1,9 @@
 import random
+from bots.stats import Instrumented
 
-class RandomBot:
+class RandomBot(Instrumented):
     def __init__(self, piece):
         self.bot_piece = piece
 
     def get_move(self, board):
-        return random.randint(0, board.COLUMN_COUNT-1)
+        return random.choice(board.get_valid_locations())
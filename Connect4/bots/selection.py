@@ -0,0 +1,165 @@
+"""
+file name: selection.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+description:
+Support classes for the montecarlo agent. A selection policy picks the
+child to walk down to in the selection step. Every policy has a
+select(node) function and a prepare(board) function the bot calls with
+the root of every search, so new ones can be passed to MonteCarloBot:
+1. UCTPolicy: wins/visits + c * sqrt(ln(parent visits) / visits)
+2. ProgressiveBiasPolicy: UCT plus a heuristic bonus that fades with visits
+"""
+import math
+from functools import lru_cache
+
+"""
+function name: inv_sqrt_table
+precondition: size of the table
+postcondition: returns a tuple with 1/sqrt(n) at index n, and 0 at index 0
+
+description:
+Made once for every size and shared by all the policies of a process
+"""
+@lru_cache(maxsize=None)
+def inv_sqrt_table(size):
+    return (0.0,) + tuple(1 / math.sqrt(n) for n in range(1, size))
+
+class UCTPolicy:
+    TABLE_SIZE = 1 << 16        #visit counts with a precomputed 1/sqrt(n)
+
+    """
+    function name: __init__
+    precondition: exploration constant
+    postcondition: the table of 1/sqrt(n) is built
+
+    description:
+    The default constant sqrt(2) gives the same values as the original
+    wins/visits + sqrt(2 * ln(N) / visits)
+    """
+    def __init__(self, exploration = math.sqrt(2)):
+        self.exploration = exploration
+        self.inv_sqrt = inv_sqrt_table(self.TABLE_SIZE)
+
+    """
+    function name: __getstate__
+    precondition: none
+    postcondition: returns the state to pickle
+
+    description:
+    Leaves out the table, a policy sent to a worker process is then just
+    its parameters
+    """
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['inv_sqrt']
+        return state
+
+    """
+    function name: __setstate__
+    precondition: pickled state
+    postcondition: the policy has its parameters and the table again
+    """
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.inv_sqrt = inv_sqrt_table(self.TABLE_SIZE)
+
+    """
+    function name: prepare
+    precondition: board at the root of a search
+    postcondition: none
+
+    description:
+    UCT does not depend on the board
+    """
+    def prepare(self, board):
+        pass
+
+    """
+    function name: select
+    precondition: node with children that were all visited
+    postcondition: returns the child with the largest value
+
+    description:
+    One pass over the children, the log of the parent visits is taken
+    once and the square root of every child comes from the table
+    """
+    def select(self, node):
+        k = self.exploration * math.sqrt(math.log(node.visits))
+        inv_sqrt = self.inv_sqrt
+        size = self.TABLE_SIZE
+        best = None
+        best_value = -math.inf
+        for child in node.children:
+            n = child.visits
+            value = child.wins / n + k * (inv_sqrt[n] if n < size else n ** -0.5)
+            if value >= best_value:         #ties go to the last child, like the old sort did
+                best = child
+                best_value = value
+        return best
+
+class ProgressiveBiasPolicy(UCTPolicy):
+
+    """
+    function name: __init__
+    precondition: exploration constant, bias weight, heuristic
+    postcondition: none
+
+    description:
+    heuristic(move, columns) gives a value for a column of a board with
+    that many columns, by default columns close to the center are worth more
+    """
+    def __init__(self, exploration = math.sqrt(2), weight = 1.0, heuristic = None):
+        super().__init__(exploration)
+        self.weight = weight
+        self.heuristic = heuristic if heuristic is not None else center_preference
+        self.columns = 7            #width of the board, until prepare is called
+
+    """
+    function name: prepare
+    precondition: board at the root of a search
+    postcondition: the heuristic gets the width of this board
+    """
+    def prepare(self, board):
+        self.columns = board.COLUMN_COUNT
+
+    """
+    function name: select
+    precondition: node with children that were all visited
+    postcondition: returns the child with the largest value
+
+    description:
+    Adds weight * heuristic(move, columns) / (visits + 1), which guides the first
+    visits and matters less and less as the statistics grow
+    """
+    def select(self, node):
+        k = self.exploration * math.sqrt(math.log(node.visits))
+        inv_sqrt = self.inv_sqrt
+        size = self.TABLE_SIZE
+        columns = self.columns
+        best = None
+        best_value = -math.inf
+        for child in node.children:
+            n = child.visits
+            value = child.wins / n + k * (inv_sqrt[n] if n < size else n ** -0.5) \
+                + self.weight * self.heuristic(child.move, columns) / (n + 1)
+            if value >= best_value:
+                best = child
+                best_value = value
+        return best
+
+"""
+function name: center_preference
+precondition: column, columns of the board
+postcondition: returns 1 for the center column down to 0 for the sides
+
+description:
+Default heuristic of ProgressiveBiasPolicy. On an even board the two
+middle columns share the top value.
+"""
+def center_preference(move, columns):
+    center = (columns - 1) / 2
+    return 1 - abs(move - center) / center if center else 1.0
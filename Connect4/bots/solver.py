@@ -0,0 +1,455 @@
+"""
+file name: solver.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+description:
+Holds the solver agent. Finds the exact game theoretic value of a
+position with a negamax search on bitboards:
+1. null window searches that narrow down the score
+2. a transposition table of upper bounds
+3. only moves that do not hand the opponent a win are searched
+4. moves that make the most threats are searched first
+5. an opening book for the first plies, read from a memory mapped file
+
+A score is from the side of the player to move. It is positive when
+that player wins: the sooner the win, the bigger the score. 0 is a draw.
+
+The book is generated offline from the Connect4 folder with
+"python -m bots.solver --plies 4 --seconds 10". Every position of the
+deepest ply gets that many seconds to be solved and the shallower plies
+are backed up from it. In Python early positions often take longer than
+that, those are left out and so is every position above them, so the
+book may only hold part of a ply. Positions in the book are also looked
+up inside the search.
+"""
+import argparse
+import math
+import os
+import struct
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from board import BitBoard
+from board.encoding import position_key, canonical_key
+from bots.minimax import MiniMaxBot, SearchTimeout, SearchCancelled
+from bots.stats import Instrumented, SearchStats
+from bots.transposition import TranspositionTable
+
+WIDTH = BitBoard.COLUMN_COUNT
+HEIGHT = BitBoard.ROW_COUNT
+H1 = BitBoard.COLUMN_HEIGHT
+SIZE = WIDTH * HEIGHT
+
+BOTTOM = sum(1 << (col * H1) for col in range(WIDTH))          #lowest bit of every column
+BOARD_MASK = BOTTOM * ((1 << HEIGHT) - 1)                       #every playable bit
+COLUMN_MASKS = [((1 << HEIGHT) - 1) << (col * H1) for col in range(WIDTH)]
+COLUMN_ORDER = sorted(range(WIDTH), key = lambda col: abs(col - WIDTH // 2))    #center columns first
+
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening.book')
+
+"""
+function name: winning_positions
+precondition: stones of a player, mask of every stone
+postcondition: returns the empty cells that would give the player four in a row
+
+description:
+Checks the vertical line and both sides of every horizontal and diagonal line
+"""
+def winning_positions(position, mask):
+    r = (position << 1) & (position << 2) & (position << 3)
+    for shift in (H1, H1 - 1, H1 + 1):
+        p = (position << shift) & (position << (2 * shift))
+        r |= p & (position << (3 * shift))
+        r |= p & (position >> shift)
+        p = (position >> shift) & (position >> (2 * shift))
+        r |= p & (position << shift)
+        r |= p & (position >> (3 * shift))
+    return r & (BOARD_MASK ^ mask)
+
+"""
+function name: table_key
+precondition: position key
+postcondition: returns the key used in the transposition table
+
+description:
+The low bits of a position key only hold the first column, multiplying
+by an odd constant spreads them over every bucket and keeps keys unique
+"""
+def table_key(key):
+    return (key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+
+"""
+function name: from_board
+precondition: any board with the Board functions
+postcondition: returns (stones of the player to move, mask, amount of moves)
+
+description:
+Reads a board into the integers the solver works on
+"""
+def from_board(board):
+    if not isinstance(board, BitBoard):
+        board = BitBoard.from_board(board)
+    return board.bitboards[board.CURR_PLAYER], board.mask, board.num_slots_filled
+
+class Solver:
+
+    """
+    function name: __init__
+    precondition: size of the transposition table, opening book
+    postcondition: none
+
+    description:
+    The table is kept between solves, positions repeat a lot within a game
+    """
+    def __init__(self, tt_size = 1 << 20, book = None):
+        self.tt = TranspositionTable(tt_size)
+        self.book = book
+        self.nodes = 0
+        self.deadline = None
+        self.cancelled = False      #set from another thread, the search stops at its next check
+
+    """
+    function name: solve
+    precondition: stones of the player to move, mask, amount of moves
+    postcondition: returns the exact score
+
+    description:
+    Looks in the book first, otherwise narrows down the score with null
+    window searches, trying 0 (draw) early since it splits wins from losses
+    """
+    def solve(self, position, mask, moves):
+        possible = (mask + BOTTOM) & BOARD_MASK
+        if winning_positions(position, mask) & possible:
+            return (SIZE + 1 - moves) // 2
+        if self.book is not None:
+            score = self.book.get(position_key(position, mask), moves)
+            if score is not None:
+                return score
+
+        low = -((SIZE - moves) // 2)
+        high = (SIZE + 1 - moves) // 2
+        while low < high:
+            med = low + (high - low) // 2
+            if med <= 0 and int(low / 2) < med:
+                med = int(low / 2)
+            elif med >= 0 and int(high / 2) > med:
+                med = int(high / 2)
+            r = self.negamax(position, mask, moves, med, med + 1)
+            if r <= med:
+                high = r
+            else:
+                low = r
+        return low
+
+    """
+    function name: negamax
+    precondition: a position where the player to move can not win at once, alpha < beta
+    postcondition: returns the score if it is inside (alpha, beta), else a bound
+
+    description:
+    Searches only the moves that do not let the opponent win next
+    """
+    def negamax(self, position, mask, moves, alpha, beta):
+        self.nodes += 1
+        if self.nodes & 1023 == 0:
+            if self.cancelled:
+                raise SearchCancelled()
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+
+        possible = (mask + BOTTOM) & BOARD_MASK
+        opponent_wins = winning_positions(position ^ mask, mask)
+        forced = possible & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return -((SIZE - moves) // 2)       #two threats, the opponent wins next move
+            possible = forced                       #the one threat has to be blocked
+        candidates = possible & ~(opponent_wins >> 1)
+        if not candidates:
+            return -((SIZE - moves) // 2)
+
+        if moves >= SIZE - 2:
+            return 0
+
+        if self.book is not None and moves <= self.book.plies:
+            score = self.book.get(position_key(position, mask), moves)
+            if score is not None:
+                return score
+
+        low = -((SIZE - 2 - moves) // 2)
+        if alpha < low:
+            alpha = low
+            if alpha >= beta:
+                return alpha
+        high = (SIZE - 1 - moves) // 2
+        key = table_key(position_key(position, mask))
+        entry = self.tt.probe(key)
+        if entry is not None:
+            high = entry[2]
+        if beta > high:
+            beta = high
+            if alpha >= beta:
+                return beta
+
+        # the moves that leave the most winning cells go first
+        ordered = []
+        for col in COLUMN_ORDER:
+            move = candidates & COLUMN_MASKS[col]
+            if move:
+                threats = bin(winning_positions(position | move, mask | move)).count('1')
+                ordered.append((-threats, len(ordered), move))
+        ordered.sort()
+
+        for threats, i, move in ordered:
+            score = -self.negamax(position ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.tt.store(key, 0, alpha, TranspositionTable.UPPERBOUND, None)
+        return alpha
+
+class OpeningBook:
+    MAGIC = b'C4BK'
+    HEADER = struct.Struct('<4sBBBxI')      #magic, plies, rows, columns, padding, amount of entries
+
+    """
+    function name: __init__
+    precondition: path of a book file
+    postcondition: the keys and scores are memory mapped
+
+    description:
+    The file is a header, the sorted canonical keys as uint64 and then
+    one int8 score per key. Nothing is read until a lookup needs it.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            magic, self.plies, rows, columns, count = self.HEADER.unpack(f.read(self.HEADER.size))
+        if magic != self.MAGIC or rows != HEIGHT or columns != WIDTH:
+            raise ValueError("%s is not an opening book for a %dx%d board" % (path, HEIGHT, WIDTH))
+        self.count = count
+        self.keys = np.memmap(path, dtype='<u8', mode='r', offset=self.HEADER.size, shape=(count,)) if count else np.zeros(0, dtype='<u8')
+        self.scores = np.memmap(path, dtype='i1', mode='r', offset=self.HEADER.size + 8 * count, shape=(count,)) if count else np.zeros(0, dtype='i1')
+
+    """
+    function name: get
+    precondition: position key, amount of moves
+    postcondition: returns the score, or None if the position is not in the book
+
+    description:
+    Binary search of the canonical key in the mapped keys
+    """
+    def get(self, key, moves):
+        if moves > self.plies or not self.count:
+            return None
+        key = np.uint64(canonical_key(key))
+        i = int(np.searchsorted(self.keys, key))
+        if i < self.count and self.keys[i] == key:
+            return int(self.scores[i])
+        return None
+
+    """
+    function name: write
+    precondition: path, deepest ply, {canonical key: score}
+    postcondition: the book file is written
+
+    description:
+    Writes the header, the sorted keys and their scores
+    """
+    @classmethod
+    def write(cls, path, plies, entries):
+        keys = np.array(sorted(entries), dtype='<u8')
+        scores = np.array([entries[int(k)] for k in keys], dtype='i1')
+        with open(path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, plies, HEIGHT, WIDTH, len(keys)))
+            f.write(keys.tobytes())
+            f.write(scores.tobytes())
+
+class SolverBot(Instrumented):
+
+    """
+    function name: __init__
+    precondition: piece, seconds per move, path of the opening book
+    postcondition: none
+
+    description:
+    The book is used if the file exists. When a move can not be solved
+    in time, or the board is not the 7x6 connect 4 board the solver is
+    made for, the bot plays the minimax move instead.
+    """
+    def __init__(self, piece, timeout = 2, book_path = BOOK_PATH):
+        self.piece = piece
+        self.timeout = timeout
+        self.book = OpeningBook(book_path) if book_path is not None and os.path.exists(book_path) else None
+        self.solver = Solver(book = self.book)
+        self.fallback = MiniMaxBot(piece)
+        self.score = None           #score of the last move, None if it was not solved
+        self.depth = 0              #empty cells the last move was solved to the end of, 0 if it was not
+
+    def get_move(self, board):
+        self.solver.nodes = 0
+        if board.size() != (HEIGHT, WIDTH, 4):
+            self.score = None
+            self.depth = 0
+            return self.fallback.get_move(board)
+        position, mask, moves = from_board(board)
+        possible = (mask + BOTTOM) & BOARD_MASK
+        wins = winning_positions(position, mask) & possible
+        if wins:
+            self.score = (SIZE + 1 - moves) // 2
+            self.depth = 1
+            return ((wins & -wins).bit_length() - 1) // H1
+
+        self.solver.deadline = None if self.timeout is None else time.perf_counter() + self.timeout
+        best, best_score = None, -math.inf
+        try:
+            for col in COLUMN_ORDER:
+                move = possible & COLUMN_MASKS[col]
+                if move:
+                    # the child is solved from the opponent's side
+                    score = -self.solver.solve(position ^ mask, mask | move, moves + 1)
+                    if score > best_score:
+                        best, best_score = col, score
+        except SearchCancelled:
+            raise
+        except SearchTimeout:
+            self.score = None
+            self.depth = 0
+            return self.fallback.get_move(board)
+        finally:
+            self.solver.deadline = None
+        self.score = best_score
+        self.depth = SIZE - moves
+        return best
+
+    """
+    function name: cancel
+    precondition: none
+    postcondition: the move being searched raises SearchCancelled soon, so does every later one
+
+    description:
+    Can be called from another thread, stops the minimax fallback too
+    """
+    def cancel(self):
+        self.solver.cancelled = True
+        self.fallback.cancel()
+
+    def stats_snapshot(self):
+        return self.solver.tt.hits, self.solver.tt.misses
+
+    def search_stats(self, before):
+        hits = self.solver.tt.hits - before[0]
+        return SearchStats(
+            type(self).__name__,
+            nodes = self.solver.nodes,
+            tt_hits = hits,
+            tt_probes = hits + self.solver.tt.misses - before[1],
+            depth = self.depth,
+        )
+
+"""
+function name: positions_at
+precondition: amount of plies
+postcondition: returns {canonical key: (stones of the player to move, mask)}
+
+description:
+Every position that can be reached in exactly that many moves
+without someone having won already
+"""
+def positions_at(plies):
+    level = {canonical_key(position_key(0, 0)): (0, 0)}
+    for ply in range(plies):
+        next_level = {}
+        for position, mask in level.values():
+            possible = (mask + BOTTOM) & BOARD_MASK
+            wins = winning_positions(position, mask)
+            for col in range(WIDTH):
+                move = possible & COLUMN_MASKS[col]
+                if move and not move & wins:
+                    child = (position ^ mask, mask | move)
+                    next_level.setdefault(canonical_key(position_key(*child)), child)
+        level = next_level
+    return level
+
+"""
+function name: solve_position
+precondition: (stones of the player to move, mask, amount of moves, seconds or None)
+postcondition: returns the score, or None if it was not solved in time
+
+description:
+Runs in a worker process of the book generator
+"""
+def solve_position(args):
+    position, mask, moves, seconds = args
+    solver = Solver()
+    solver.deadline = None if seconds is None else time.perf_counter() + seconds
+    try:
+        return solver.solve(position, mask, moves)
+    except SearchTimeout:
+        return None
+
+"""
+function name: generate_book
+precondition: deepest ply, worker processes, seconds per position or None
+postcondition: returns {canonical key: score} for the solved positions up to plies
+
+description:
+Solves the deepest ply, then every shallower position gets the best
+score of its moves from the ply below, without searching again. A
+position with a move that was not solved is left out.
+"""
+def generate_book(plies, workers = 1, seconds = None):
+    level = positions_at(plies)
+    items = list(level.items())
+    print("solving %d positions at ply %d" % (len(items), plies))
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        scores = executor.map(solve_position, [(p, m, plies, seconds) for key, (p, m) in items], chunksize = 1)
+        entries = {}
+        for i, ((key, value), score) in enumerate(zip(items, scores)):
+            if score is not None:
+                entries[key] = score
+            if (i + 1) % 100 == 0:
+                print("  %d / %d, %d solved" % (i + 1, len(items), len(entries)))
+
+    below = entries
+    for ply in range(plies - 1, -1, -1):
+        scores = {}
+        for key, (position, mask) in positions_at(ply).items():
+            possible = (mask + BOTTOM) & BOARD_MASK
+            if winning_positions(position, mask) & possible:
+                scores[key] = (SIZE + 1 - ply) // 2
+                continue
+            best = -SIZE
+            for col in range(WIDTH):
+                move = possible & COLUMN_MASKS[col]
+                if move:
+                    child = below.get(canonical_key(position_key(position ^ mask, mask | move)))
+                    if child is None:
+                        break
+                    best = max(best, -child)
+            else:
+                scores[key] = best
+        entries.update(scores)
+        below = scores
+        print("backed up %d positions at ply %d" % (len(scores), ply))
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Generates the opening book of the solver bot')
+    parser.add_argument('--plies', help = 'deepest ply in the book (default 4)', type = int, default = 4)
+    parser.add_argument('--seconds', help = 'seconds to solve one position, 0 for no limit (default 10)', type = float, default = 10)
+    parser.add_argument('--output', help = 'book file to write', type = str, default = BOOK_PATH)
+    parser.add_argument('--workers', help = 'processes that solve positions (default all cores)', type = int, default = os.cpu_count())
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entries = generate_book(args.plies, args.workers, args.seconds or None)
+    OpeningBook.write(args.output, args.plies, entries)
+    print("wrote %d positions to %s in %.0f seconds" % (len(entries), args.output, time.perf_counter() - start))
+
+if __name__ == '__main__':
+    main()
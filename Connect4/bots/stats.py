@@ -0,0 +1,203 @@
+"""
+file name: stats.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+description:
+Instrumentation shared by every bot. A bot that inherits Instrumented
+can be asked for a SearchStats after every move: nodes visited, cutoffs,
+transposition table hits, depth reached, playouts, branching factor and
+the time spent in each phase. The stats go to bot.last_stats and to any
+sinks given, for example a CSV file or a logger.
+
+Nothing is measured until enable_stats is called. It puts a measuring
+get_move on the instance in front of the normal one, so a bot without
+stats runs exactly the same code as before.
+
+profile_move runs a single get_move under cProfile.
+"""
+import cProfile
+import csv
+import io
+import json
+import logging
+import pstats
+import time
+
+class SearchStats:
+    FIELDS = ('bot', 'move', 'time', 'nodes', 'cutoffs', 'tt_hits', 'tt_probes', 'depth', 'playouts', 'branching_factor', 'pondered')
+
+    """
+    function name: __init__
+    precondition: bot name and any of the counters
+    postcondition: none
+
+    description:
+    Counters a bot does not have stay 0. phases maps a phase name to seconds,
+    pondered is the work done on the opponent's time that the move could use.
+    """
+    def __init__(self, bot, move = None, time = 0.0, nodes = 0, cutoffs = 0, tt_hits = 0, tt_probes = 0,
+                 depth = 0, playouts = 0, branching_factor = 0.0, phases = None, pondered = 0):
+        self.bot = bot
+        self.move = move
+        self.time = time
+        self.nodes = nodes
+        self.cutoffs = cutoffs
+        self.tt_hits = tt_hits
+        self.tt_probes = tt_probes
+        self.depth = depth
+        self.playouts = playouts
+        self.branching_factor = branching_factor
+        self.phases = phases if phases is not None else {}
+        self.pondered = pondered
+
+    """
+    function name: as_dict
+    precondition: none
+    postcondition: returns the stats as a dictionary
+
+    description:
+    Used for the CSV and JSON output, phases stay a nested dictionary
+    """
+    def as_dict(self):
+        stats = {field: getattr(self, field) for field in self.FIELDS}
+        stats['phases'] = dict(self.phases)
+        return stats
+
+    def __repr__(self):
+        counters = ', '.join('%s=%s' % (field, round(value, 4) if isinstance(value, float) else value)
+                             for field, value in self.as_dict().items() if field == 'move' or field != 'phases' and value)
+        phases = ', '.join('%s=%.4f' % phase for phase in self.phases.items())
+        return 'SearchStats(%s%s)' % (counters, ', phases: ' + phases if phases else '')
+
+class CSVStats:
+
+    """
+    function name: __init__
+    precondition: path of the CSV file
+    postcondition: the file is opened, the header is written
+
+    description:
+    Writes one row per move, the phases are a JSON column
+    """
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.DictWriter(self.file, SearchStats.FIELDS + ('phases',))
+        self.writer.writeheader()
+
+    def write(self, stats):
+        row = stats.as_dict()
+        row['phases'] = json.dumps(row['phases'])
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class LogStats:
+
+    """
+    function name: __init__
+    precondition: optional logger and level
+    postcondition: none
+
+    description:
+    Logs one line per move, to the "connect4.stats" logger by default
+    """
+    def __init__(self, logger = None, level = logging.INFO):
+        self.logger = logger if logger is not None else logging.getLogger('connect4.stats')
+        self.level = level
+
+    def write(self, stats):
+        self.logger.log(self.level, '%r', stats)
+
+class Instrumented:
+    collect_stats = False       # set on the instance by enable_stats
+    last_stats = None           # SearchStats of the last move, None while stats are off
+    stats_sinks = ()
+
+    """
+    function name: enable_stats
+    precondition: sinks with a write(stats) function
+    postcondition: every move makes a SearchStats
+
+    description:
+    The instance attribute get_move hides the class function, so only a
+    bot with stats on goes through measured_get_move
+    """
+    def enable_stats(self, *sinks):
+        self.collect_stats = True
+        self.stats_sinks = sinks
+        self.get_move = self.measured_get_move
+
+    """
+    function name: disable_stats
+    precondition: none
+    postcondition: get_move is the normal function again
+    """
+    def disable_stats(self):
+        self.__dict__.pop('collect_stats', None)
+        self.__dict__.pop('stats_sinks', None)
+        self.__dict__.pop('get_move', None)
+
+    """
+    function name: measured_get_move
+    precondition: board
+    postcondition: returns the move, last_stats is set and sent to the sinks
+
+    description:
+    Times the normal get_move and asks the bot for its counters
+    """
+    def measured_get_move(self, board):
+        before = self.stats_snapshot()
+        start = time.perf_counter()
+        col = type(self).get_move(self, board)
+        duration = time.perf_counter() - start
+        stats = self.search_stats(before)
+        stats.move = col
+        stats.time = duration
+        self.last_stats = stats
+        for sink in self.stats_sinks:
+            sink.write(stats)
+        return col
+
+    """
+    function name: stats_snapshot
+    precondition: none
+    postcondition: returns counters that keep growing between moves
+
+    description:
+    Taken before the move, search_stats subtracts it from the counters after
+    """
+    def stats_snapshot(self):
+        return None
+
+    """
+    function name: search_stats
+    precondition: snapshot from before the move
+    postcondition: returns the SearchStats of the move
+
+    description:
+    Bots override this with their own counters
+    """
+    def search_stats(self, before):
+        return SearchStats(type(self).__name__)
+
+"""
+function name: profile_move
+precondition: bot, board, optional file for the raw profile
+postcondition: returns (move, report of the slowest functions)
+
+description:
+Runs one get_move under cProfile and sorts the report by cumulative time
+"""
+def profile_move(bot, board, path = None, sort = 'cumulative', limit = 25):
+    profile = cProfile.Profile()
+    col = profile.runcall(bot.get_move, board)
+    if path is not None:
+        profile.dump_stats(path)
+    report = io.StringIO()
+    pstats.Stats(profile, stream = report).sort_stats(sort).print_stats(limit)
+    return col, report.getvalue()
@@ -0,0 +1,97 @@
+"""
+file name: transposition.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+description:
+Support class for the minimax agent. Remembers the result of positions
+that were already searched, keyed by the zobrist key of the board.
+"""
+class TranspositionTable:
+    EXACT = 0           #the score is the minimax value of the position
+    LOWERBOUND = 1      #the search failed high, the value is at least the score
+    UPPERBOUND = 2      #the search failed low, the value is at most the score
+
+    """
+    function name: __init__
+    precondition: amount of buckets
+    postcondition: an empty table is made
+
+    description:
+    Every bucket has two slots. The first one keeps the entry that was
+    searched the deepest, the second one always takes the newest entry.
+    The size is rounded up to a power of two so the bucket is key & mask.
+    """
+    def __init__(self, size = 1 << 18):
+        self.size = 1 << max(size - 1, 1).bit_length()
+        self.mask = self.size - 1
+        self.clear()
+
+    """
+    function name: clear
+    precondition: none
+    postcondition: every entry and counter is reset
+
+    description:
+    Empties the table, for example when a new game starts
+    """
+    def clear(self):
+        self.deep = [None] * self.size
+        self.recent = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    """
+    function name: probe
+    precondition: zobrist key
+    postcondition: returns (key, depth, score, flag, move) or None
+
+    description:
+    Looks for the position in both slots of its bucket
+    """
+    def probe(self, key):
+        i = key & self.mask
+        entry = self.deep[i]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        entry = self.recent[i]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    """
+    function name: store
+    precondition: zobrist key, depth searched, score, bound type and best move
+    postcondition: the entry is saved
+
+    description:
+    The depth-preferred slot is only replaced by the same position or by
+    a search at least as deep, anything else goes in the always-replace slot
+    """
+    def store(self, key, depth, score, flag, move):
+        i = key & self.mask
+        entry = (key, depth, score, flag, move)
+        deep = self.deep[i]
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            self.deep[i] = entry
+        else:
+            self.recent[i] = entry
+
+    """
+    function name: hit_rate
+    precondition: none
+    postcondition: returns the fraction of probes that found an entry
+
+    description:
+    Helps compare table sizes and replacement settings
+    """
+    def hit_rate(self):
+        probes = self.hits + self.misses
+        if probes == 0:
+            return 0
+        return self.hits / probes
@@ -0,0 +1,2 @@
+# pytest loads this file first, which puts the Connect4 folder on the path so
+# the tests import board and bots the same way game.py does
@@ -9,15 +9,17 @@ description:
 Functions the connect4 game. Proveides the following functions:
 1. next_turn
 2. check_win
-3. connect4
+3. play_game
+4. think
+5. connect4
 """
 import numpy as np
 import os
-import pygame
 import sys
 import math
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from board import *
 from bots import *
 
@@ -26,13 +28,13 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
 board = None
 gb = None
+thinker = None                                                      #thread the bots search on while the UI runs
+thinker_events = None                                               #(search done, animation tick) event types
 
 # dev statement to turn of the UI when having a bot vs bot match
 # turning UI off in this case helps improve the performance of the bots.
 graphics = True
 
-PLAYER_COLOUR = [GBoard.RED, GBoard.YELLOW]                         #colors for player pieces
-
 game_over = False                                                   #keeps the game running til win state
 turn = random.randint(Board.PLAYER1_PIECE, Board.PLAYER2_PIECE)     #deciding whose turn it is
 
@@ -70,19 +72,141 @@ will end.
 def check_win(piece):
 	if board.winning_move(piece):
 		if graphics:
-			gb.write_on_board("PLAYER " + str(piece) + " WINS!", PLAYER_COLOUR[piece - 1], 350, 50, 70, True)
+			gb.write_on_board("PLAYER " + str(piece) + " WINS!", (gb.RED, gb.YELLOW)[piece - 1], gb.width // 2, 50, 70, True)
 			gb.update_gboard()
 		print("\nPLAYER " + str(piece) + " WINS!")
 		return True
 	
 	if board.check_draw():
 		if graphics:
-			gb.write_on_board("IT'S A TIE!", gb.LIGHTBLUE, 350, 50, 70, True)
+			gb.write_on_board("IT'S A TIE!", gb.LIGHTBLUE, gb.width // 2, 50, 70, True)
 			gb.update_gboard()
 		print("\n IT'S A TIE!")
 		return True
 	return False
 
+"""
+function name: play_game
+precondition: two players, optional board, callbacks
+postcondition: returns the result of the game
+
+description:
+Plays one game to the end without any printing or UI, so it can be
+called again and again in the same process. The player whose piece is
+CURR_PLAYER of the board moves first, a random one when no board is
+given. on_move(board, piece, col) is called after every move, and
+get_move(player, board) asks a player for its column, player.get_move
+by default. A human is asked again for a full column, any other
+player that gives a column that can not be played raises ValueError.
+Returns a dictionary with the first player, the winning piece (None for a draw),
+the columns played and the seconds each player spent on every move.
+"""
+def play_game(p1, p2, board=None, on_move=None, get_move=None):
+	if board is None:
+		board = Board(random.randint(Board.PLAYER1_PIECE, Board.PLAYER2_PIECE))
+	players = [None, p1, p2]
+	times = [None, [], []]
+	moves = []
+	first_player = board.CURR_PLAYER
+	piece = first_player
+	winner = None
+
+	while True:
+		elapsed = 0
+		while True:                             #asks a human again until the column is valid
+			start = time.perf_counter()
+			if get_move is None:
+				col = players[piece].get_move(board)
+			else:
+				col = get_move(players[piece], board)
+			elapsed += time.perf_counter() - start
+			if isinstance(col, (int, np.integer)) and 0 <= col < board.COLUMN_COUNT and board.is_valid_location(col):
+				break
+			if not isinstance(players[piece], Human):
+				raise ValueError("player %d played %r, which is not a valid column" % (piece, col))
+		times[piece].append(elapsed)
+
+		board.drop_piece(col, piece)
+		moves.append(col)
+		if on_move is not None:
+			on_move(board, piece, col)
+
+		if board.winning_move(piece):
+			winner = piece
+			break
+		if board.check_draw():
+			break
+		piece = board.get_opp_player(piece)
+
+	return {
+		'first_player': first_player,
+		'winner': winner,
+		'moves': moves,
+		'times': {Board.PLAYER1_PIECE: times[1], Board.PLAYER2_PIECE: times[2]},
+	}
+
+"""
+function name: think
+precondition: bot, board, the UI is on
+postcondition: returns the column of the bot
+
+description:
+Searches on the thinker thread while the window keeps handling its
+events, so it does not freeze, and shows the bot is thinking above the
+board. Closing the window cancels the search before the program exits.
+A human moves on this thread, it needs the window events itself.
+"""
+def think(player, board):
+	global thinker, thinker_events
+	if isinstance(player, Human):
+		return player.get_move(board)
+
+	import pygame
+	from board.events import EventLoop
+	if thinker is None:
+		thinker = ThreadPoolExecutor(max_workers=1)
+		thinker_events = (pygame.event.custom_type(), pygame.event.custom_type())
+
+	top = (0, 0, gb.width, gb.SQUARESIZE)
+	colour = (gb.RED, gb.YELLOW)[board.CURR_PLAYER - 1]
+	frame = 0
+
+	def draw():                                                 #the dots count up while the bot thinks
+		gb.draw_rect(gb.BLACK, top)
+		gb.write_on_board("THINKING" + "." * frame, colour, 50, 25, 40)
+		gb.update_gboard([top])
+
+	loop = EventLoop(draw)
+	done, tick = thinker_events
+
+	def animate(event):
+		nonlocal frame
+		frame = (frame + 1) % 4
+		loop.redraw()
+
+	def finish(event):
+		loop.stop()
+
+	def close(event):                                           #the search is stopped before the thread is joined at exit
+		if hasattr(player, 'cancel'):
+			player.cancel()
+		sys.exit()
+
+	loop.on(tick, animate)
+	loop.on(done, finish)
+	loop.on(pygame.QUIT, close)
+	future = thinker.submit(player.get_move, board)
+	future.add_done_callback(lambda future: pygame.event.post(pygame.event.Event(done)))
+	pygame.time.set_timer(tick, 250)
+	try:
+		loop.run()
+	finally:
+		pygame.time.set_timer(tick, 0)
+
+	gb.draw_rect(gb.BLACK, top)
+	gb.update_gboard([top])
+	return future.result()
+
 """
 function name: connect4
 precondition: function is called
@@ -90,64 +214,61 @@ postcondition: the connect 4 game will begin
 
 description: 
 The board ui will be shown and the game will commence.
-Manages moves, time taken, and game state.
+Manages moves, time taken, and game state. A bot that can ponder
+searches while its opponent chooses a move, by default only when the
+opponent is a human: a bot opponent would share the CPU with it.
+rows, columns and connect set the size of the board and the length of
+a winning line, the normal 7x6 connect 4 when they are not given.
 """
-def connect4(p1, p2, ui=True):
+def connect4(p1, p2, ui=True, ponder=None, rows=None, columns=None, connect=None):
 	global game_over, board, gb, graphics
 
 	graphics=ui
 
-	board = Board(turn)
+	board = Board(turn, rows, columns, connect)
 	board.print_board()
 
 	if graphics:
+		from board.graphics import GBoard   #pygame is only loaded when the UI is on
 		gb = GBoard(board)
+		gb.invalidate()                     #the menus drew over the window
 		gb.draw_gboard(board)
 		gb.update_gboard()
 
-	time_p1 = time_p2 = 0
-	moves_count_p1 = moves_count_p2 = 0
-
-	while not game_over:
-		# Player1's Input
-		start = time.perf_counter()
-		if turn == board.PLAYER1_PIECE and not game_over:
-			col = p1.get_move(board)
-
-			if board.is_valid_location(col):
-				board.drop_piece(col, board.PLAYER1_PIECE)
-				moves_count_p1 += 1
-				next_turn()
-				game_over = check_win(board.PLAYER1_PIECE)
-		end = time.perf_counter()
-
-		time_p1 += (end - start)
-
-		# Player2's Input
-		start = time.perf_counter()
-		if turn == board.PLAYER2_PIECE and not game_over:
-			col = p2.get_move(board)
-
-			if board.is_valid_location(col):
-				board.drop_piece(col, board.PLAYER2_PIECE)
-				moves_count_p2 += 1
-				next_turn()
-				game_over = check_win(board.PLAYER2_PIECE)
-		end = time.perf_counter()
-
-		time_p2 += (end - start)
-
-		if game_over:
-			pygame.time.wait(1000)
-
-			print("\nPlayer 1")
-			print("TIME: " + "{:.2f}".format(round(time_p1, 2)) + " seconds")
-			print("MOVES: "+ str(moves_count_p1))
-			print("\nPlayer 2")
-			print("TIME: " + "{:.2f}".format(round(time_p2, 2)) + " seconds")
-			print("MOVES: "+ str(moves_count_p2))
-
-			sys.exit()
+	players = [None, p1, p2]
+
+	def show_move(board, piece, col):
+		next_turn()
+		over = check_win(piece)
+
+		player = players[piece]
+		opponent = players[board.get_opp_player(piece)]
+		if getattr(player, 'pondered', 0):
+			print("Player " + str(piece) + " reused " + str(player.pondered) + (" pondered playouts" if isinstance(player, MonteCarloBot) else " pondered nodes"))
+		if hasattr(opponent, 'stop_pondering'):         #the opponent pondered on this move
+			opponent.stop_pondering()
+		if not over and hasattr(player, 'start_pondering') and (ponder or ponder is None and isinstance(opponent, Human)):
+			player.start_pondering(board)
+
+	result = play_game(p1, p2, board, show_move, think if graphics else None)
+	game_over = True
+
+	time_p1 = sum(result['times'][board.PLAYER1_PIECE])
+	time_p2 = sum(result['times'][board.PLAYER2_PIECE])
+	moves_count_p1 = len(result['times'][board.PLAYER1_PIECE])
+	moves_count_p2 = len(result['times'][board.PLAYER2_PIECE])
+
+	if graphics:
+		time.sleep(1)                       #leaves the last move on the screen for a moment
+
+	print("\nPlayer 1")
+	print("TIME: " + "{:.2f}".format(round(time_p1, 2)) + " seconds")
+	print("MOVES: "+ str(moves_count_p1))
+	print("\nPlayer 2")
+	print("TIME: " + "{:.2f}".format(round(time_p2, 2)) + " seconds")
+	print("MOVES: "+ str(moves_count_p2))
+
+	sys.exit()
 
 if __name__ == "__main__":
 	print()
@@ -18,8 +18,8 @@ import sys
 import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
-import pygame
 from bots import *
+from bots.stats import CSVStats
 from board import *
 from connect4 import connect4
 
@@ -31,7 +31,8 @@ bot_map = {
     'human': Human,
     'random': RandomBot,
     'minimax': MiniMaxBot,
-    'montecarlo': MonteCarloBot
+    'montecarlo': MonteCarloBot,
+    'solver': SolverBot
 }
 
 """
@@ -41,10 +42,69 @@ name_map = {
     'human': 'Human',
     'random': 'Random Bot',
     'minimax': 'MiniMax Bot',
-    'montecarlo': 'Monte Carlo Tree Search Bot'
+    'montecarlo': 'Monte Carlo Tree Search Bot',
+    'solver': 'Perfect Play Solver Bot'
 }
 
-board = Board(1)                                                                                                                        #initialize a board
+pygame = None           #pygame, GBoard and EventLoop are loaded by load_ui, a game without the UI never imports them
+GBoard = None
+EventLoop = None
+
+"""
+Function Name: load_ui
+Precondition: None
+Poscondition: pygame, GBoard and EventLoop are imported
+
+Description:
+Called by the UI screens, so only the UI pays for starting pygame.
+"""
+def load_ui():
+    global pygame, GBoard, EventLoop
+    import pygame
+    from board.graphics import GBoard
+    from board.events import EventLoop
+
+"""
+Function Name: menu_loop
+Precondition: graphic board, title, title colour, prompt, list of buttons
+Poscondition: Returns the event loop of the menu, not started yet
+
+Description:
+Every menu screen is a title, a prompt and buttons. The menu is only
+drawn again when the mouse moves onto or off a button, clicking a
+button calls its callback with its arguments if it has any.
+"""
+def menu_loop(graphics_board, title, title_colour, prompt, button_list):
+    def draw():
+        graphics_board.screen.fill(graphics_board.BLACK)
+        graphics_board.write_on_board(title, title_colour, 350, 100, 60, True)                 #Writes title on UI
+        graphics_board.write_on_board(prompt, graphics_board.YELLOW, 350, 175, 30, True)       #writes prompt on UI
+        for button in button_list:                                                              #draws buttons onto UI
+            graphics_board.draw_button(button, graphics_board.screen)
+        pygame.display.update()
+
+    loop = EventLoop(draw)
+
+    def click(event):                                                   #checks where user clicks
+        if event.button == 1:                                           #if the user clicked on button
+            for button in button_list:
+                if button['button position'].collidepoint(event.pos):   #have the system move to option
+                    if button['args'] != None:
+                        button['callback'](button['args'])
+                    else:
+                        button['callback']()
+                    loop.redraw()                                       #the screen was left, draw the menu again if it comes back
+
+    def hover(event):                                                   #follows the mouse motion
+        for button in button_list:
+            colour = graphics_board.RED if button['button position'].collidepoint(event.pos) else graphics_board.WHITE
+            if button['color'] != colour:                               #only a change of colour needs a new frame
+                button['color'] = colour
+                loop.redraw()
+
+    loop.on(pygame.MOUSEBUTTONDOWN, click)
+    loop.on(pygame.MOUSEMOTION, hover)
+    return loop
 
 """
 Function Name: str2bool
@@ -65,6 +125,20 @@ def str2bool(v):
         raise argparse.ArgumentTypeError('Boolean value expected.')
 
 
+"""
+Function Name: bot_options
+Precondition: bot name and parsed arguments
+Poscondition: Returns the keyword arguments for the bot
+
+Description:
+Passes the command line settings to the bots that take them.
+"""
+def bot_options(name, args):
+    if name in ('minimax', 'montecarlo'):
+        return {'workers': args.workers}
+    return {}
+
+
 #main function
 def main(first_player = None, second_player = None):
     parser = argparse.ArgumentParser()                                                                                                  #Parser to take in pre-processor arguments
@@ -72,8 +146,19 @@ def main(first_player = None, second_player = None):
     parser.add_argument('--p2', help='Player 2 type (default Human)', type=str)                                                         #Argument to have P2 be a human
     parser.add_argument('--ui', help='turn UI off in case of a bot vs bot match', type=str2bool, nargs='?', const=True, default=True)   #Arugment to not show the UI
     parser.add_argument('--bots', help='Lists the Bots available to play with', type=str2bool, nargs='?', const=True, default=False)    #Arugment to show bots
+    parser.add_argument('--workers', help='Processes the minimax and monte carlo bots search with (default 1)', type=int, default=1)                  #Argument to search in parallel
+    parser.add_argument('--stats', help='CSV file to write the search stats of every move to', type=str, default=None)                                 #Argument to record search stats
+    parser.add_argument('--rows', help='Rows of the board (default 6)', type=int, default=None)                                                        #Arguments for other board sizes
+    parser.add_argument('--columns', help='Columns of the board (default 7)', type=int, default=None)
+    parser.add_argument('--connect', help='Pieces in a row needed to win (default 4)', type=int, default=None)
+    parser.add_argument('--ponder', help='Let bots search on the opponent\'s time (default only against a human)', type=str2bool, nargs='?', const=True, default=None)  #Argument to ponder
     args = parser.parse_args()
 
+    try:
+        Board(Board.PLAYER1_PIECE, args.rows, args.columns, args.connect)                                                              #Checks the board size
+    except ValueError as error:
+        parser.error(str(error))
+
     if args.p1 is None and args.p2 is None and args.ui and first_player is None:                                                        #If no arguments provided, go to the UI main screen
         main_screen()
 
@@ -83,6 +168,7 @@ def main(first_player = None, second_player = None):
         print('Random Int Bot (random)')
         print('MiniMax Bot (minimax)')
         print('Monte Carlo Tree Search Bot (montecarlo)')
+        print('Perfect Play Solver Bot (solver)')
         print()
         print('Use the string in the brackets to pass as argument to p1 and p2')
         exit(1)
@@ -103,7 +189,7 @@ def main(first_player = None, second_player = None):
     else:                                                           #If not the case
         for bot in bot_map:                                         #As long as bot is valid
             if bot == args.p1:                                      #If bot is player 1
-                p1 = bot_map[args.p1](Board.PLAYER1_PIECE)          #Set bot as player 1
+                p1 = bot_map[args.p1](Board.PLAYER1_PIECE, **bot_options(args.p1, args))  #Set bot as player 1
         if p1 is None:                                              #If there is no player 1 still
             print("oops! you have entered a wrong bot name for p1") #Print this and exit program
             exit(1)                                                 
@@ -115,7 +201,7 @@ def main(first_player = None, second_player = None):
     else:                                                           #If not the case
         for bot in bot_map:                                         #As long as bot is valid
             if bot == args.p2:                                      #If bot is player 2
-                p2 = bot_map[args.p2](Board.PLAYER2_PIECE)          #Set bot as player 2
+                p2 = bot_map[args.p2](Board.PLAYER2_PIECE, **bot_options(args.p2, args))  #Set bot as player 2
         if p2 is None:                                              #If there is no player 2 still
             print("oops! you have entered a wrong bot name for p2") #Print this and exit program
             exit(1)
@@ -127,7 +213,12 @@ def main(first_player = None, second_player = None):
         print("Can not play game as Human without UI!")
         exit(1)
 
-    connect4(p1, p2, args.ui)                                       #Begin the connect 4 game with ui
+    if args.stats is not None:                                      #Records the stats of every move of both players
+        sink = CSVStats(args.stats)
+        p1.enable_stats(sink)
+        p2.enable_stats(sink)
+
+    connect4(p1, p2, args.ui, args.ponder, args.rows, args.columns, args.connect)  #Begin the connect 4 game with ui
 
 
 """
@@ -139,10 +230,10 @@ Description:
 This function provides the main menu UI state.
 """
 def main_screen():
+    load_ui()
     pygame.init()                                                   #initialize all imported pygame modules
     pygame.display.set_caption("Connect Four")                      #sets the ui name as connect four
-    # board = Board(1)
-    graphics_board = GBoard(board)                                  #initialize the graphic board
+    graphics_board = GBoard(Board(1))                               #initialize the graphic board
 
     """
     Function name: human_vs_human
@@ -162,31 +253,8 @@ def main_screen():
 
     button_list = [player_vs_player_button, player_vs_bot_button, bot_vs_bot_button, quit_button]                           #list to hold buttons
 
-    while True:         #keep this state open until user clicks a button
-        graphics_board.write_on_board("CONNECT 4", graphics_board.BLUE , 350 , 100, 60, True)                               #Writes title on UI
-        graphics_board.write_on_board("CHOOSE ONE OF THE OPTIONS TO PLAY", graphics_board.YELLOW , 350 , 175, 30, True)     #writes prompt on UI
-
-        for event in pygame.event.get():                                        #getting user clicks
-            if event.type == pygame.QUIT:                                       #if user quit, exit program
-                sys.exit()
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:                          #checks where user clicks
-                if event.button == 1:                                           #if the user clicked on button
-                    for button in button_list:
-                        if button['button position'].collidepoint(event.pos):   #have the system move to option
-                            button['callback']()
-            
-            elif event.type == pygame.MOUSEMOTION:                              #follows the mouse motion
-                for button in button_list:
-                    if button['button position'].collidepoint(event.pos):
-                        button['color'] = graphics_board.RED
-                    else:
-                        button['color'] = graphics_board.WHITE
-
-        for button in button_list:                                              #draws buttons onto UI
-            graphics_board.draw_button(button, graphics_board.screen)
-
-        pygame.display.update()
+    #keep this state open until user clicks a button
+    menu_loop(graphics_board, "CONNECT 4", graphics_board.BLUE, "CHOOSE ONE OF THE OPTIONS TO PLAY", button_list).run()
 
 """
 Function Name: bot_vs_human_screen
@@ -197,8 +265,9 @@ Description:
 This function provides the main menu UI state.
 """
 def bot_vs_human_screen():
+    load_ui()
     pygame.init()                           #initialize all imported pygame modules
-    graphics_board = GBoard(board)          #initialize the graphic board
+    graphics_board = GBoard(Board(1))       #initialize the graphic board
 
     """
     Function name: human_vs_minimax
@@ -223,39 +292,28 @@ def bot_vs_human_screen():
     def human_vs_montecarlo():
         main("human", "montecarlo")
 
+    """
+    Function name: human_vs_solver
+    Precondition: User clicks human vs solver button
+    Postcondition: Moves to human to solver board state
+
+    Description: In the case the user clicks the human vs solver button
+    This function is called and moves the UI state to the connect 4 state.
+    """
+    def human_vs_solver():
+        main("human", "solver")
+
     minimax_button = graphics_board.create_button(60, 220, 400, 40, '1. MINIMAX BOT', human_vs_minimax)                     #button for human_vs_minimax
     montecarlo_button = graphics_board.create_button(60, 280, 400, 40, '2. MONTECARLO SEARCH BOT', human_vs_montecarlo)     #button for human_vs_montecarlo
+    solver_button = graphics_board.create_button(60, 340, 400, 40, '3. PERFECT PLAY SOLVER BOT', human_vs_solver)           #button for human_vs_solver
     
     back_button = graphics_board.create_button(60, 600, 100, 40, 'BACK', main_screen)                                       #button for back 
     quit_button = graphics_board.create_button(180, 600, 100, 40, 'QUIT', sys.exit)                                         #button for quit
 
-    button_list = [minimax_button, montecarlo_button, back_button, quit_button]                                             #list to hold buttons
-
-    while True:         #keep state open
-        graphics_board.write_on_board("CONNECT 4 GAME", graphics_board.RED , 350 , 100, 60, True)                           #Writes title on UI
-        graphics_board.write_on_board("CHOOSE THE BOT TO PLAY AGAINST", graphics_board.YELLOW , 350 , 175, 30, True)        #writes prompt on UI
-
-        for event in pygame.event.get():                                         #getting user clicks
-            if event.type == pygame.QUIT:                                        #if user quit, exit program
-                sys.exit()
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:                           #checks where user clicks
-                if event.button == 1:                                            #if the user clicked on button
-                    for button in button_list:
-                        if button['button position'].collidepoint(event.pos):    #have the system move to option
-                            button['callback']()
-            
-            elif event.type == pygame.MOUSEMOTION:                               #follows the mouse motion
-                for button in button_list:
-                    if button['button position'].collidepoint(event.pos):
-                        button['color'] = graphics_board.RED
-                    else:
-                        button['color'] = graphics_board.WHITE
+    button_list = [minimax_button, montecarlo_button, solver_button, back_button, quit_button]                              #list to hold buttons
 
-        for button in button_list:
-            graphics_board.draw_button(button, graphics_board.screen)            #draws buttons onto UI
-
-        pygame.display.update()
+    #keep state open
+    menu_loop(graphics_board, "CONNECT 4 GAME", graphics_board.RED, "CHOOSE THE BOT TO PLAY AGAINST", button_list).run()
 
 
 """
@@ -267,9 +325,9 @@ Description:
 This function is the bot vs bot screen
 """
 def bot_vs_bot_screen():
+    load_ui()
     pygame.init()                                       #initialize all imported pygame modules
-    # board = Board(1)
-    graphics_board = GBoard(board)                      #initialize the graphic board
+    graphics_board = GBoard(Board(1))                   #initialize the graphic board
 
     first_bot = second_bot = None                       #set bots to none
 
@@ -294,40 +352,15 @@ def bot_vs_bot_screen():
 
     minimax_button = graphics_board.create_button(60, 220, 400, 40, '1. MINIMAX BOT',  bots_to_play_against, ("minimax"))                   #buttton for minimax
     montecarlo_button = graphics_board.create_button(60, 280, 400, 40, '2. MONTECARLO SEARCH BOT', bots_to_play_against, ("montecarlo"))    #button for montecarlo
+    solver_button = graphics_board.create_button(60, 340, 400, 40, '3. PERFECT PLAY SOLVER BOT', bots_to_play_against, ("solver"))          #button for solver
     
     back_button = graphics_board.create_button(60, 600, 100, 40, 'BACK', main_screen)                                                       #button for back
     quit_button = graphics_board.create_button(180, 600, 100, 40, 'QUIT', sys.exit)                                                         #button for quit
 
-    button_list = [minimax_button, montecarlo_button, back_button, quit_button]                                                             #list to hold button
-
-    while True:     #keep state open
-        graphics_board.write_on_board("CONNECT 4 GAME", graphics_board.RED , 350 , 100, 60, True)                                           #Writes title on UI
-        graphics_board.write_on_board("CHOOSE ANY TWO BOT(S) TO PLAY", graphics_board.YELLOW , 350 , 175, 30, True)                         #writes prompt on UI
-
-        for event in pygame.event.get():                                        #getting user clicks
-            if event.type == pygame.QUIT:                                       #if user quit, exit program
-                sys.exit()
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:                          #checks where user clicks
-                if event.button == 1:                                           #if the user clicked on button
-                    for button in button_list:
-                        if button['button position'].collidepoint(event.pos):   #have the system move to option
-                            if(button['args'] != None):
-                                button['callback'](button['args'])
-                            else:
-                                button['callback']()
-            
-            elif event.type == pygame.MOUSEMOTION:                              #follows the mouse motion
-                for button in button_list:
-                    if button['button position'].collidepoint(event.pos):
-                        button['color'] = graphics_board.RED
-                    else:
-                        button['color'] = graphics_board.WHITE                
-        
-        for button in button_list:
-            graphics_board.draw_button(button, graphics_board.screen)           #draws buttons onto UI
+    button_list = [minimax_button, montecarlo_button, solver_button, back_button, quit_button]                                              #list to hold button
 
-        pygame.display.update()
+    #keep state open
+    menu_loop(graphics_board, "CONNECT 4 GAME", graphics_board.RED, "CHOOSE ANY TWO BOT(S) TO PLAY", button_list).run()
 
 if __name__ == '__main__':
     main()
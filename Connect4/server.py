@@ -0,0 +1,488 @@
+"""
+File Name: server.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+A local analysis server. Clients send JSON lines over stdio, TCP or a
+unix socket, every line is one request that may hold many positions:
+
+{"id": 1, "positions": ["4453", "...(42 char grid)..."], "engine": "minimax", "depth": 6, "deadline": 2}
+
+A position is a move string (the columns 1 to 7, player 1 moves first
+unless "player" is given) or a grid of 42 characters, the top row first,
+with '.' or '0' for an empty slot and '1' / '2' for the pieces. An
+object {"moves": ..., "grid": ..., "player": ...} works as well.
+
+The answer has the same id and one result per position: the best move
+(a column from 1 to 7), the score, the principal variation as a move
+string and the search counters. Columns in the answers are numbered like
+the move strings. The engine is "minimax" (default), "montecarlo" or
+"solver".
+
+Positions are analysed on a pool of worker processes that keep their
+bots (and transposition tables) between requests. A request with a
+deadline in seconds gets an error for every position not done in time.
+The depth is at most the number of slots on the board and the
+iterations at most a million.
+Results are cached, so a repeated position is answered at once, and a
+position that is already being analysed is not sent to the pool again.
+{"id": 2, "stats": true} answers the queue depth, cache hits and the
+latency percentiles.
+
+Run from the Connect4 folder:
+python server.py                   (stdio)
+python server.py --port 8765       (TCP)
+python server.py --unix /tmp/c4    (unix socket)
+"""
+import argparse
+import asyncio
+import collections
+import json
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from board import Board
+from bots import MiniMaxBot, MonteCarloBot, SolverBot
+
+ENGINES = ('minimax', 'montecarlo', 'solver')
+OPTIONS = ('depth', 'iterations')        #request fields that change the result besides the position
+LIMITS = {'depth': Board.ROW_COUNT * Board.COLUMN_COUNT, 'iterations': 1000000}     #largest value of every option
+SOLVER_SECONDS = 10         #time the solver gets when the request has no deadline
+
+"""
+Function Name: parse_position
+Precondition: position from a request
+Postcondition: Returns a board, raises ValueError for a bad position
+
+Description:
+Reads a move string or a grid. A position where the game is already
+over can not be analysed.
+"""
+def parse_position(position):
+    moves = grid = player = None
+    if isinstance(position, dict):
+        moves, grid, player = position.get('moves'), position.get('grid'), position.get('player')
+    elif isinstance(position, str) and len(position) == Board.ROW_COUNT * Board.COLUMN_COUNT and set(position) <= set('.012'):
+        grid = position             #a move string that long is a full board, which can not be analysed anyway
+    elif isinstance(position, str):
+        moves = position
+    if player not in (None, Board.PLAYER1_PIECE, Board.PLAYER2_PIECE):
+        raise ValueError("player must be 1 or 2")
+
+    if grid is not None:
+        board = grid_board(grid, player)
+    elif moves is not None:
+        board = Board(player or Board.PLAYER1_PIECE)
+        for move in str(moves):
+            if move not in '1234567'[:Board.COLUMN_COUNT]:
+                raise ValueError("bad column '%s' in the move string" % move)
+            if board.PREV_PLAYER is not None and board.winning_move(board.PREV_PLAYER):
+                raise ValueError("the game was over before the end of the move string")
+            if not board.is_valid_location(int(move) - 1):
+                raise ValueError("column %s is full" % move)
+            board.drop_piece(int(move) - 1, board.CURR_PLAYER)
+    else:
+        raise ValueError("a position is a move string, a grid or an object with moves or grid")
+
+    if board.winning_move(board.PREV_PLAYER) or board.check_draw():
+        raise ValueError("the game is over in this position")
+    return board
+
+"""
+Function Name: grid_board
+Precondition: 42 character grid, optional player to move
+Postcondition: Returns a board, raises ValueError for a bad grid
+
+Description:
+The player with fewer pieces moves, with as many pieces each it is the
+given player or player 1
+"""
+def grid_board(grid, player):
+    grid = grid.replace('.', '0')
+    if len(grid) != Board.ROW_COUNT * Board.COLUMN_COUNT or not set(grid) <= set('012'):
+        raise ValueError("a grid has %d characters of '.', '0', '1' or '2'" % (Board.ROW_COUNT * Board.COLUMN_COUNT))
+    rows = [grid[i * Board.COLUMN_COUNT:(i + 1) * Board.COLUMN_COUNT] for i in range(Board.ROW_COUNT)][::-1]
+    counts = [grid.count('1'), grid.count('2')]
+    if counts[0] == counts[1]:
+        current = player or Board.PLAYER1_PIECE
+    elif counts[0] == counts[1] + 1:
+        current = Board.PLAYER2_PIECE
+    elif counts[1] == counts[0] + 1:
+        current = Board.PLAYER1_PIECE
+    else:
+        raise ValueError("the players have %d and %d pieces" % tuple(counts))
+
+    board = Board(current)
+    for col in range(Board.COLUMN_COUNT):
+        for row in range(Board.ROW_COUNT):
+            piece = int(rows[row][col])
+            if piece == Board.EMPTY:
+                if any(rows[r][col] != '0' for r in range(row, Board.ROW_COUNT)):
+                    raise ValueError("column %d has a piece above an empty slot" % (col + 1))
+                break
+            board.drop_piece(col, piece)
+    board.CURR_PLAYER = current
+    board.PREV_PLAYER = board.get_opp_player(current)
+    return board
+
+"""
+Function Name: parse_request
+Precondition: request object
+Postcondition: Returns (positions, engine, options, deadline), raises ValueError for a bad request
+
+Description:
+Checks the fields before anything is sent to the pool. A single
+"position" is read as a list of one.
+"""
+def parse_request(request):
+    positions = request.get('positions')
+    if positions is None:
+        positions = [request.get('position')]
+    if not isinstance(positions, list):
+        raise ValueError("positions is a list of positions")
+    engine = request.get('engine', 'minimax')
+    if engine not in ENGINES:
+        raise ValueError("engine must be one of %s" % ', '.join(ENGINES))
+    options = {key: request[key] for key in OPTIONS if key in request}
+    for key, value in options.items():
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError("%s must be a positive integer" % key)
+        if value > LIMITS[key]:
+            raise ValueError("%s can be at most %d" % (key, LIMITS[key]))
+    deadline = request.get('deadline')
+    if deadline is not None and (isinstance(deadline, bool) or not isinstance(deadline, (int, float)) or not 0 < deadline < float('inf')):
+        raise ValueError("deadline must be a positive number of seconds")
+    return positions, engine, options, deadline
+
+# bots of every worker process, kept between requests so their tables stay warm
+worker_bots = {}
+
+"""
+Function Name: warm_up
+Precondition: runs in a worker process
+Postcondition: Returns the process id
+
+Description:
+Builds the minimax bots ahead of the first request
+"""
+def warm_up():
+    for piece in (Board.PLAYER1_PIECE, Board.PLAYER2_PIECE):
+        worker_bot('minimax', piece)
+    return os.getpid()
+
+"""
+Function Name: worker_bot
+Precondition: engine, piece
+Postcondition: Returns the bot of this worker for the engine and piece
+"""
+def worker_bot(engine, piece):
+    bot = worker_bots.get((engine, piece))
+    if bot is None:
+        bot = worker_bots[(engine, piece)] = {'minimax': MiniMaxBot, 'montecarlo': MonteCarloBot, 'solver': SolverBot}[engine](piece)
+    return bot
+
+"""
+Function Name: analyze
+Precondition: board, engine, options, seconds the engine may use
+Postcondition: Returns the result of the position
+
+Description:
+Runs in a worker process. The principal variation of minimax comes
+from the best moves in its table, of monte carlo from the most visited
+children and of the solver from solving move after move.
+"""
+def analyze(board, engine, options, timeout):
+    start = time.perf_counter()
+    piece = board.CURR_PLAYER
+    bot = worker_bot(engine, piece)
+    result = {'engine': engine}
+
+    if engine == 'minimax':
+        # a search deeper than the empty slots finds nothing more
+        bot.depth = min(options.get('depth', 5), Board.ROW_COUNT * Board.COLUMN_COUNT - board.num_slots_filled)
+        bot.timeout = timeout
+        col = bot.get_move(board)
+        entry = bot.tt.probe(bot.tt_key(board))
+        pv = []
+        line = board.copy_board()
+        while entry is not None and entry[4] is not None and len(pv) < bot.depth_reached:
+            pv.append(entry[4])
+            line.drop_piece(entry[4], line.CURR_PLAYER)
+            if line.winning_move(line.PREV_PLAYER):
+                break
+            entry = bot.tt.probe(bot.tt_key(line))
+        score = bot.tt.probe(bot.tt_key(board))
+        result.update(score = score[2] if score is not None else None, depth = bot.depth_reached, nodes = bot.nodes)
+    elif engine == 'montecarlo':
+        iterations = options.get('iterations', bot.max_iterations)
+        rootnode, col = bot.montecarlo_tree_search(board, iterations, None, timeout if timeout is not None else bot.timeout)
+        pv = []
+        node = rootnode
+        while node.children:
+            node = max(node.children, key = lambda child: child.visits)
+            pv.append(node.move)
+        best = next(child for child in rootnode.children if child.move == col)
+        result.update(score = best.wins / best.visits, playouts = bot.playouts)
+    else:
+        bot.timeout = timeout if timeout is not None else SOLVER_SECONDS
+        deadline = time.perf_counter() + bot.timeout
+        col = bot.get_move(board)
+        result.update(score = bot.score, nodes = bot.solver.nodes)
+        pv = [col]
+        line = board.copy_board()
+        while bot.score is not None and len(pv) < 8:
+            line.drop_piece(pv[-1], line.CURR_PLAYER)
+            if line.winning_move(line.PREV_PLAYER) or line.check_draw():
+                break
+            bot.timeout = deadline - time.perf_counter()
+            if bot.timeout <= 0:
+                break
+            other = worker_bot('solver', line.CURR_PLAYER)
+            other.timeout = bot.timeout
+            pv.append(other.get_move(line))
+            if other.score is None:
+                pv.pop()
+                break
+
+    result['move'] = col + 1
+    result['pv'] = ''.join(str(move + 1) for move in pv)
+    result['time'] = time.perf_counter() - start
+    return result
+
+class AnalysisServer:
+
+    """
+    Function Name: __init__
+    Precondition: worker processes, cache size
+    Postcondition: the pool is started
+
+    Description:
+    Every worker gets a warm up job, so the processes and bots exist
+    before the first request
+    """
+    def __init__(self, workers, cache_size):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers = workers)
+        for _ in range(workers):
+            self.executor.submit(warm_up)
+        self.cache = collections.OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.pending = 0                    #positions sent to the pool and not done yet
+        self.completed = 0
+        self.latencies = collections.deque(maxlen = 10000)   #seconds from receiving a position to its result
+        self.running = {}                   #tasks of the positions being analysed right now
+
+    """
+    Function Name: handle_line
+    Precondition: one request line
+    Postcondition: Returns the answer line
+
+    Description:
+    Every position of the request is analysed at the same time
+    """
+    async def handle_line(self, line):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request is a JSON object")
+        except ValueError as e:
+            return json.dumps({'error': str(e)})
+
+        answer = {'id': request.get('id')}
+        if request.get('stats'):
+            answer['stats'] = self.stats()
+            return json.dumps(answer)
+
+        try:
+            positions, engine, options, deadline = parse_request(request)
+        except ValueError as e:
+            answer['error'] = str(e)
+            return json.dumps(answer)
+
+        answer['results'] = await asyncio.gather(*[self.analyze(position, engine, options, deadline) for position in positions])
+        return json.dumps(answer)
+
+    """
+    Function Name: analyze
+    Precondition: position, engine, options, deadline in seconds
+    Postcondition: Returns the result or an error for one position
+
+    Description:
+    The engine gets most of the deadline, the rest is left for the
+    queue and the answer. A cached result is returned without the pool.
+    """
+    async def analyze(self, position, engine, options, deadline):
+        start = time.perf_counter()
+        try:
+            board = parse_position(position)
+        except ValueError as e:
+            return {'position': position, 'error': str(e)}
+
+        key = (engine, tuple(sorted(options.items())), board.CURR_PLAYER, board.get_board().tobytes())
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+            result = dict(self.cache[key], position = position, cached = True)
+            self.latencies.append(time.perf_counter() - start)
+            return result
+
+        # a position that is already being analysed with the same deadline is waited on, not sent again
+        running_key = key + (deadline,)
+        task = self.running.get(running_key)
+        cached = task is not None
+        if task is None:
+            task = self.running[running_key] = asyncio.ensure_future(self.compute(key, board, engine, options, deadline))
+            task.add_done_callback(lambda task: self.running.pop(running_key, None))
+        else:
+            self.cache_hits += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), deadline)
+        except asyncio.TimeoutError:
+            return {'position': position, 'error': 'deadline exceeded'}
+        except Exception as e:
+            return {'position': position, 'error': '%s: %s' % (type(e).__name__, e)}
+        self.latencies.append(time.perf_counter() - start)
+        return dict(result, position = position, cached = cached)
+
+    """
+    Function Name: compute
+    Precondition: cache key, board, engine, options, deadline in seconds
+    Postcondition: Returns the result from a worker
+
+    Description:
+    Keeps running after a deadline passed, the worker is busy until then
+    anyway and counts as pending
+    """
+    async def compute(self, key, board, engine, options, deadline):
+        loop = asyncio.get_running_loop()
+        timeout = None if deadline is None else deadline * 0.8
+        self.pending += 1
+        try:
+            result = await loop.run_in_executor(self.executor, analyze, board, engine, options, timeout)
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        if deadline is None:                #a result cut short by a deadline is not worth keeping
+            self.cache[key] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last = False)
+        return result
+
+    """
+    Function Name: stats
+    Precondition: none
+    Postcondition: Returns the queue, cache and latency numbers
+
+    Description:
+    Positions beyond the amount of workers wait in the queue
+    """
+    def stats(self):
+        latencies = np.array(self.latencies) * 1000
+        percentiles = {'p%d' % p: float(np.percentile(latencies, p)) if len(latencies) else 0.0 for p in (50, 90, 99)}
+        percentiles['max'] = float(latencies.max()) if len(latencies) else 0.0
+        return {
+            'workers': self.workers,
+            'in_flight': min(self.pending, self.workers),
+            'queue_depth': max(self.pending - self.workers, 0),
+            'completed': self.completed,
+            'cache_hits': self.cache_hits,
+            'cache_size': len(self.cache),
+            'latency_ms': percentiles,
+        }
+
+    """
+    Function Name: serve_stream
+    Precondition: stream reader and writer of a connection
+    Postcondition: answers every line until the client closes
+
+    Description:
+    Every line is handled in its own task, so the answers come back in
+    the order they finish, not the order they were sent
+    """
+    async def serve_stream(self, reader, writer):
+        tasks = set()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(self.answer(line, writer))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+        writer.close()
+
+    async def answer(self, line, writer):
+        writer.write((await self.handle_line(line) + '\n').encode())
+        await writer.drain()
+
+    """
+    Function Name: serve_stdio
+    Precondition: none
+    Postcondition: answers every line of stdin on stdout until stdin ends
+
+    Description:
+    stdin is read on a thread, the answers are written by the event loop
+    """
+    async def serve_stdio(self):
+        loop = asyncio.get_running_loop()
+        tasks = set()
+
+        async def answer(line):
+            sys.stdout.write(await self.handle_line(line) + '\n')
+            sys.stdout.flush()
+
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(answer(line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def close(self):
+        self.executor.shutdown()
+
+async def serve(args):
+    server = AnalysisServer(args.workers, args.cache)
+    try:
+        if args.port is not None:
+            listener = await asyncio.start_server(server.serve_stream, args.host, args.port)
+        elif args.unix is not None:
+            listener = await asyncio.start_unix_server(server.serve_stream, args.unix)
+        else:
+            await server.serve_stdio()
+            return
+        print("analysis server listening on %s" % (args.unix or '%s:%d' % (args.host, args.port)), file=sys.stderr)
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyses positions sent as JSON lines')
+    parser.add_argument('--port', help='TCP port to listen on (default stdio)', type=int, default=None)
+    parser.add_argument('--host', help='TCP host (default 127.0.0.1)', type=str, default='127.0.0.1')
+    parser.add_argument('--unix', help='unix socket path to listen on', type=str, default=None)
+    parser.add_argument('--workers', help='worker processes (default all cores)', type=int, default=os.cpu_count())
+    parser.add_argument('--cache', help='results to keep in the cache (default 10000)', type=int, default=10000)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+File Name: test_board.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks that BitBoard behaves the same as the numpy Board on random
+games: the grid, the valid moves, the wins and the zobrist keys, and
+that both find the same wins as a plain scan on connect-N boards.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import random
+import numpy as np
+import pytest
+from board import Board, BitBoard
+
+"""
+function name: same_state
+precondition: board, bitboard
+postcondition: raises AssertionError if they do not hold the same position
+"""
+def same_state(board, bitboard):
+    assert np.array_equal(board.get_board(), bitboard.get_board())
+    assert board.get_valid_locations() == bitboard.get_valid_locations()
+    for piece in (Board.PLAYER1_PIECE, Board.PLAYER2_PIECE):
+        assert board.winning_move(piece) == bitboard.winning_move(piece)
+    assert board.zobrist_key == bitboard.zobrist_key
+    assert board.num_slots_filled == bitboard.num_slots_filled
+    assert board.check_draw() == bitboard.check_draw()
+    assert (board.CURR_PLAYER, board.PREV_PLAYER, board.PREV_MOVE) == (bitboard.CURR_PLAYER, bitboard.PREV_PLAYER, bitboard.PREV_MOVE)
+
+@pytest.mark.parametrize('size', [(), (6, 7, 4), (7, 9, 4), (6, 7, 5), (5, 5, 3)])
+def test_bitboard_matches_board(size):
+    rng = random.Random(0)
+    for _ in range(30):
+        board = Board(Board.PLAYER1_PIECE, *size)
+        bitboard = BitBoard(Board.PLAYER1_PIECE, *size)
+        same_state(board, bitboard)
+        # the games are played to a full board, past the first win, so later wins are checked too
+        while board.get_valid_locations():
+            col = rng.choice(board.get_valid_locations())
+            board.drop_piece(col, board.CURR_PLAYER)
+            bitboard.drop_piece(col, bitboard.CURR_PLAYER)
+            same_state(board, bitboard)
+        assert BitBoard.from_board(board).zobrist_key == board.zobrist_key
+
+@pytest.mark.parametrize('board_cls', [Board, BitBoard])
+def test_full_column_changes_nothing(board_cls):
+    board = board_cls(Board.PLAYER1_PIECE)
+    for _ in range(Board.ROW_COUNT):
+        board.drop_piece(2, board.CURR_PLAYER)
+    before = (board.get_board().copy(), board.zobrist_key, board.num_slots_filled, len(board.move_stack), board.CURR_PLAYER)
+    with pytest.raises(ValueError):
+        board.drop_piece(2, board.CURR_PLAYER)
+    after = (board.get_board(), board.zobrist_key, board.num_slots_filled, len(board.move_stack), board.CURR_PLAYER)
+    assert np.array_equal(before[0], after[0]) and before[1:] == after[1:]
+
+"""
+function name: snapshot
+precondition: board
+postcondition: returns everything undo_move has to put back
+"""
+def snapshot(board):
+    return (board.get_board().tobytes(), board.PREV_MOVE, board.PREV_PLAYER, board.CURR_PLAYER,
+            board.num_slots_filled, board.zobrist_key, len(board.move_stack))
+
+@pytest.mark.parametrize('board_cls', [Board, BitBoard])
+def test_undo_restores_every_field(board_cls):
+    rng = random.Random(1)
+    for _ in range(20):
+        board = board_cls(rng.choice((Board.PLAYER1_PIECE, Board.PLAYER2_PIECE)))
+        history = [snapshot(board)]
+        while board.get_valid_locations() and not board.winning_move(board.PREV_PLAYER):
+            col = rng.choice(board.get_valid_locations())
+            # a drop that is undone at once changes nothing
+            board.drop_piece(col, board.CURR_PLAYER)
+            assert board.undo_move() == col
+            assert snapshot(board) == history[-1]
+            board.drop_piece(col, board.CURR_PLAYER)
+            history.append(snapshot(board))
+        history.pop()
+        while history:
+            board.undo_move()
+            assert snapshot(board) == history.pop()
+        assert board.zobrist_key == 0
+
+"""
+function name: has_line
+precondition: grid as a 2D array, piece, connect length
+postcondition: returns True if piece has length in a row anywhere
+
+description:
+Reference check that walks every cell in the four directions
+"""
+def has_line(grid, piece, length):
+    rows, columns = grid.shape
+    for r in range(rows):
+        for c in range(columns):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                cells = [(r + i * dr, c + i * dc) for i in range(length)]
+                if all(0 <= y < rows and 0 <= x < columns and grid[y][x] == piece for y, x in cells):
+                    return True
+    return False
+
+@pytest.mark.parametrize('size', [(6, 7, 4), (5, 8, 3), (8, 6, 5), (7, 10, 6), (4, 4, 4)])
+@pytest.mark.parametrize('board_cls', [Board, BitBoard])
+def test_connect_n_wins_match_a_plain_scan(board_cls, size):
+    rng = random.Random(2)
+    for _ in range(20):
+        board = board_cls(Board.PLAYER1_PIECE, *size)
+        while board.get_valid_locations():
+            board.drop_piece(rng.choice(board.get_valid_locations()), board.CURR_PLAYER)
+            for piece in (Board.PLAYER1_PIECE, Board.PLAYER2_PIECE):
+                assert board.winning_move(piece) == has_line(board.get_board(), piece, size[2])
@@ -0,0 +1,46 @@
+"""
+File Name: test_connect4.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks play_game, the game loop the command line and the tournament use.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import random
+import pytest
+from board import Board
+from bots import RandomBot
+from connect4 import play_game
+
+class Column:
+    def __init__(self, col):
+        self.col = col
+
+    def get_move(self, board):
+        return self.col
+
+def test_full_column_raises():
+    board = Board(Board.PLAYER1_PIECE)
+    for i in range(Board.ROW_COUNT):
+        board.drop_piece(0, Board.PLAYER1_PIECE if i % 2 else Board.PLAYER2_PIECE)
+    with pytest.raises(ValueError):
+        play_game(Column(0), Column(1), board)
+
+def test_column_off_the_board_raises():
+    with pytest.raises(ValueError):
+        play_game(Column(Board.COLUMN_COUNT), Column(0), Board(Board.PLAYER1_PIECE))
+
+def test_game_is_played_to_the_end():
+    result = play_game(Column(0), Column(1), Board(Board.PLAYER1_PIECE))
+    assert result['winner'] == Board.PLAYER1_PIECE
+    assert result['moves'] == [0, 1, 0, 1, 0, 1, 0]
+
+def test_random_bots_finish_their_games():
+    random.seed(0)
+    for _ in range(50):
+        result = play_game(RandomBot(Board.PLAYER1_PIECE), RandomBot(Board.PLAYER2_PIECE))
+        assert len(result['moves']) <= Board.ROW_COUNT * Board.COLUMN_COUNT
@@ -0,0 +1,80 @@
+"""
+File Name: test_encoding.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks that position keys and game record files give back what was put
+in them.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import numpy as np
+import pytest
+from board import Board, BitBoard
+from board.encoding import encode, encode_canonical, decode, mirror_key, GameWriter, GameReader
+from benchmarks.common import random_positions
+
+POSITIONS = [p for moves in (0, 1, 7, 20, 35) for p in random_positions(Board, 10, moves, seed=moves)]
+
+"""
+function name: mirrored
+precondition: board
+postcondition: returns a new board with the columns in the other order
+"""
+def mirrored(board):
+    mirror = Board(board.CURR_PLAYER)
+    for col, row in (m[:2] for m in board.move_stack):
+        mirror.drop_piece(Board.COLUMN_COUNT - 1 - col, board.get_board()[row][col])
+    mirror.CURR_PLAYER = board.CURR_PLAYER
+    return mirror
+
+@pytest.mark.parametrize('board_cls', [Board, BitBoard])
+def test_decode_gives_the_position_back(board_cls):
+    for p in POSITIONS:
+        board = decode(encode(p), p.CURR_PLAYER, board_cls)
+        assert np.array_equal(board.get_board(), p.get_board())
+        assert board.CURR_PLAYER == p.CURR_PLAYER
+        assert encode(board) == encode(p)
+
+def test_keys_are_unique():
+    keys = {}
+    for p in POSITIONS:
+        keys.setdefault(encode(p), p.get_board().tobytes())
+        assert keys[encode(p)] == p.get_board().tobytes()
+
+def test_mirror_shares_the_canonical_key():
+    for p in POSITIONS:
+        mirror = mirrored(p)
+        assert encode(mirror) == mirror_key(encode(p))
+        assert mirror_key(mirror_key(encode(p))) == encode(p)
+        assert encode_canonical(mirror) == encode_canonical(p)
+
+def test_game_records_round_trip(tmp_path):
+    path = str(tmp_path / 'games.c4')
+    games = [([3, 3, 4, 4, 5, 5, 6], Board.PLAYER1_PIECE, Board.PLAYER1_PIECE),
+             ([], Board.PLAYER2_PIECE, None),
+             (list(range(7)) * 6, Board.PLAYER2_PIECE, None)]
+    with GameWriter(path) as writer:
+        writer.write(*games[0])
+    with GameWriter(path) as writer:          # a second writer appends to the file
+        for game in games[1:]:
+            writer.write(*game)
+
+    reader = GameReader(path)
+    assert len(reader) == len(games)
+    for record, (moves, first_player, winner) in zip(reader, games):
+        assert record.moves == moves
+        assert record.first_player == first_player
+        assert record.winner == winner
+    board = reader[0].board()
+    assert board.winning_move(Board.PLAYER1_PIECE)
+    assert [col for _, col in reader[0].positions()] == games[0][0]
+
+def test_reader_refuses_other_files(tmp_path):
+    path = tmp_path / 'other.c4'
+    path.write_bytes(b'not a game record file')
+    with pytest.raises(ValueError):
+        GameReader(str(path))
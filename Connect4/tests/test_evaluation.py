@@ -0,0 +1,72 @@
+"""
+File Name: test_evaluation.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks that IncrementalEvaluation and VectorEvaluation give the same
+score as Evaluation.score_position on random games. Every move and
+every undo is compared, on the standard board and on other sizes.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import random
+import numpy as np
+import pytest
+from board import Board
+from bots.evaluation import Evaluation, IncrementalEvaluation, VectorEvaluation
+from benchmarks.common import random_positions
+
+"""
+function name: check_game
+precondition: random generator, optional (rows, columns, connect)
+postcondition: raises AssertionError if a score is different
+
+Description:
+Plays a random game for a random piece and undoes it again, comparing
+the incremental total and the vector score with a full rescan after
+every step. Some games start from a position that reset has to read.
+"""
+def check_game(rng, size=()):
+    piece = rng.choice((Board.PLAYER1_PIECE, Board.PLAYER2_PIECE))
+    full = Evaluation(piece)
+    incremental = IncrementalEvaluation(piece)
+    vector = VectorEvaluation(piece)
+    board = Board(rng.choice((Board.PLAYER1_PIECE, Board.PLAYER2_PIECE)), *size)
+
+    for _ in range(rng.randint(0, 10)):
+        board.drop_piece(rng.choice(board.get_valid_locations()), board.CURR_PLAYER)
+    incremental.reset(board)
+    assert incremental.total == full.score_position(board)
+
+    moves = 0
+    while board.get_valid_locations():
+        col = rng.choice(board.get_valid_locations())
+        board.drop_piece(col, board.CURR_PLAYER)
+        incremental.add_piece(board.move_stack[-1][1], col, board.PREV_PLAYER)
+        assert incremental.total == full.score_position(board) == vector.score_position(board), moves
+        moves += 1
+    for _ in range(moves):
+        col, row = board.move_stack[-1][:2]
+        incremental.remove_piece(row, col, board.PREV_PLAYER)
+        board.undo_move()
+        assert incremental.total == full.score_position(board) == vector.score_position(board), moves
+
+@pytest.mark.parametrize('seed', range(20))
+def test_standard_board(seed):
+    check_game(random.Random(seed))
+
+@pytest.mark.parametrize('size', [(7, 8, 4), (6, 7, 5), (10, 10, 5)])
+def test_other_sizes(size):
+    rng = random.Random(0)
+    for _ in range(3):
+        check_game(rng, size)
+
+def test_batch_matches_single_scores():
+    positions = random_positions(Board, 50, 12)
+    vector = VectorEvaluation(Board.PLAYER1_PIECE)
+    full = Evaluation(Board.PLAYER1_PIECE)
+    scores = vector.score_batch(np.stack([p.get_board() for p in positions]), positions[0])
+    assert list(scores) == [full.score_position(p) for p in positions]
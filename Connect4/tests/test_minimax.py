@@ -0,0 +1,80 @@
+"""
+File Name: test_minimax.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks the transposition table of the minimax bot. A bot that keeps its
+table between moves has to find the same values as a new bot, and the
+parallel root search the same move and value as the serial one. With a
+timeout the bot stops in time and plays the move of its deepest
+completed search.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import time
+from board import Board
+from bots import MiniMaxBot
+from benchmarks.common import random_positions
+
+"""
+function name: root_value
+precondition: bot, board
+postcondition: returns the minimax value of the board at the depth of the bot
+"""
+def root_value(bot, board):
+    bot.get_move(board)
+    return bot.tt.probe(bot.tt_key(board))[2]
+
+def test_side_to_move_changes_the_key():
+    board = Board(Board.PLAYER1_PIECE)
+    board.drop_piece(3, Board.PLAYER1_PIECE)
+    other = board.copy_board()
+    other.CURR_PLAYER, other.PREV_PLAYER = other.PREV_PLAYER, other.CURR_PLAYER
+    bot = MiniMaxBot(Board.PLAYER1_PIECE)
+    assert board.zobrist_key == other.zobrist_key
+    assert bot.tt_key(board) != bot.tt_key(other)
+
+def test_kept_table_gives_the_same_values():
+    # the same stones come up with either player to move, the first
+    # player of the positions changes and the table is never cleared
+    positions = random_positions(Board, 6, 8, seed=1)
+    flipped = []
+    for p in positions:
+        q = p.copy_board()
+        q.CURR_PLAYER, q.PREV_PLAYER = q.PREV_PLAYER, q.CURR_PLAYER
+        flipped.append(q)
+    for piece in (Board.PLAYER1_PIECE, Board.PLAYER2_PIECE):
+        kept = MiniMaxBot(piece, depth=4)
+        for board in positions + flipped:
+            if board.CURR_PLAYER != piece:
+                continue
+            assert root_value(kept, board) == root_value(MiniMaxBot(piece, depth=4), board)
+
+
+def test_parallel_root_matches_the_serial_search():
+    parallel = {piece: MiniMaxBot(piece, depth=4, workers=2) for piece in (Board.PLAYER1_PIECE, Board.PLAYER2_PIECE)}
+    try:
+        for board in random_positions(Board, 8, 6, seed=3):
+            serial = MiniMaxBot(board.CURR_PLAYER, depth=4)
+            bot = parallel[board.CURR_PLAYER]
+            assert bot.get_move(board) == serial.get_move(board)
+            assert bot.tt.probe(bot.tt_key(board))[2] == serial.tt.probe(serial.tt_key(board))[2]
+    finally:
+        for bot in parallel.values():
+            bot.close()
+
+def test_iterative_deepening_stops_in_time():
+    for board in random_positions(Board, 3, 4, seed=5):
+        bot = MiniMaxBot(board.CURR_PLAYER, timeout=0.3)
+        start = time.perf_counter()
+        col = bot.get_move(board)
+        assert time.perf_counter() - start < 0.3 + 0.5     #the last depth stops within 256 nodes of the deadline
+        assert bot.depth_reached >= 1 and len(bot.depth_times) == bot.depth_reached
+
+        # the root entry is only stored when a depth completes, so it holds the deepest one
+        entry = bot.tt.probe(bot.tt_key(board))
+        assert entry[1] == bot.depth_reached and entry[4] == col
+        assert entry[2] == root_value(MiniMaxBot(board.CURR_PLAYER, depth=bot.depth_reached), board)
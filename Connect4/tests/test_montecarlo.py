@@ -0,0 +1,155 @@
+"""
+File Name: test_montecarlo.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks that pondering keeps the tree of the monte carlo bot under its
+limit while the playouts go on, that the nodes of the tree count
+their visits and wins right, and that the tree is only reused for the
+position it was searched from.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import time
+import random
+import pytest
+from board import Board
+from bots import MonteCarloBot
+from bots.montecarlo import Node
+from benchmarks.common import random_positions
+
+def test_ponder_stops_growing_at_the_limit():
+    random.seed(0)
+    board = Board(Board.PLAYER1_PIECE)
+    bot = MonteCarloBot(Board.PLAYER1_PIECE, max_iterations=200, ponder_limit=300)
+    board.drop_piece(bot.get_move(board), board.CURR_PLAYER)
+    before = bot.currentNode.visits
+
+    bot.start_pondering(board)
+    time.sleep(0.5)
+    bot.stop_pondering()
+    assert bot.tree_size() <= 300
+    assert bot.currentNode.visits > before + 300      # playouts went on after the tree was full
+
+def test_search_without_a_limit_adds_a_node_every_iteration():
+    random.seed(0)
+    board = Board(Board.PLAYER1_PIECE)
+    bot = MonteCarloBot(Board.PLAYER1_PIECE, max_iterations=200)
+    rootnode, col = bot.montecarlo_tree_search(board, 200, None)
+    assert bot.nodes_created == 200 and rootnode.visits == 200
+
+def test_node_bookkeeping():
+    board = Board(Board.PLAYER1_PIECE)
+    node = Node(board.PREV_PLAYER, board)
+    with pytest.raises(AttributeError):
+        node.score = 0              #__slots__, no attributes besides the listed ones
+    board.drop_piece(3, board.CURR_PLAYER)
+    child = node.expand(3, board)
+    assert (child.parent, child.move, child.piece) == (node, 3, Board.PLAYER1_PIECE)
+    assert node.children == [child] and 3 not in node.available_moves
+    assert child.available_moves == list(range(Board.COLUMN_COUNT))
+    for result in (1, 0.5, 0):
+        child.update(result)
+    assert (child.wins, child.visits) == (1.5, 3)
+
+def test_node_of_a_won_position_has_no_moves():
+    board = Board(Board.PLAYER1_PIECE)
+    for col in (0, 1, 0, 1, 0, 1, 0):
+        board.drop_piece(col, board.CURR_PLAYER)
+    assert Node(board.PREV_PLAYER, board).available_moves == []
+
+"""
+function name: check_tree
+precondition: node of a searched tree, True for the root of the search
+postcondition: raises AssertionError if a visit or win was counted wrong
+
+description:
+Every playout through a node also went through one of its children,
+except the one that started at the node when it was added. A playout
+is a win for one of the two players or half a win for both.
+"""
+def check_tree(node, root):
+    assert 0 <= node.wins <= node.visits and (2 * node.wins) % 1 == 0
+    if not node.children:
+        return
+    visits = sum(child.visits for child in node.children)
+    wins = sum(child.wins for child in node.children)
+    own = 0 if root else 1
+    assert node.visits == visits + own
+    assert node.wins + wins - visits in ((0,) if root else (0, 0.5, 1))
+    for child in node.children:
+        assert child.piece != node.piece
+        check_tree(child, False)
+
+def test_search_counts_visits_and_wins():
+    random.seed(1)
+    for board in random_positions(Board, 4, 5, seed=2):
+        bot = MonteCarloBot(board.CURR_PLAYER)
+        rootnode, col = bot.montecarlo_tree_search(board, 500, None)
+        assert rootnode.visits == bot.playouts == 500
+        check_tree(rootnode, True)
+
+def test_advance_keeps_the_subtree_of_the_move():
+    random.seed(3)
+    bot = MonteCarloBot(Board.PLAYER1_PIECE)
+    rootnode, col = bot.montecarlo_tree_search(Board(Board.PLAYER1_PIECE), 300, None)
+    child = next(c for c in rootnode.children if c.move == 2)
+    grandchildren = list(child.children)
+    assert bot.advance(rootnode, 2) is child
+    assert child.parent is None and child.children == grandchildren
+    assert rootnode.children == []              #the siblings are let go
+    assert bot.advance(Node(Board.PLAYER1_PIECE, Board(Board.PLAYER1_PIECE)), 2) is None
+
+"""
+function name: kept_child
+precondition: bot after get_move, opponent's move
+postcondition: returns (node, visits) the kept tree has for that move
+"""
+def kept_child(bot, move):
+    node = next(c for c in bot.currentNode.children if c.move == move)
+    return node, node.visits
+
+def test_reuse_tree_after_the_opponent_moves():
+    random.seed(4)
+    board = Board(Board.PLAYER1_PIECE)
+    bot = MonteCarloBot(Board.PLAYER1_PIECE, max_iterations=500)
+    board.drop_piece(bot.get_move(board), board.CURR_PLAYER)
+    reply = max(bot.currentNode.children, key=lambda c: c.visits).move
+    node, visits = kept_child(bot, reply)
+    board.drop_piece(reply, board.CURR_PLAYER)
+
+    assert bot.reuse_tree(board) is node and node.visits == visits and node.parent is None
+    assert bot.currentNode is None              #the tree is only handed out once
+
+    # get_move searches on from the kept node
+    board.drop_piece(bot.get_move(board), board.CURR_PLAYER)
+    reply = max(bot.currentNode.children, key=lambda c: c.visits).move
+    node, visits = kept_child(bot, reply)
+    board.drop_piece(reply, board.CURR_PLAYER)
+    bot.get_move(board)
+    assert bot.inherited == visits
+
+def test_reuse_tree_rejects_another_position():
+    random.seed(5)
+    board = Board(Board.PLAYER1_PIECE)
+    bot = MonteCarloBot(Board.PLAYER1_PIECE, max_iterations=300)
+    col = bot.get_move(board)
+    kept = bot.currentNode, bot.current_key
+
+    # the opponent's move is on the tree, but our move was another one
+    other = Board(Board.PLAYER1_PIECE)
+    other.drop_piece((col + 1) % Board.COLUMN_COUNT, other.CURR_PLAYER)
+    other.drop_piece(3, other.CURR_PLAYER)
+    assert bot.reuse_tree(other) is None and bot.currentNode is None
+
+    # a board without moves has nothing to match
+    bot.currentNode, bot.current_key = kept
+    assert bot.reuse_tree(Board(Board.PLAYER1_PIECE)) is None
+
+    # a new root is searched and nothing is inherited
+    bot.currentNode, bot.current_key = kept
+    bot.get_move(other)
+    assert bot.inherited == 0
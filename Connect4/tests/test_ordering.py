@@ -0,0 +1,58 @@
+"""
+File Name: test_ordering.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks the move order of the minimax bot with the table move, killers
+and history turned on: the table move first, then the killers of the
+ply, then the history and the center for the rest.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+from board import Board
+from bots.ordering import MoveOrdering
+
+MOVES = list(range(Board.COLUMN_COUNT))
+P1, P2 = Board.PLAYER1_PIECE, Board.PLAYER2_PIECE
+
+def test_center_order_without_other_heuristics():
+    ordering = MoveOrdering(history=True)
+    assert ordering.order(Board(P1), MOVES, P1, 0) == [3, 2, 4, 1, 5, 0, 6]
+
+def test_table_move_killers_and_history():
+    board = Board(P1)
+    ordering = MoveOrdering(history=True)
+    ordering.cutoff(0, P1, 2, 3)            #killers of ply 2, newest first
+    ordering.cutoff(6, P1, 2, 1)
+    ordering.cutoff(5, P1, 4, 4)            #a killer of another ply, history 16
+    ordering.cutoff(1, P2, 4, 5)            #history of the other player only
+
+    assert ordering.killer_moves[2] == [6, 0]
+    assert ordering.history_table[P1] == {0: 9, 6: 1, 5: 16}
+    # table move, killers by history, then history, then the center
+    assert ordering.order(board, MOVES, P1, 2, tt_move=2) == [2, 0, 6, 5, 3, 4, 1]
+    assert ordering.order(board, MOVES, P1, 1) == [5, 0, 6, 3, 2, 4, 1]
+    assert ordering.order(board, MOVES, P2, 3, tt_move=4) == [4, 1, 3, 2, 5, 0, 6]
+
+def test_only_the_newest_killers_are_kept():
+    ordering = MoveOrdering()
+    for col in (1, 2, 3, 2):
+        ordering.cutoff(col, P1, 0, 1)
+    assert ordering.killer_moves[0] == [3, 2]
+    assert ordering.history_table[P1] == {}         #history is off by default
+
+def test_new_search_clears_killers_and_halves_history():
+    ordering = MoveOrdering(history=True)
+    ordering.cutoff(4, P1, 0, 3)
+    ordering.new_search()
+    assert ordering.killer_moves == []
+    assert ordering.history_table[P1] == {4: 4}
+    assert ordering.order(Board(P1), [2, 3, 4], P1, 0) == [4, 3, 2]
+
+def test_heuristics_turned_off_keep_the_column_order():
+    ordering = MoveOrdering(center=False, killers=False, history=False, tt_move=False)
+    ordering.cutoff(5, P1, 0, 4)
+    assert ordering.order(Board(P1), MOVES, P1, 0, tt_move=6) == MOVES
@@ -0,0 +1,119 @@
+"""
+File Name: test_rollout.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks the random games of the monte carlo bot. A rollout has to play
+the same game as dropping the same random columns on a Board, and a
+batch of rollouts can only end in results the position allows.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import random
+import pytest
+from board import Board, BitBoard
+from bots.rollout import RolloutEngine
+
+SIZES = [(), (6, 7, 5), (5, 8, 3), (7, 9, 4)]
+
+"""
+function name: random_game
+precondition: board, seed of the engine
+postcondition: returns the winner of the random game the engine plays with that seed
+
+description:
+Draws the columns like RolloutEngine.rollout, but drops them on the board
+"""
+def random_game(board, seed):
+    rand = random.Random(seed).random
+    board = board.copy_board()
+    free = board.get_valid_locations()
+    while free:
+        col = free[int(rand() * len(free))]
+        board.drop_piece(col, board.CURR_PLAYER)
+        if not board.is_valid_location(col):
+            free.remove(col)
+        if board.winning_move(board.PREV_PLAYER):
+            return board.PREV_PLAYER
+    return RolloutEngine.DRAW
+
+"""
+function name: outcomes
+precondition: board
+postcondition: returns every result a random game from the board can have
+"""
+def outcomes(board):
+    if board.PREV_PLAYER is not None and board.winning_move(board.PREV_PLAYER):
+        return {board.PREV_PLAYER}
+    if not board.get_valid_locations():
+        return {RolloutEngine.DRAW}
+    results = set()
+    for col in board.get_valid_locations():
+        board.drop_piece(col, board.CURR_PLAYER)
+        results |= outcomes(board)
+        board.undo_move()
+    return results
+
+"""
+function name: late_position
+precondition: size, empty slots to leave, random generator
+postcondition: returns a BitBoard with no winner and that many empty slots,
+               or fewer filled slots if every move would win
+
+description:
+Only plays moves that do not win, so the rollouts from it still have
+something to decide
+"""
+def late_position(size, empty, rng):
+    board = BitBoard(Board.PLAYER1_PIECE, *size)
+    while board.ROW_COUNT * board.COLUMN_COUNT - board.num_slots_filled > empty:
+        quiet = []
+        for col in board.get_valid_locations():
+            board.drop_piece(col, board.CURR_PLAYER)
+            if not board.winning_move(board.PREV_PLAYER):
+                quiet.append(col)
+            board.undo_move()
+        if not quiet:
+            break
+        board.drop_piece(rng.choice(quiet), board.CURR_PLAYER)
+    return board
+
+@pytest.mark.parametrize('size', SIZES)
+def test_rollout_plays_the_same_game_as_the_board(size):
+    rng = random.Random(0)
+    for seed in range(40):
+        board = BitBoard(Board.PLAYER1_PIECE, *size)
+        for _ in range(rng.randrange(6)):
+            board.drop_piece(rng.choice(board.get_valid_locations()), board.CURR_PLAYER)
+        assert RolloutEngine(seed).rollout(board) == random_game(board, seed)
+
+@pytest.mark.parametrize('size', SIZES)
+def test_rollouts_end_in_a_possible_result(size):
+    rng = random.Random(1)
+    for seed in range(10):
+        board = late_position(size, 6, rng)
+        possible = outcomes(board.copy_board())
+        engine = RolloutEngine(seed)
+        assert {engine.rollout(board) for _ in range(20)} <= possible
+        winners = engine.rollout_batch(board, 50)
+        assert len(winners) == 50 and set(winners.tolist()) <= possible
+
+def test_rollout_of_a_won_position():
+    board = BitBoard(Board.PLAYER1_PIECE)
+    for col in (0, 1, 0, 1, 0, 1, 0):
+        board.drop_piece(col, board.CURR_PLAYER)
+    engine = RolloutEngine(0)
+    assert engine.rollout(board) == Board.PLAYER1_PIECE
+    assert engine.rollout_batch(board, 5).tolist() == [Board.PLAYER1_PIECE] * 5
+
+def test_rollouts_do_not_change_the_board():
+    board = Board(Board.PLAYER1_PIECE)
+    board.drop_piece(3, board.CURR_PLAYER)
+    grid, key = board.get_board().copy(), board.zobrist_key
+    engine = RolloutEngine(0)
+    engine.rollout(board)
+    engine.rollout_batch(board, 10)
+    assert (board.get_board() == grid).all() and board.zobrist_key == key
@@ -0,0 +1,87 @@
+"""
+File Name: test_selection.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks the selection policies of the monte carlo bot against the
+formulas on hand built nodes, and that a policy sent to a worker process
+leaves its table behind.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import math
+import pickle
+import pytest
+from board import Board
+from bots.montecarlo import Node
+from bots.selection import UCTPolicy, ProgressiveBiasPolicy, center_preference
+
+@pytest.mark.parametrize('columns', [5, 7, 8, 10])
+def test_center_preference_follows_the_board_width(columns):
+    values = [center_preference(move, columns) for move in range(columns)]
+    assert values == values[::-1]
+    assert max(values) == values[(columns - 1) // 2] == values[columns // 2]
+    assert values[0] == values[-1] == 0
+
+def test_progressive_bias_takes_the_width_from_the_board():
+    policy = ProgressiveBiasPolicy()
+    policy.prepare(Board(Board.PLAYER1_PIECE, 6, 10, 4))
+    assert policy.columns == 10
+
+def test_policy_pickles_without_its_table():
+    policy = ProgressiveBiasPolicy(1.0, 2.0)
+    data = pickle.dumps(policy)
+    assert len(data) < 1000
+    copy = pickle.loads(data)
+    assert (copy.exploration, copy.weight, copy.heuristic) == (1.0, 2.0, center_preference)
+    assert copy.inv_sqrt is UCTPolicy().inv_sqrt
+
+"""
+function name: hand_built_node
+precondition: (move, wins, visits) of every child
+postcondition: returns a root node with those children
+"""
+def hand_built_node(children):
+    node = Node(Board.PLAYER1_PIECE, Board(Board.PLAYER1_PIECE))
+    node.available_moves = []
+    for move, wins, visits in children:
+        child = Node(Board.PLAYER2_PIECE, Board(Board.PLAYER1_PIECE), node, move)
+        child.wins, child.visits = wins, visits
+        node.children.append(child)
+    node.visits = sum(visits for move, wins, visits in children)
+    return node
+
+CHILDREN = [(0, 6, 10), (2, 30, 60), (3, 1, 3), (5, 40, 70000)]     #the last one is past the 1/sqrt(n) table
+
+def test_uct_picks_the_largest_value():
+    node = hand_built_node(CHILDREN)
+    for c in (0.0, 0.5, math.sqrt(2), 3.0):
+        value = lambda child: child.wins / child.visits + c * math.sqrt(math.log(node.visits) / child.visits)
+        assert UCTPolicy(c).select(node) is max(node.children, key=value)
+    assert node.selection() is UCTPolicy().select(node)      #the default policy of a node
+    assert UCTPolicy(0.0).select(node).move == 0
+    assert UCTPolicy(100.0).select(node).move == 3
+
+def test_uct_ties_go_to_the_last_child():
+    node = hand_built_node([(1, 2, 4), (4, 2, 4), (6, 2, 4)])
+    assert UCTPolicy().select(node).move == 6
+
+def test_progressive_bias_adds_the_fading_heuristic():
+    node = hand_built_node(CHILDREN)
+    board = Board(Board.PLAYER1_PIECE)
+    for weight in (0.0, 0.5, 5.0):
+        policy = ProgressiveBiasPolicy(1.0, weight)
+        policy.prepare(board)
+        value = lambda child: child.wins / child.visits + math.sqrt(math.log(node.visits) / child.visits) \
+            + weight * center_preference(child.move, board.COLUMN_COUNT) / (child.visits + 1)
+        assert policy.select(node) is max(node.children, key=value)
+    # without exploration the best ratio wins, unless the bias of the barely visited center is large
+    assert ProgressiveBiasPolicy(0.0, 0.0).select(node).move == 0
+    assert ProgressiveBiasPolicy(0.0, 5.0).select(node).move == 3
+    # a heuristic of its own replaces the center preference
+    edge = lambda move, columns: 1.0 if move == 5 else 0.0
+    assert ProgressiveBiasPolicy(0.0, 1e6).select(node).move == 3
+    assert ProgressiveBiasPolicy(0.0, 1e6, edge).select(node).move == 5
@@ -0,0 +1,49 @@
+"""
+File Name: test_server.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks that the analysis server refuses malformed requests before
+anything is sent to its workers.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import pytest
+from server import parse_request, parse_position
+
+def test_good_request():
+    positions, engine, options, deadline = parse_request({'positions': ['4453'], 'engine': 'solver', 'depth': 4, 'deadline': 0.5})
+    assert positions == ['4453'] and engine == 'solver' and options == {'depth': 4} and deadline == 0.5
+
+def test_largest_options():
+    assert parse_request({'position': '44', 'depth': 42, 'iterations': 1000000})[2] == {'depth': 42, 'iterations': 1000000}
+
+def test_single_position():
+    assert parse_request({'position': '44'})[0] == ['44']
+
+@pytest.mark.parametrize('request_', [
+    {'positions': '4453'},
+    {'positions': {'moves': '44'}},
+    {'positions': ['44'], 'engine': 'alphazero'},
+    {'positions': ['44'], 'deadline': 0},
+    {'positions': ['44'], 'deadline': -1},
+    {'positions': ['44'], 'deadline': '2'},
+    {'positions': ['44'], 'deadline': True},
+    {'positions': ['44'], 'deadline': float('nan')},
+    {'positions': ['44'], 'depth': 0},
+    {'positions': ['44'], 'depth': 2.5},
+    {'positions': ['44'], 'iterations': '100'},
+    {'positions': ['44'], 'depth': 43},
+    {'positions': ['44'], 'iterations': 10 ** 9},
+])
+def test_malformed_request(request_):
+    with pytest.raises(ValueError):
+        parse_request(request_)
+
+@pytest.mark.parametrize('position', ['48', '4444444', None, 7, '1' * 42])
+def test_bad_position(position):
+    with pytest.raises(ValueError):
+        parse_position(position)
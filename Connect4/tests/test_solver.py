@@ -0,0 +1,101 @@
+"""
+File Name: test_solver.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Checks the exact scores of the solver against a plain alpha beta search
+that only uses the board functions, on positions late in random games
+where that search is still quick.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import pytest
+from board import Board, BitBoard
+from board.encoding import encode_canonical
+from bots.solver import Solver, SolverBot, OpeningBook, from_board, winning_positions, SIZE, BOTTOM, BOARD_MASK
+from benchmarks.common import random_positions
+
+"""
+function name: reference_score
+precondition: bitboard, window
+postcondition: returns the score of the player to move
+
+description:
+The score of a win is the same as in the solver: (SIZE + 1 - moves) // 2
+with moves the amount of pieces before the winning one
+"""
+def reference_score(board, alpha=-SIZE, beta=SIZE):
+    moves = board.num_slots_filled
+    valid = board.get_valid_locations()
+    for col in valid:
+        board.drop_piece(col, board.CURR_PLAYER)
+        won = board.winning_move(board.PREV_PLAYER)
+        board.undo_move()
+        if won:
+            return (SIZE + 1 - moves) // 2
+    if moves >= SIZE - 1:
+        return 0
+    for col in valid:
+        board.drop_piece(col, board.CURR_PLAYER)
+        score = -reference_score(board, -beta, -alpha)
+        board.undo_move()
+        if score >= beta:
+            return score
+        alpha = max(alpha, score)
+    return alpha
+
+"""
+function name: quiet_positions
+precondition: amount of moves
+postcondition: returns bitboards where the player to move can not win at once
+"""
+def quiet_positions(moves):
+    positions = []
+    for p in random_positions(BitBoard, 40, moves, seed=moves):
+        position, mask, _ = from_board(p)
+        if not winning_positions(position, mask) & (mask + BOTTOM) & BOARD_MASK:
+            positions.append(p)
+    return positions[:8]
+
+@pytest.mark.parametrize('moves', [34, 30, 26])
+def test_exact_scores(moves):
+    solver = Solver()           # one table for every position, like a game
+    for p in quiet_positions(moves):
+        assert solver.solve(*from_board(p)) == reference_score(p)
+
+def test_bot_move_keeps_the_score():
+    for p in quiet_positions(30):
+        board = Board(Board.PLAYER1_PIECE)
+        for col, *_ in p.move_stack:
+            board.drop_piece(col, board.CURR_PLAYER)
+        bot = SolverBot(board.CURR_PLAYER, timeout=None, book_path=None)
+        col = bot.get_move(board)
+        assert bot.score == reference_score(p)
+        board.drop_piece(col, board.CURR_PLAYER)
+        assert -Solver().solve(*from_board(board)) == bot.score
+
+def test_book_is_used_inside_the_search(tmp_path):
+    # a book of exact scores two plies below the positions, every hit has to agree
+    entries = {}
+    for p in quiet_positions(30):
+        for col in p.get_valid_locations():
+            p.drop_piece(col, p.CURR_PLAYER)
+            if not p.winning_move(p.PREV_PLAYER):
+                for reply in p.get_valid_locations():
+                    p.drop_piece(reply, p.CURR_PLAYER)
+                    if not p.winning_move(p.PREV_PLAYER):
+                        entries[encode_canonical(p)] = reference_score(p)
+                    p.undo_move()
+            p.undo_move()
+    path = str(tmp_path / 'late.book')
+    OpeningBook.write(path, 32, entries)
+
+    book = OpeningBook(path)
+    with_book = Solver(book=book)
+    without = Solver()
+    for p in quiet_positions(30):
+        assert with_book.solve(*from_board(p)) == without.solve(*from_board(p)) == reference_score(p)
+    assert with_book.nodes < without.nodes
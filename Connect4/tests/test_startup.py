@@ -0,0 +1,56 @@
+"""
+File Name: test_startup.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+A headless start must not load pygame. Plays a "--ui false" game
+between depth 1 minimax bots and starts a spawned worker, each in a
+new interpreter, and checks pygame is not in sys.modules. The timing
+of these starts is measured by benchmarks/startup_bench.py.
+
+Run with "python -m pytest" from the Connect4 folder.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GAME = """
+import sys
+from bots import MiniMaxBot
+from connect4 import connect4
+try:
+    connect4(MiniMaxBot(1, depth=1), MiniMaxBot(2, depth=1), False)
+except SystemExit:
+    pass
+print('pygame' in sys.modules)
+"""
+
+WORKER = """
+import multiprocessing, sys
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.startup_bench import worker_ready
+if __name__ == '__main__':
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        print(executor.submit(worker_ready).result() or 'pygame' in sys.modules)
+"""
+
+"""
+function name: run_python
+precondition: code to run
+postcondition: returns the last line the code printed
+"""
+def run_python(code):
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip().splitlines()[-1]
+
+def test_headless_game_does_not_load_pygame():
+    assert run_python(GAME) == 'False'
+
+def test_spawned_worker_does_not_load_pygame():
+    assert run_python(WORKER) == 'False'
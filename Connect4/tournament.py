@@ -0,0 +1,250 @@
+"""
+File Name: tournament.py
+
+Author: Paul Lee, Thomas Tran
+
+Last Modification Date: 10/18/2026
+
+Description:
+Plays many bot vs bot games without the UI to compare the bots. The
+games are spread over a pool of processes and every finished game is
+written as one JSON line. At the end the Elo rating of every bot is
+printed with a 95% confidence interval, along with the mean and 95th
+percentile time it took per move. With --records the games are also
+appended to a binary game record file (see board/encoding.py). A game
+that fails is written with its error and left out of the ratings.
+
+A bot is given by its name in game.py, optionally with keyword
+arguments, for example "minimax:depth=3" or "montecarlo:timeout=0.5".
+A league on another board is played with --rows, --columns and
+--connect, for example "--columns 9 --rows 7" or "--connect 5".
+
+Run from the Connect4 folder:
+python tournament.py --bots minimax:depth=3 minimax:depth=5 random --games 20
+"""
+import argparse
+import ast
+import json
+import math
+import os
+import random
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from board import Board
+from board.encoding import GameWriter
+from connect4 import play_game
+from game import bot_map
+
+"""
+Function Name: parse_bot
+Precondition: bot spec string
+Postcondition: Returns (bot name, keyword arguments)
+
+Description:
+Splits "name:key=value,key=value", the values are python literals
+"""
+def parse_bot(spec):
+    name, _, options = spec.partition(':')
+    if name not in bot_map:
+        raise argparse.ArgumentTypeError("unknown bot '%s', use one of %s" % (name, ', '.join(bot_map)))
+    kwargs = {}
+    for option in filter(None, options.split(',')):
+        key, _, value = option.partition('=')
+        try:
+            kwargs[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            kwargs[key] = value
+    return name, kwargs
+
+"""
+Function Name: schedule
+Precondition: bot specs, mode, games per pairing, seed
+Postcondition: Returns the list of games to play
+
+Description:
+Round robin pairs every bot with every other bot, gauntlet pairs the
+first bot with all the others. Within a pairing the bot that moves
+first alternates, so both bots start the same number of games.
+"""
+def schedule(bots, mode, games, seed):
+    if mode == 'gauntlet':
+        pairings = [(bots[0], other) for other in bots[1:]]
+    else:
+        pairings = [(a, b) for i, a in enumerate(bots) for b in bots[i + 1:]]
+
+    jobs = []
+    for p1, p2 in pairings:
+        for game in range(games):
+            jobs.append({
+                'game': len(jobs),
+                'p1': p1,
+                'p2': p2,
+                'first_player': Board.PLAYER1_PIECE if game % 2 == 0 else Board.PLAYER2_PIECE,
+                'seed': seed + len(jobs),
+            })
+    return jobs
+
+"""
+Function Name: run_game
+Precondition: one scheduled game
+Postcondition: Returns the game record
+
+Description:
+Runs in a worker process. Builds fresh bots, seeds the random
+generators so a game can be played again, and plays it headless.
+"""
+def run_game(job):
+    random.seed(job['seed'])
+    np.random.seed(job['seed'] % (1 << 32))
+    players = []
+    for piece, spec in ((Board.PLAYER1_PIECE, job['p1']), (Board.PLAYER2_PIECE, job['p2'])):
+        name, kwargs = parse_bot(spec)
+        players.append(bot_map[name](piece, **kwargs))
+    try:
+        board = Board(job['first_player'], job.get('rows'), job.get('columns'), job.get('connect'))
+        result = play_game(players[0], players[1], board)
+    finally:
+        for player in players:
+            if hasattr(player, 'close'):
+                player.close()
+
+    winner = result['winner']
+    record = dict(job)
+    record['winner'] = None if winner is None else job['p1'] if winner == Board.PLAYER1_PIECE else job['p2']
+    record['winner_piece'] = winner
+    record['moves'] = result['moves']
+    record['times_p1'] = result['times'][Board.PLAYER1_PIECE]
+    record['times_p2'] = result['times'][Board.PLAYER2_PIECE]
+    return record
+
+"""
+Function Name: elo
+Precondition: score fraction between 0 and 1
+Postcondition: Returns the Elo difference that gives that expected score
+
+Description:
+Inverse of the logistic expected score, clamped so 0% and 100% stay finite
+"""
+def elo(score):
+    score = min(max(score, 1e-3), 1 - 1e-3)
+    return -400 * math.log10(1 / score - 1)
+
+"""
+Function Name: summarize
+Precondition: game records
+Postcondition: Returns a row of stats for every bot
+
+Description:
+The rating of a bot is the Elo difference against the opponents it
+played, from its score. The interval comes from the standard error of
+the mean score over its games (wins 1, draws 0.5, losses 0).
+"""
+def summarize(bots, records):
+    rows = []
+    for bot in bots:
+        results = []
+        times = []
+        for record in records:
+            if bot not in (record['p1'], record['p2']):
+                continue
+            times += record['times_p1'] if record['p1'] == bot else record['times_p2']
+            results.append(0.5 if record['winner'] is None else 1.0 if record['winner'] == bot else 0.0)
+        if not results:
+            continue
+
+        n = len(results)
+        score = sum(results) / n
+        error = math.sqrt(sum((r - score) ** 2 for r in results) / n / n)
+        rows.append({
+            'bot': bot,
+            'games': n,
+            'wins': results.count(1.0),
+            'draws': results.count(0.5),
+            'losses': results.count(0.0),
+            'score': score,
+            'elo': elo(score),
+            'elo_low': elo(score - 1.96 * error),
+            'elo_high': elo(score + 1.96 * error),
+            'mean_ms': 1000 * float(np.mean(times)) if times else 0.0,
+            'p95_ms': 1000 * float(np.percentile(times, 95)) if times else 0.0,
+        })
+    return sorted(rows, key=lambda row: row['elo'], reverse=True)
+
+"""
+Function Name: print_table
+Precondition: rows from summarize
+Postcondition: the table is printed
+
+Description:
+One line per bot, best rating first
+"""
+def print_table(rows):
+    width = max([len(row['bot']) for row in rows] + [3])
+    print("%-*s %6s %5s %5s %5s %7s %7s %17s %10s %10s" % (width, 'bot', 'games', 'win', 'draw', 'loss', 'score', 'elo', '95% interval', 'mean ms', 'p95 ms'))
+    for row in rows:
+        print("%-*s %6d %5d %5d %5d %6.1f%% %+7.0f %+8.0f..%-+7.0f %10.1f %10.1f" % (
+            width, row['bot'], row['games'], row['wins'], row['draws'], row['losses'], 100 * row['score'],
+            row['elo'], row['elo_low'], row['elo_high'], row['mean_ms'], row['p95_ms']))
+
+def main():
+    parser = argparse.ArgumentParser(description='Plays bot vs bot games on a pool of processes')
+    parser.add_argument('--bots', help='bots to play, name or name:key=value,...', type=str, nargs='+', required=True)
+    parser.add_argument('--mode', help='round-robin (default) or gauntlet (first bot against the rest)', choices=('round-robin', 'gauntlet'), default='round-robin')
+    parser.add_argument('--games', help='games per pairing (default 10)', type=int, default=10)
+    parser.add_argument('--workers', help='processes playing games (default all cores)', type=int, default=os.cpu_count())
+    parser.add_argument('--output', help='JSON lines file with every game (default tournament.jsonl)', type=str, default='tournament.jsonl')
+    parser.add_argument('--seed', help='seed of the first game (default 0)', type=int, default=0)
+    parser.add_argument('--records', help='binary game record file to append every game to', type=str, default=None)
+    parser.add_argument('--rows', help='rows of the board (default 6)', type=int, default=None)
+    parser.add_argument('--columns', help='columns of the board (default 7)', type=int, default=None)
+    parser.add_argument('--connect', help='pieces in a row needed to win (default 4)', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        size = Board(Board.PLAYER1_PIECE, args.rows, args.columns, args.connect).size()
+    except ValueError as error:
+        parser.error(str(error))
+    if args.records is not None and size != Board(Board.PLAYER1_PIECE).size():
+        parser.error('game record files only hold games on the 7x6 connect 4 board')
+
+    for spec in args.bots:
+        parse_bot(spec)
+    if len(args.bots) < 2:
+        parser.error('at least two bots are needed')
+
+    jobs = schedule(args.bots, args.mode, args.games, args.seed)
+    for job in jobs:
+        job['rows'], job['columns'], job['connect'] = size
+    records = []
+    failed = 0
+    games = GameWriter(args.records) if args.records is not None else None
+    with open(args.output, 'w') as output, ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(run_game, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                record = future.result()
+            except Exception as error:
+                failed += 1
+                record = dict(futures[future], error='%s: %s' % (type(error).__name__, error))
+                output.write(json.dumps(record) + '\n')
+                output.flush()
+                print("game %d/%d: %s vs %s failed, %s" % (len(records) + failed, len(jobs), record['p1'], record['p2'], record['error']))
+                continue
+            records.append(record)
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+            if games is not None:
+                games.write(record['moves'], record['first_player'], record['winner_piece'])
+                games.flush()
+            print("game %d/%d: %s vs %s, winner %s" % (len(records) + failed, len(jobs), record['p1'], record['p2'], record['winner'] or 'draw'))
+
+    if games is not None:
+        games.close()
+
+    print()
+    if failed:
+        print("%d of %d games failed, see %s\n" % (failed, len(jobs), args.output))
+    print_table(summarize(args.bots, records))
+
+if __name__ == '__main__':
+    main()